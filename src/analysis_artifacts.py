@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Analysis Artifacts
+------------------
+Read-only access to the analysis output (gtc_insights.json,
+category_trends.json and gtc_sessions_categorized.json) for the report
+generators. Each file is read the first time it is needed and kept for
+the rest of the process, so building every document after a data change
+only needs the analysis to have been run, not re-run or hand-copied into
+the scripts.
+"""
+
+import os
+import json
+from functools import cached_property, lru_cache
+
+ANALYSIS_DIR = "outputs/analysis_output"
+INSIGHTS_FILE = "gtc_insights.json"
+TRENDS_FILE = "category_trends.json"
+CATEGORIZED_FILE = "gtc_sessions_categorized.json"
+
+
+class AnalysisArtifacts:
+    """The analysis output in one directory, loaded lazily."""
+
+    def __init__(self, analysis_dir=ANALYSIS_DIR):
+        self.analysis_dir = analysis_dir
+
+    def path(self, name):
+        """The path of a file (such as a chart) in the analysis output."""
+        return os.path.join(self.analysis_dir, name)
+
+    def _load(self, name, required=True):
+        path = self.path(name)
+        if not os.path.exists(path):
+            if required:
+                raise FileNotFoundError(f"{path} not found; run src/enhanced_analysis.py first")
+            return {}
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    @cached_property
+    def insights(self):
+        return self._load(INSIGHTS_FILE)
+
+    @cached_property
+    def trends(self):
+        """Per-category keywords and session counts, or {} if the trend analysis wasn't written."""
+        return self._load(TRENDS_FILE, required=False)
+
+    @cached_property
+    def categorized(self):
+        """Category -> list of {'title', 'code'} sessions."""
+        return self._load(CATEGORIZED_FILE)
+
+    @cached_property
+    def category_counts(self):
+        """Category -> session count, largest first."""
+        counts = {category: len(sessions) for category, sessions in self.categorized.items()}
+        return dict(sorted(counts.items(), key=lambda item: -item[1]))
+
+    @property
+    def session_count(self):
+        """Number of categorized sessions."""
+        return sum(self.category_counts.values())
+
+    def category_count(self, category):
+        return self.category_counts.get(category, 0)
+
+
+@lru_cache(maxsize=None)
+def load_artifacts(analysis_dir=ANALYSIS_DIR):
+    """The process-wide AnalysisArtifacts for analysis_dir."""
+    return AnalysisArtifacts(analysis_dir)
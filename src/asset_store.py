@@ -0,0 +1,224 @@
+#!/usr/bin/env python3
+"""
+Asset Store
+-----------
+A content-addressed store for generated assets such as chart and
+word-cloud PNGs. Each distinct file is kept once under
+outputs/asset_store/objects/, named by the SHA-256 of its contents, and
+package directories get a hard link, a symbolic link, a copy or a
+manifest entry pointing at the stored object instead of another byte
+copy. Stored objects are read-only, and an output that is regenerated in
+place should be release()d first so the write doesn't reach every linked
+copy.
+
+Run as a script, it deduplicates an existing output tree: every copy of
+the same image is replaced by a hard link to one stored object.
+
+    python src/asset_store.py outputs --dry-run
+"""
+
+import os
+import json
+import stat
+import shutil
+import hashlib
+import argparse
+
+from run_report import RunReport, add_report_arguments, stage
+from atomic_files import atomic_path
+
+DEFAULT_STORE_DIR = "outputs/asset_store"
+LINK_MODES = ["hardlink", "symlink", "copy", "manifest"]
+MANIFEST_FILE = "manifest.json"
+DEFAULT_EXTENSIONS = [".png"]
+READ_ONLY = stat.S_IRUSR | stat.S_IRGRP | stat.S_IROTH
+
+
+def file_digest(path):
+    """The SHA-256 hex digest of a file's contents."""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def release(path):
+    """Unlink path if it shares its contents with other links.
+
+    Call this before rewriting a file that may have been deduplicated, so
+    the new contents go to a new file instead of every linked copy (and
+    the stored object).
+    """
+    if os.path.islink(path) or (os.path.exists(path) and os.stat(path).st_nlink > 1):
+        os.remove(path)
+
+
+def _same_file(path, other):
+    try:
+        return os.path.samefile(path, other)
+    except OSError:
+        return False
+
+
+class AssetStore:
+    """Files stored once by content hash, linked into package directories."""
+
+    def __init__(self, store_dir=DEFAULT_STORE_DIR):
+        self.store_dir = store_dir
+        self.objects_dir = os.path.join(store_dir, "objects")
+        # (path, size, mtime) -> digest, so a file added repeatedly is hashed once
+        self._digests = {}
+
+    def object_path(self, digest, extension=""):
+        return os.path.join(self.objects_dir, digest[:2], digest + extension)
+
+    def digest(self, path):
+        info = os.stat(path)
+        key = (os.path.abspath(path), info.st_size, info.st_mtime_ns)
+        if key not in self._digests:
+            self._digests[key] = file_digest(path)
+        return self._digests[key]
+
+    def add(self, path):
+        """Store path's contents (unless already stored) and return the stored object's path.
+
+        The file is copied into the store rather than linked, so a later
+        rewrite of path can't change the stored object.
+        """
+        extension = os.path.splitext(path)[1].lower()
+        object_path = self.object_path(self.digest(path), extension)
+        if not os.path.exists(object_path):
+            os.makedirs(os.path.dirname(object_path), exist_ok=True)
+            with atomic_path(object_path) as partial_path:
+                shutil.copyfile(path, partial_path)
+                os.chmod(partial_path, READ_ONLY)
+        return object_path
+
+    def place(self, path, destination, mode="hardlink"):
+        """Store path and put it at destination; returns the stored object's path."""
+        object_path = self.add(path)
+        checkout(object_path, destination, mode)
+        return object_path
+
+    def dedupe(self, root, extensions=DEFAULT_EXTENSIONS, dry_run=False):
+        """Replace every file under root with a hard link to its stored object.
+
+        Returns (files replaced, bytes freed); the first copy of an image
+        not yet in the store moves into it, so it frees nothing. Files
+        already linked to their object are left alone, as are files on a
+        filesystem the store can't hard-link to.
+        """
+        store_dir = os.path.abspath(self.store_dir)
+        stored = set()
+        replaced, freed = 0, 0
+        for directory, subdirs, files in os.walk(root):
+            subdirs[:] = sorted(name for name in subdirs
+                                if os.path.abspath(os.path.join(directory, name)) != store_dir)
+            for filename in sorted(files):
+                path = os.path.join(directory, filename)
+                extension = os.path.splitext(filename)[1].lower()
+                if extension not in extensions or os.path.islink(path):
+                    continue
+                object_path = self.object_path(self.digest(path), extension)
+                if _same_file(path, object_path):
+                    continue
+                size = os.path.getsize(path)
+                was_stored = object_path in stored or os.path.exists(object_path)
+                stored.add(object_path)
+                if not dry_run:
+                    self.add(path)
+                    try:
+                        with atomic_path(path) as partial_path:
+                            os.link(object_path, partial_path)
+                    except OSError:
+                        print(f"Warning: can't link {path} to the asset store; leaving it as a copy")
+                        continue
+                replaced += 1
+                if was_stored:
+                    freed += size
+        return replaced, freed
+
+    def stored_bytes(self):
+        """Total size of the stored objects."""
+        total = 0
+        for directory, _, files in os.walk(self.objects_dir):
+            total += sum(os.path.getsize(os.path.join(directory, name)) for name in files)
+        return total
+
+
+def checkout(object_path, destination, mode="hardlink"):
+    """Put a stored object at destination as a hard link, symbolic link or copy.
+
+    Hard links fall back to copies where the filesystem can't link. In
+    "manifest" mode nothing is written here; see write_manifest().
+    """
+    if mode not in LINK_MODES:
+        raise ValueError(f"unknown link mode {mode!r} (choose from {', '.join(LINK_MODES)})")
+    if mode == "manifest":
+        return
+    if mode != "copy" and _same_file(destination, object_path) and os.path.islink(destination) == (mode == "symlink"):
+        return
+    if os.path.lexists(destination):
+        os.remove(destination)
+    if mode == "symlink":
+        os.symlink(os.path.relpath(object_path, os.path.dirname(os.path.abspath(destination))), destination)
+        return
+    if mode == "hardlink":
+        try:
+            os.link(object_path, destination)
+            return
+        except OSError:
+            pass
+    shutil.copyfile(object_path, destination)
+
+
+def write_manifest(directory, entries):
+    """Write directory/manifest.json mapping each file name to its stored object.
+
+    entries maps a file name to the stored object's path; the manifest
+    records the digest and the object's path relative to directory.
+    """
+    manifest = {
+        name: {
+            "sha256": os.path.splitext(os.path.basename(object_path))[0],
+            "path": os.path.relpath(object_path, directory)
+        }
+        for name, object_path in sorted(entries.items())
+    }
+    manifest_file = os.path.join(directory, MANIFEST_FILE)
+    with open(manifest_file, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2)
+    return manifest_file
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Deduplicate generated assets by replacing copies with hard links to a content-addressed store."
+    )
+    parser.add_argument("roots", nargs="*", default=["outputs"],
+                        help="Directories to deduplicate (default: outputs)")
+    parser.add_argument("--store", default=DEFAULT_STORE_DIR,
+                        help=f"Asset store directory (default: {DEFAULT_STORE_DIR})")
+    parser.add_argument("--extensions", default=",".join(DEFAULT_EXTENSIONS),
+                        help="Comma-separated file extensions to deduplicate (default: .png)")
+    parser.add_argument("--dry-run", action="store_true",
+                        help="Show what would be freed without changing anything")
+    add_report_arguments(parser)
+    args = parser.parse_args()
+
+    extensions = [ext.strip().lower() if ext.strip().startswith(".") else f".{ext.strip().lower()}"
+                  for ext in args.extensions.split(",") if ext.strip()]
+    with RunReport.from_args("asset_store", args):
+        store = AssetStore(args.store)
+        replaced, freed = 0, 0
+        for root in args.roots:
+            with stage("dedupe"):
+                root_replaced, root_freed = store.dedupe(root, extensions, dry_run=args.dry_run)
+            replaced += root_replaced
+            freed += root_freed
+        action = "Would replace" if args.dry_run else "Replaced"
+        print(f"{action} {replaced} files with links to {args.store}, "
+              f"freeing {freed / (1024 * 1024):.1f} MB")
+        if not args.dry_run:
+            print(f"Asset store holds {store.stored_bytes() / (1024 * 1024):.1f} MB")
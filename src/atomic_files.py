@@ -0,0 +1,29 @@
+#!/usr/bin/env python3
+"""
+Atomic Files
+------------
+Replace generated files in one step. The new contents are written to a
+temporary name next to the target and renamed over it, so a parallel
+build never reads half a file, and replacing (rather than rewriting in
+place) leaves any hard-linked copies of the old file alone.
+"""
+
+import os
+from contextlib import contextmanager
+
+
+@contextmanager
+def atomic_path(path):
+    """Yield a temporary path to write; it replaces path once the block succeeds.
+
+    If the block raises, the temporary file is removed and path is left
+    as it was.
+    """
+    partial_path = f"{path}.{os.getpid()}.partial"
+    try:
+        yield partial_path
+    except BaseException:
+        if os.path.lexists(partial_path):
+            os.remove(partial_path)
+        raise
+    os.replace(partial_path, path)
@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""
+Benchmark Cases
+---------------
+Run benchmark cases in fresh interpreters, so the peak RSS of one case
+doesn't hide the next. A benchmark script re-runs itself with --run-case
+and the case's arguments; the case prints its result with
+print_case_result(), and run_case_subprocess() parses it back.
+"""
+
+import os
+import sys
+import json
+import subprocess
+
+from run_report import peak_rss_mb
+
+RESULT_PREFIX = "RESULT "
+
+
+def case_peak_rss_mb():
+    """This process's peak RSS in MB, rounded for the results, or None where it can't be read."""
+    peak = peak_rss_mb()
+    return round(peak, 1) if peak is not None else None
+
+
+def format_mb(value, width=10):
+    """Right-align a MB figure for a results table, or '-' if it is missing."""
+    return f"{value:>{width}.1f}" if value is not None else f"{'-':>{width}}"
+
+
+def print_case_result(result):
+    """Print a case's result for run_case_subprocess() in the parent process."""
+    print(RESULT_PREFIX + json.dumps(result))
+
+
+def run_case_subprocess(script, case_args, description):
+    """Run `script --run-case *case_args` in a fresh interpreter and return its result.
+
+    description names the case in the errors raised when it fails or
+    prints no result.
+    """
+    command = [sys.executable, os.path.abspath(script), "--run-case"] + [str(arg) for arg in case_args]
+    completed = subprocess.run(command, capture_output=True, text=True)
+    if completed.returncode != 0:
+        print(completed.stderr)
+        raise RuntimeError(f"{description} failed")
+    for line in completed.stdout.splitlines():
+        if line.startswith(RESULT_PREFIX):
+            return json.loads(line[len(RESULT_PREFIX):])
+    raise RuntimeError(f"{description} produced no result")
@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+"""
+GTC Extraction Benchmark
+------------------------
+Benchmark session extraction on synthetic catalogs of increasing size.
+For each catalog size and extraction mode the render, parse, extract and
+export steps are timed and their peak RSS is sampled. Every case runs in
+a fresh process so peak memory from one case doesn't hide the next.
+"""
+
+import os
+import json
+import time
+import argparse
+import threading
+
+from run_report import peak_rss_mb
+from benchmark_cases import format_mb, print_case_result, run_case_subprocess
+
+DEFAULT_SIZES = "1000,10000"
+MODES = ["serial", "parallel", "stream"]
+STAGES = ["render", "parse", "extract", "export"]
+
+
+def current_rss_mb():
+    """Return the current resident set size of this process in MB."""
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE') / (1024 * 1024)
+    except OSError:
+        # No /proc (e.g. macOS): fall back to the process-wide peak
+        return peak_rss_mb() or 0.0
+
+
+class StageRecorder:
+    """Times a stage and samples its peak RSS from a background thread."""
+
+    def __init__(self, results, stage, interval=0.01):
+        self.results = results
+        self.stage = stage
+        self.interval = interval
+        self.peak_mb = 0.0
+        self._stop = threading.Event()
+
+    def _sample(self):
+        while not self._stop.is_set():
+            self.peak_mb = max(self.peak_mb, current_rss_mb())
+            self._stop.wait(self.interval)
+
+    def __enter__(self):
+        self.peak_mb = current_rss_mb()
+        self._thread = threading.Thread(target=self._sample, daemon=True)
+        self._thread.start()
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        elapsed = time.perf_counter() - self.start
+        self._stop.set()
+        self._thread.join()
+        self.peak_mb = max(self.peak_mb, current_rss_mb())
+        self.results[self.stage] = {"seconds": round(elapsed, 4), "peak_rss_mb": round(self.peak_mb, 1)}
+
+
+def run_case(html_file, mode, workers, work_dir, render=False):
+    """Run one extraction case in this process and return its stage results."""
+    from bs4 import BeautifulSoup
+    from session_extraction import SessionExtractor, extract_parallel
+    from catalog_stream import iter_catalog_sessions
+    from session_store import JsonlSessionWriter, iter_jsonl_sessions
+    from session_markdown import export_to_markdown
+    from extract_sessions import export_to_csv, render_catalog
+
+    results = {}
+    extractor = SessionExtractor()
+    start = time.perf_counter()
+    jsonl_file = os.path.join(work_dir, "benchmark_sessions.jsonl")
+
+    if render:
+        with StageRecorder(results, "render"):
+            html = render_catalog(os.path.abspath(html_file))
+    else:
+        html = None
+
+    if mode == "stream":
+        # Parsing, extraction and the JSONL checkpoint are interleaved when
+        # streaming, as in extract_sessions.py --stream, so no session list is held
+        with StageRecorder(results, "extract"), JsonlSessionWriter(jsonl_file) as writer:
+            for session in iter_catalog_sessions(html_file, extractor):
+                writer.write(session)
+        session_count = writer.completed
+    else:
+        with StageRecorder(results, "parse"):
+            if html is None:
+                with open(html_file, 'r', encoding='utf-8') as f:
+                    html = f.read()
+            soup = BeautifulSoup(html, 'html.parser')
+        with StageRecorder(results, "extract"):
+            containers = extractor.find_containers(soup)
+            if mode == "parallel":
+                sessions, _ = extract_parallel(containers, workers=workers or None)
+            else:
+                sessions = [extractor.extract(container) for container in containers]
+        session_count = len(sessions)
+
+    with StageRecorder(results, "export"):
+        if mode != "stream":
+            with JsonlSessionWriter(jsonl_file) as writer:
+                for session in sessions:
+                    writer.write(session)
+        export_to_markdown(iter_jsonl_sessions(jsonl_file),
+                           output_file=os.path.join(work_dir, "benchmark_sessions_table.md"))
+        export_to_csv(iter_jsonl_sessions(jsonl_file),
+                      output_file=os.path.join(work_dir, "benchmark_sessions.csv"))
+
+    return {
+        "sessions": session_count,
+        "wall_seconds": round(time.perf_counter() - start, 4),
+        "peak_rss_mb": round(max(stage["peak_rss_mb"] for stage in results.values()), 1),
+        "stages": results
+    }
+
+
+def print_report(results):
+    """Print a table of per-stage times and peak RSS for every case."""
+    header = f"{'sessions':>9} {'mode':<9}" + "".join(f"{stage:>10}" for stage in STAGES)
+    header += f"{'wall (s)':>10}{'peak MB':>10}"
+    print("\n" + header)
+    print("-" * len(header))
+    for result in results:
+        row = f"{result['size']:>9} {result['mode']:<9}"
+        for stage in STAGES:
+            stage_result = result["stages"].get(stage)
+            row += f"{stage_result['seconds']:>10.2f}" if stage_result else f"{'-':>10}"
+        row += f"{result['wall_seconds']:>10.2f}{format_mb(result['peak_rss_mb'])}"
+        print(row)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark session extraction on synthetic catalogs.")
+    parser.add_argument("--sizes", default=DEFAULT_SIZES,
+                        help=f"Comma-separated catalog sizes, e.g. 1000,10000,100000 (default: {DEFAULT_SIZES})")
+    parser.add_argument("--modes", default=",".join(MODES),
+                        help=f"Comma-separated extraction modes (default: {','.join(MODES)})")
+    parser.add_argument("--workers", type=int, default=0,
+                        help="Processes for the parallel mode (0 uses all cores, default: 0)")
+    parser.add_argument("--render", action="store_true",
+                        help="Also time the headless-browser render (needs Playwright browsers)")
+    parser.add_argument("--work-dir", default="benchmark_data",
+                        help="Directory for generated catalogs and exports (default: benchmark_data)")
+    parser.add_argument("--output", help="Write the results as JSON to this file")
+    parser.add_argument("--run-case", nargs=2, metavar=("HTML_FILE", "MODE"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    os.makedirs(args.work_dir, exist_ok=True)
+
+    if args.run_case:
+        html_file, mode = args.run_case
+        result = run_case(html_file, mode, args.workers, args.work_dir, args.render)
+        print_case_result(result)
+        return
+
+    from generate_synthetic_catalog import generate_catalog
+
+    sizes = [int(size) for size in args.sizes.split(",")]
+    modes = [mode.strip() for mode in args.modes.split(",")]
+    for mode in modes:
+        if mode not in MODES:
+            parser.error(f"unknown mode {mode!r} (choose from {', '.join(MODES)})")
+
+    results = []
+    for size in sizes:
+        html_file = os.path.join(args.work_dir, f"synthetic_catalog_{size}.html")
+        if not os.path.exists(html_file):
+            print(f"Generating synthetic catalog with {size} sessions...")
+            generate_catalog(html_file, size)
+
+        for mode in modes:
+            print(f"Benchmarking {mode} extraction of {size} sessions...")
+            case_args = [html_file, mode, "--workers", args.workers, "--work-dir", args.work_dir]
+            if args.render:
+                case_args.append("--render")
+            result = run_case_subprocess(__file__, case_args, f"Benchmark case {mode} on {html_file}")
+            result.update(size=size, mode=mode)
+            results.append(result)
+
+    print_report(results)
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2)
+        print(f"\nBenchmark results saved to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
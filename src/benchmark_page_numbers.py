@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Page Numbering Benchmark
+------------------------
+Compare the memory and time cost of "Page X of Y" numbering strategies as
+the page count grows: a plain canvas with no total (the floor), the
+per-page state snapshot recipe that replays every page in save(), and
+the single-pass deferred page count form. Each case runs in a fresh
+process so its peak RSS is its own.
+"""
+
+import os
+import json
+import time
+import argparse
+
+from reportlab.lib.pagesizes import letter
+from reportlab.lib.units import inch
+from reportlab.pdfgen import canvas
+
+from page_numbers import PageCountCanvas
+from benchmark_cases import case_peak_rss_mb, format_mb, print_case_result, run_case_subprocess
+
+DEFAULT_PAGES = "10,1000,10000"
+MODES = ["plain", "snapshot", "deferred"]
+
+
+class SnapshotPageCanvas(canvas.Canvas):
+    """The usual recipe: keep every page's canvas state and number them in save()."""
+
+    def __init__(self, *args, **kwargs):
+        canvas.Canvas.__init__(self, *args, **kwargs)
+        self.pages = []
+
+    def showPage(self):
+        self.pages.append(dict(self.__dict__))
+        self._startPage()
+
+    def save(self):
+        page_count = len(self.pages)
+        for page in self.pages:
+            self.__dict__.update(page)
+            self.setFont("Helvetica", 9)
+            self.drawRightString(letter[0] - 0.5*inch, 0.5*inch,
+                                 f"Page {self._pageNumber} of {page_count}")
+            canvas.Canvas.showPage(self)
+        canvas.Canvas.save(self)
+
+
+class DeferredPageCanvas(PageCountCanvas):
+    def draw_page_decorations(self):
+        self.draw_page_number(letter[0] - 0.5*inch, 0.5*inch)
+
+
+CANVASES = {"plain": canvas.Canvas, "snapshot": SnapshotPageCanvas, "deferred": DeferredPageCanvas}
+
+
+def run_case(pages, mode, output_file):
+    """Write a document of `pages` text pages with the given canvas and return its cost."""
+    start = time.perf_counter()
+    pdf = CANVASES[mode](output_file, pagesize=letter)
+    for number in range(1, pages + 1):
+        pdf.setFont("Helvetica-Bold", 16)
+        pdf.drawString(inch, letter[1] - inch, f"Session catalog page {number}")
+        pdf.setFont("Helvetica", 10)
+        for line in range(40):
+            pdf.drawString(inch, letter[1] - 1.5*inch - line * 14,
+                           f"Session S{70000 + number * 40 + line}: accelerated computing, "
+                           f"digital twins and generative AI in production")
+        pdf.showPage()
+    pdf.save()
+    return {
+        "pages": pages,
+        "mode": mode,
+        "seconds": round(time.perf_counter() - start, 3),
+        "peak_rss_mb": case_peak_rss_mb(),
+        "size_kb": round(os.path.getsize(output_file) / 1024, 1)
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark page numbering strategies by page count.")
+    parser.add_argument("--pages", default=DEFAULT_PAGES,
+                        help=f"Comma-separated page counts (default: {DEFAULT_PAGES})")
+    parser.add_argument("--modes", default=",".join(MODES),
+                        help=f"Comma-separated strategies (default: {','.join(MODES)})")
+    parser.add_argument("--work-dir", default="benchmark_data",
+                        help="Directory for the generated PDFs (default: benchmark_data)")
+    parser.add_argument("--output", help="Write the results as JSON to this file")
+    parser.add_argument("--run-case", nargs=3, metavar=("PAGES", "MODE", "OUTPUT_FILE"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.run_case:
+        pages, mode, output_file = args.run_case
+        print_case_result(run_case(int(pages), mode, output_file))
+        return
+
+    modes = [mode.strip() for mode in args.modes.split(",")]
+    for mode in modes:
+        if mode not in MODES:
+            parser.error(f"unknown mode {mode!r} (choose from {', '.join(MODES)})")
+    os.makedirs(args.work_dir, exist_ok=True)
+
+    results = []
+    for pages in [int(count) for count in args.pages.split(",")]:
+        for mode in modes:
+            print(f"Benchmarking {mode} numbering of {pages} pages...")
+            output_file = os.path.join(args.work_dir, f"page_numbers_{mode}_{pages}.pdf")
+            results.append(run_case_subprocess(__file__, [pages, mode, output_file],
+                                               f"Benchmark case {mode} with {pages} pages"))
+
+    print(f"\n{'pages':>7} {'mode':<10}{'time (s)':>10}{'peak MB':>10}{'size (KB)':>11}")
+    print("-" * 48)
+    for result in results:
+        print(f"{result['pages']:>7} {result['mode']:<10}{result['seconds']:>10.2f}"
+              f"{format_mb(result['peak_rss_mb'])}{result['size_kb']:>11.1f}")
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2)
+        print(f"\nBenchmark results saved to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
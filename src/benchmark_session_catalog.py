@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Session Catalog Benchmark
+-------------------------
+Time the session catalog PDF and sample its peak RSS at increasing session
+counts and worker counts. Synthetic catalogs are generated,
+stream-extracted and exported to CSV once (cached in the work directory);
+each catalog build then runs in a fresh process so its peak memory is its
+own (with workers, the peak of the main process).
+"""
+
+import os
+import json
+import time
+import argparse
+
+from benchmark_cases import case_peak_rss_mb, format_mb, print_case_result, run_case_subprocess
+
+DEFAULT_SIZES = "1300,10000"
+DEFAULT_WORKERS = "1"
+
+
+def prepare_csv(size, work_dir):
+    """Return a CSV export of a synthetic catalog with `size` sessions, creating it if needed."""
+    from generate_synthetic_catalog import generate_catalog
+    from catalog_stream import iter_catalog_sessions
+    from extract_sessions import export_to_csv
+
+    csv_file = os.path.join(work_dir, f"synthetic_sessions_{size}.csv")
+    if not os.path.exists(csv_file):
+        html_file = os.path.join(work_dir, f"synthetic_catalog_{size}.html")
+        if not os.path.exists(html_file):
+            print(f"Generating synthetic catalog with {size} sessions...")
+            generate_catalog(html_file, size)
+        export_to_csv(iter_catalog_sessions(html_file), csv_file)
+    return csv_file
+
+
+def run_case(csv_file, output_file, workers):
+    """Build the catalog for one CSV in this process and return its cost."""
+    from create_session_catalog import create_session_catalog
+
+    start = time.perf_counter()
+    sessions, pages = create_session_catalog(csv_file, output_file, group_by='prefix', workers=workers)
+    return {
+        "sessions": sessions,
+        "workers": workers,
+        "pages": pages,
+        "seconds": round(time.perf_counter() - start, 2),
+        "peak_rss_mb": case_peak_rss_mb(),
+        "size_mb": round(os.path.getsize(output_file) / (1024 * 1024), 2)
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the session catalog PDF on synthetic catalogs.")
+    parser.add_argument("--sizes", default=DEFAULT_SIZES,
+                        help=f"Comma-separated session counts (default: {DEFAULT_SIZES})")
+    parser.add_argument("--workers", default=DEFAULT_WORKERS,
+                        help=f"Comma-separated worker counts; more than 1 renders sections in parallel "
+                             f"(default: {DEFAULT_WORKERS})")
+    parser.add_argument("--work-dir", default="benchmark_data",
+                        help="Directory for generated catalogs, CSVs and PDFs (default: benchmark_data)")
+    parser.add_argument("--output", help="Write the results as JSON to this file")
+    parser.add_argument("--run-case", nargs=3, metavar=("CSV_FILE", "OUTPUT_FILE", "WORKERS"),
+                        help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.run_case:
+        csv_file, output_file, workers = args.run_case
+        print_case_result(run_case(csv_file, output_file, int(workers)))
+        return
+
+    os.makedirs(args.work_dir, exist_ok=True)
+    results = []
+    for size in [int(size) for size in args.sizes.split(",")]:
+        csv_file = prepare_csv(size, args.work_dir)
+        for workers in [int(count) for count in args.workers.split(",")]:
+            print(f"Benchmarking the catalog of {size} sessions with {workers} workers...")
+            output_file = os.path.join(args.work_dir, f"session_catalog_{size}_w{workers}.pdf")
+            results.append(run_case_subprocess(__file__, [csv_file, output_file, workers],
+                                               f"Catalog benchmark on {csv_file}"))
+
+    print(f"\n{'sessions':>9}{'workers':>9}{'pages':>8}{'time (s)':>10}{'peak MB':>10}{'size (MB)':>11}")
+    print("-" * 57)
+    for result in results:
+        print(f"{result['sessions']:>9}{result['workers']:>9}{result['pages']:>8}{result['seconds']:>10.2f}"
+              f"{format_mb(result['peak_rss_mb'])}{result['size_mb']:>11.2f}")
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2)
+        print(f"\nBenchmark results saved to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
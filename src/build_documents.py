@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+GTC Document Builder
+--------------------
+Build every PDF deliverable (the narratives, the documentation and the
+marketing documents) at once. The documents are independent reportlab
+builds, so each one runs in its own worker process and the whole set
+takes about as long as the slowest document.
+"""
+
+import os
+import time
+import argparse
+import importlib
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from run_report import RunReport, add_report_arguments, stage
+
+# Document name -> (module, builder, output file). A builder written as
+# Class.method is called on a fresh instance of the class.
+DOCUMENTS = {
+    "enhanced_narrative": ("create_enhanced_narrative", "create_enhanced_narrative",
+                           "outputs/GTC_2025_Enhanced_Narrative.pdf"),
+    "executive_insights": ("create_marketing_package", "MarketingPackageGenerator.create_one_pager",
+                           "outputs/marketing_package/GTC_2025_Executive_Insights.pdf"),
+    "social_media_guide": ("create_marketing_package", "MarketingPackageGenerator.create_social_media_content",
+                           "outputs/marketing_package/Social_Media_Content_Guide.pdf"),
+    "presentation_template": ("create_marketing_package", "MarketingPackageGenerator.create_presentation_template",
+                              "outputs/marketing_package/GTC_2025_Presentation_Template.pdf"),
+    "session_catalog": ("create_session_catalog", "create_session_catalog",
+                        "outputs/GTC_2025_Session_Catalog.pdf"),
+    "gtc_narrative": ("create_gtc_narrative", "create_gtc_narrative", "GTC_2025_Narrative.pdf"),
+    "gtc_documentation": ("create_gtc_documentation", "create_gtc_documentation", "GTC_2025_Documentation.pdf"),
+}
+
+
+def build_document(name):
+    """Build one document and return its timings."""
+    module_name, builder, output_file = DOCUMENTS[name]
+    wall_start = time.perf_counter()
+    cpu_start = time.process_time()
+
+    module = importlib.import_module(module_name)
+    if "." in builder:
+        class_name, method = builder.split(".")
+        getattr(getattr(module, class_name)(), method)()
+    else:
+        getattr(module, builder)()
+
+    return {
+        "document": name,
+        "output_file": output_file,
+        "wall_seconds": time.perf_counter() - wall_start,
+        "cpu_seconds": time.process_time() - cpu_start,
+        "size_kb": os.path.getsize(output_file) / 1024 if os.path.exists(output_file) else None
+    }
+
+
+def build_documents(names, workers=None):
+    """Build the named documents in a process pool; one worker builds them in order."""
+    if workers == 1:
+        results = []
+        for name in names:
+            with stage(name):
+                results.append(build_document(name))
+        return results
+
+    results = []
+    with ProcessPoolExecutor(max_workers=workers or min(len(names), os.cpu_count())) as executor:
+        futures = [executor.submit(build_document, name) for name in names]
+        for future in as_completed(futures):
+            results.append(future.result())
+    # Report in the requested order rather than completion order
+    return sorted(results, key=lambda result: names.index(result["document"]))
+
+
+def print_timings(results, wall_seconds):
+    print(f"\n{'document':<24}{'wall (s)':>10}{'CPU (s)':>10}{'size (KB)':>11}  output")
+    for result in results:
+        size = f"{result['size_kb']:>11.1f}" if result["size_kb"] is not None else f"{'-':>11}"
+        print(f"{result['document']:<24}{result['wall_seconds']:>10.2f}{result['cpu_seconds']:>10.2f}"
+              f"{size}  {result['output_file']}")
+    slowest = max(result["wall_seconds"] for result in results)
+    serial = sum(result["wall_seconds"] for result in results)
+    print(f"\n{len(results)} documents in {wall_seconds:.2f}s "
+          f"(slowest document {slowest:.2f}s, {serial:.2f}s if built one after another)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build all GTC PDF deliverables in parallel.")
+    parser.add_argument("documents", nargs="*",
+                        help=f"Documents to build (default: all of {', '.join(DOCUMENTS)})")
+    parser.add_argument("--workers", type=int, default=0,
+                        help="Worker processes (0 uses one per document up to the core count, "
+                             "1 builds in this process; default: 0)")
+    add_report_arguments(parser)
+    args = parser.parse_args()
+
+    for name in args.documents:
+        if name not in DOCUMENTS:
+            parser.error(f"unknown document {name!r} (choose from {', '.join(DOCUMENTS)})")
+    names = args.documents or list(DOCUMENTS)
+
+    with RunReport.from_args("build_documents", args):
+        start = time.perf_counter()
+        with stage("build"):
+            results = build_documents(names, workers=args.workers or None)
+        print_timings(results, time.perf_counter() - start)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+Streaming Catalog Parser
+------------------------
+Extract sessions from very large saved catalog pages with bounded memory.
+The file is memory-mapped and fed to lxml's incremental HTML parser; each
+session card is extracted as soon as it has been parsed and its subtree is
+freed before parsing continues.
+"""
+
+import mmap
+
+from lxml import etree
+
+from session_extraction import SessionExtractor
+
+
+def _is_session_container(element):
+    """Check whether an element is a session-title container."""
+    return element.tag == 'div' and 'session-title' in (element.get('class') or '')
+
+
+def _release(element):
+    """Free a processed element and any already-processed siblings before it."""
+    element.clear(keep_tail=True)
+    parent = element.getparent()
+    if parent is not None:
+        while element.getprevious() is not None:
+            del parent[0]
+
+
+def iter_catalog_fragments(html_file_path, encoding='utf-8'):
+    """Yield (fragment, index) pairs for each session in a saved catalog file.
+
+    A session card is the parent of a session-title container, matching what
+    SessionExtractor.extract() searches. Each card is serialized when its end
+    tag is parsed and then released; index is the container's position within
+    the card, as produced by split_into_fragments().
+    """
+    # Cards that contain session-title containers, mapped to the container count
+    pending_cards = {}
+
+    with open(html_file_path, 'rb') as f, \
+            mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        events = etree.iterparse(mapped, events=('end',), html=True,
+                                 encoding=encoding, huge_tree=True)
+        for _, element in events:
+            if _is_session_container(element):
+                card = element.getparent()
+                pending_cards[card] = pending_cards.get(card, 0) + 1
+            elif element in pending_cards:
+                count = pending_cards.pop(element)
+                fragment = etree.tostring(element, encoding='unicode', method='html')
+                for index in range(count):
+                    yield fragment, index
+                _release(element)
+
+
+def iter_catalog_sessions(html_file_path, extractor=None, encoding='utf-8'):
+    """Yield session records one by one from a saved catalog HTML file."""
+    extractor = extractor or SessionExtractor()
+    for fragment, index in iter_catalog_fragments(html_file_path, encoding):
+        yield extractor.extract_fragment(fragment, index)
@@ -5,28 +5,9 @@ from collections import Counter
 from sklearn.feature_extraction.text import TfidfVectorizer
 from sklearn.cluster import KMeans
 import numpy as np
+import argparse
 
-# Read titles, skipping the header lines
-with open('gtc_sessions_titles.txt', 'r') as f:
-    lines = f.readlines()
-
-titles = []
-session_codes = []
-for line in lines[2:]:  # Skip header and blank line
-    line = line.strip()
-    if not line:
-        continue
-    
-    # Extract session code
-    match = re.search(r'\[(.*?)\]$', line)
-    if match:
-        code = match.group(1)
-        session_codes.append(code)
-        # Remove the code from the title
-        title = line[:match.start()].strip()
-        titles.append(title)
-
-print(f"Found {len(titles)} titles to categorize")
+from run_report import RunReport, add_report_arguments, stage
 
 # Define major categories and their keywords
 categories = {
@@ -65,50 +46,86 @@ categories = {
     'Financial Technology': ['finance', 'financial', 'trading', 'investment', 'portfolio', 'risk', 'banking', 'payment', 'transaction', 'stock', 'market', 'fintech', 'cryptocurrency', 'blockchain', 'economic']
 }
 
-# Categorize each title
-categorized_titles = {}
-uncategorized = []
-
-for i, title in enumerate(titles):
-    title_lower = title.lower()
-    best_category = None
-    best_score = 0
-    
-    for category, keywords in categories.items():
-        score = sum(1 for keyword in keywords if keyword in title_lower)
-        if score > best_score:
-            best_score = score
-            best_category = category
-    
-    if best_score > 0:
-        if best_category not in categorized_titles:
-            categorized_titles[best_category] = []
-        categorized_titles[best_category].append((title, session_codes[i]))
-    else:
-        uncategorized.append((title, session_codes[i]))
-
-# Add uncategorized to a special category
-if uncategorized:
-    categorized_titles['Miscellaneous & Other Topics'] = uncategorized
-
-# Write categorized titles to file
-with open('gtc_sessions_categorized.md', 'w') as f:
-    f.write('# NVIDIA GTC 2025 Session Titles - Categorized\n\n')
-    
-    # Write summary statistics
-    f.write('## Summary\n\n')
-    f.write(f'- Total sessions: {len(titles)}\n')
-    for category, titles in sorted(categorized_titles.items()):
-        f.write(f'- {category}: {len(titles)} sessions\n')
-    f.write('\n')
-    
-    # Write each category and its titles
-    for category, titles in sorted(categorized_titles.items()):
-        f.write(f'## {category} ({len(titles)} sessions)\n\n')
-        
-        for title, code in sorted(titles):
-            f.write(f'- {title} [{code}]\n')
-        
-        f.write('\n')
-
-print(f'Categorization complete. Found {len(titles)} total sessions across {len(categorized_titles)} categories.')
+def main():
+    """Categorize the session titles by keyword and write gtc_sessions_categorized.md."""
+    with stage("load_titles"):
+        # Read titles, skipping the header lines
+        with open('gtc_sessions_titles.txt', 'r') as f:
+            lines = f.readlines()
+
+        titles = []
+        session_codes = []
+        for line in lines[2:]:  # Skip header and blank line
+            line = line.strip()
+            if not line:
+                continue
+
+            # Extract session code
+            match = re.search(r'\[(.*?)\]$', line)
+            if match:
+                code = match.group(1)
+                session_codes.append(code)
+                # Remove the code from the title
+                title = line[:match.start()].strip()
+                titles.append(title)
+
+    print(f"Found {len(titles)} titles to categorize")
+
+    with stage("categorize"):
+        # Categorize each title
+        categorized_titles = {}
+        uncategorized = []
+
+        for i, title in enumerate(titles):
+            title_lower = title.lower()
+            best_category = None
+            best_score = 0
+
+            for category, keywords in categories.items():
+                score = sum(1 for keyword in keywords if keyword in title_lower)
+                if score > best_score:
+                    best_score = score
+                    best_category = category
+
+            if best_score > 0:
+                if best_category not in categorized_titles:
+                    categorized_titles[best_category] = []
+                categorized_titles[best_category].append((title, session_codes[i]))
+            else:
+                uncategorized.append((title, session_codes[i]))
+
+        # Add uncategorized to a special category
+        if uncategorized:
+            categorized_titles['Miscellaneous & Other Topics'] = uncategorized
+
+    with stage("write_categorized"):
+        # Write categorized titles to file
+        with open('gtc_sessions_categorized.md', 'w') as f:
+            f.write('# NVIDIA GTC 2025 Session Titles - Categorized\n\n')
+
+            # Write summary statistics
+            f.write('## Summary\n\n')
+            f.write(f'- Total sessions: {len(titles)}\n')
+            for category, titles in sorted(categorized_titles.items()):
+                f.write(f'- {category}: {len(titles)} sessions\n')
+            f.write('\n')
+
+            # Write each category and its titles
+            for category, titles in sorted(categorized_titles.items()):
+                f.write(f'## {category} ({len(titles)} sessions)\n\n')
+
+                for title, code in sorted(titles):
+                    f.write(f'- {title} [{code}]\n')
+
+                f.write('\n')
+
+    print(f'Categorization complete. Found {len(titles)} total sessions across {len(categorized_titles)} categories.')
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Categorize GTC session titles by keyword.")
+    add_report_arguments(parser)
+    args = parser.parse_args()
+
+    with RunReport.from_args("cluster_titles", args):
+        main()
@@ -3,23 +3,36 @@
 Enhanced GTC 2025 Narrative Generator
 ------------------------------------
 This script creates a visually appealing, professionally designed narrative 
-document that effectively communicates insights from GTC 2025.
+document that effectively communicates insights from GTC 2025. The narrative
+is built once as a document model (document_model.py) and rendered to PDF,
+HTML and Markdown side by side.
 """
 
 import os
-import json
+import argparse
+from functools import lru_cache
+from xml.sax.saxutils import escape
 from reportlab.lib import colors
 from reportlab.lib.pagesizes import letter, landscape
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.units import inch
 from reportlab.platypus import (
     SimpleDocTemplate, Paragraph, Spacer, Image, 
-    Table, TableStyle, PageBreak, Flowable, Frame
+    Table, PageBreak, Flowable, Frame
 )
 from reportlab.pdfgen import canvas
 from reportlab.pdfbase import pdfmetrics
 from reportlab.pdfbase.ttfonts import TTFont
 
+from run_report import RunReport, add_report_arguments, stage
+from analysis_artifacts import ANALYSIS_DIR, load_artifacts
+from image_cache import prepare_image, DEFAULT_DPI
+from vector_charts import (
+    CATEGORY_DISTRIBUTION_TITLE, category_distribution_data, horizontal_bar_chart, keyword_data
+)
+from page_furniture import FurnitureCanvas, grid_table_style
+import document_model as model
+
 # Define color scheme based on NVIDIA brand
 NVIDIA_GREEN = colors.HexColor('#76B900')
 NVIDIA_BLACK = colors.HexColor('#000000')
@@ -27,48 +40,49 @@ DARK_GRAY = colors.HexColor('#333333')
 LIGHT_GRAY = colors.HexColor('#F5F5F5')
 MID_GRAY = colors.HexColor('#999999')
 
-class PageNumCanvas(canvas.Canvas):
+OUTPUT_FILES = {
+    "pdf": "outputs/GTC_2025_Enhanced_Narrative.pdf",
+    "html": "outputs/narrative_summary.html",
+    "markdown": "outputs/narrative_summary.md",
+}
+
+DIGITAL_TWIN_APPLICATIONS = [
+    ["Industry", "Application", "Impact"],
+    ["Manufacturing", "Factory Planning & Optimization", "30% increase in operational efficiency"],
+    ["Automotive", "Production Line Simulation", "Reduced downtime by 45%"],
+    ["Construction", "Infrastructure Digital Twins", "20% cost reduction in project planning"],
+    ["Retail", "Store Layout Optimization", "15% increase in customer engagement"],
+    ["Healthcare", "Surgical Simulation", "Improved patient outcomes by 25%"]
+]
+
+FUTURE_IMPLICATIONS = [
+    "Organizations that successfully integrate AI and digital twins will establish significant competitive advantages",
+    "The line between physical and digital will continue to blur, creating new possibilities for innovation",
+    "Talent with expertise in these technologies will be increasingly valuable across all sectors",
+    "New business models will emerge that leverage real-time data and predictive capabilities",
+    "Cross-industry collaboration will accelerate to solve complex challenges"
+]
+
+class PageNumCanvas(FurnitureCanvas):
     """Canvas that adds page numbers and headers/footers to each page."""
+
+    def draw_furniture(self):
+        """The footer rule and text, drawn once and placed on every page."""
+        self.line(0.5*inch, 0.6*inch, letter[0]-0.5*inch, 0.6*inch)
+        self.setFillColor(MID_GRAY)
+        self.setFont("Helvetica", 8)
+        self.drawCentredString(
+            letter[0]/2, 
+            0.4*inch, 
+            "GTC 2025 Insights | Created with NVIDIA Conference Data"
+        )
     
-    def __init__(self, *args, **kwargs):
-        canvas.Canvas.__init__(self, *args, **kwargs)
-        self.pages = []
-        
-    def showPage(self):
-        """Override to add page info before showing the page."""
-        self.pages.append(dict(self.__dict__))
-        self._startPage()
-        
-    def save(self):
-        """Add page numbers and save the document."""
-        page_count = len(self.pages)
-        
-        # Add page numbers to each page
-        for page in self.pages:
-            self.__dict__.update(page)
-            
-            # Skip page number on first page
-            if self._pageNumber > 1:
-                self.setFont("Helvetica", 9)
-                self.setFillColor(MID_GRAY)
-                self.drawRightString(
-                    letter[0] - 0.5*inch, 
-                    0.5*inch, 
-                    f"Page {self._pageNumber} of {page_count}"
-                )
-                
-                # Add footer
-                self.line(0.5*inch, 0.6*inch, letter[0]-0.5*inch, 0.6*inch)
-                self.setFont("Helvetica", 8)
-                self.drawCentredString(
-                    letter[0]/2, 
-                    0.4*inch, 
-                    "GTC 2025 Insights | Created with NVIDIA Conference Data"
-                )
-            
-            self._startPage()
-            
-        canvas.Canvas.save(self)
+    def draw_page_decorations(self):
+        """Add the page number and footer to every page but the first."""
+        if self._pageNumber > 1:
+            self.setFillColor(MID_GRAY)
+            self.draw_page_number(letter[0] - 0.5*inch, 0.5*inch)
+            self.place_furniture()
 
 class TwoColumnSection(Flowable):
     """A flowable that creates a two-column section."""
@@ -103,66 +117,119 @@ class TwoColumnSection(Flowable):
         left_frame.addFromList(self.left_content, self.canv)
         right_frame.addFromList(self.right_content, self.canv)
 
-def create_enhanced_narrative():
-    """Create an enhanced narrative document with visualizations."""
-    # Define paths
-    output_dir = "outputs/analysis_output"
-    output_file = "outputs/GTC_2025_Enhanced_Narrative.pdf"
-    
-    # Load insights data
-    with open(os.path.join(output_dir, "gtc_insights.json"), "r") as f:
-        insights = json.load(f)
-    
-    # Create PDF document
-    doc = SimpleDocTemplate(
-        output_file,
-        pagesize=letter,
-        rightMargin=0.5*inch,
-        leftMargin=0.5*inch,
-        topMargin=0.75*inch,
-        bottomMargin=0.75*inch,
+def build_narrative_document(insights, trends, analysis_dir=ANALYSIS_DIR):
+    """Build the enhanced narrative as a document model from the analysis output."""
+    def image(name):
+        return os.path.join(analysis_dir, name)
+
+    document = model.Document("NVIDIA GTC 2025: Enhanced Narrative")
+    session_count = load_artifacts(analysis_dir).session_count
+
+    # Cover page
+    distribution = category_distribution_data(trends, insights)
+    document.add(
+        model.Cover(
+            "NVIDIA GTC 2025", subtitle="Insights & Analysis", date="April 2025",
+            figure=model.Figure(
+                image("category_distribution.png"), f"Distribution of {session_count:,} Sessions Across Categories",
+                width=6.5, height=4,
+                chart=model.BarChart([category for category, _ in distribution],
+                                     [count for _, count in distribution],
+                                     CATEGORY_DISTRIBUTION_TITLE, 'Number of Sessions')
+            )
+        ),
+        model.PageBreak()
     )
-    
-    # Get styles
-    styles = getSampleStyleSheet()
-    
-    # Create custom styles
-    title_style = ParagraphStyle(
-        'CustomTitle',
-        parent=styles['Heading1'],
-        fontSize=30,
-        spaceAfter=24,
-        textColor=NVIDIA_GREEN,
-        alignment=1  # Center alignment
+
+    # Introduction
+    document.add(
+        model.Heading("Executive Summary"),
+        model.Paragraph(f"""
+        NVIDIA's GTC 2025 showcased the remarkable pace of innovation in AI, accelerated computing, 
+        and digital transformation technologies. With {session_count:,} sessions across multiple technical 
+        domains, the conference provided a comprehensive view of how these technologies are reshaping 
+        industries and creating new opportunities.
+        """),
+        model.Paragraph("""
+        This document presents a data-driven analysis of GTC 2025, extracting key insights and trends 
+        to help navigate the rapidly evolving technological landscape. From the dominance of AI and 
+        machine learning to the transformative potential of digital twins, GTC 2025 offered a window 
+        into the future of technology and its impact across sectors.
+        """)
     )
-    
-    subtitle_style = ParagraphStyle(
-        'CustomSubtitle',
-        parent=styles['Heading2'],
-        fontSize=18,
-        spaceAfter=12,
-        textColor=DARK_GRAY,
-        alignment=1  # Center alignment
+
+    # Key Insights Section
+    keywords = keyword_data(trends, "AI & Machine Learning")
+    document.add(
+        model.Heading("Key Insights"),
+        model.Heading("Technology Focus Areas", level=2),
+        model.Table([["Category", "Sessions"]] + [[category, count] for category, count in insights["top_categories"]],
+                    widths=[4, 1.5], style='summary'),
+        model.Figure(image("wordcloud_ai_machine_learning.png"),
+                     "Word Cloud: AI & Machine Learning Session Topics"),
+        model.Heading("Emerging Trends", level=2),
+        model.BulletList(escape(trend) for trend in insights["emerging_trends"]),
+        model.Figure(
+            image("keywords_ai_machine_learning.png"), "Top Keywords in AI & Machine Learning Sessions",
+            chart=model.BarChart([keyword for keyword, _ in keywords], [count for _, count in keywords],
+                                 'Top 10 Keywords in AI & Machine Learning', 'Frequency') if keywords else None
+        ),
+        model.PageBreak()
     )
-    
-    heading_style = ParagraphStyle(
-        'CustomHeading',
-        parent=styles['Heading2'],
-        fontSize=20,
-        spaceBefore=18,
-        spaceAfter=12,
-        textColor=NVIDIA_GREEN
+
+    # Industry Impact
+    document.add(
+        model.Heading("Industry Impact & Applications"),
+        model.Paragraph("""
+        GTC 2025 demonstrated how AI and accelerated computing are transforming industries across 
+        the global economy. From healthcare to manufacturing, retail to financial services, 
+        organizations are leveraging these technologies to drive innovation, improve efficiency, 
+        and create new value.
+        """),
+        model.BulletList(escape(focus) for focus in insights["industry_focus"]),
+        model.Figure(image("wordcloud_industry_applications.png"), "Word Cloud: Industry Applications"),
+        model.PageBreak()
     )
-    
-    subheading_style = ParagraphStyle(
-        'CustomSubheading',
-        parent=styles['Heading3'],
-        fontSize=16,
-        spaceBefore=12,
-        spaceAfter=8,
-        textColor=DARK_GRAY
+
+    # Digital Twins Section
+    document.add(
+        model.Heading("Spotlight: Digital Twins Revolution"),
+        model.Paragraph("""
+        One of the most transformative themes at GTC 2025 was the emergence of digital twins as a 
+        cornerstone of industrial innovation. These virtual replicas of physical systems are enabling
+        unprecedented capabilities for design, optimization, and real-time monitoring across industries.
+        """),
+        model.Figure(image("wordcloud_digital_twins_simulation.png"),
+                     "Word Cloud: Digital Twins & Simulation Topics"),
+        model.Heading("Industry Applications of Digital Twins", level=2),
+        model.Table(DIGITAL_TWIN_APPLICATIONS, widths=[1.5, 2.5, 2.5], style='detail'),
+        model.PageBreak()
     )
-    
+
+    # Future Outlook
+    document.add(
+        model.Heading("Future Outlook & Implications"),
+        model.Paragraph("""
+        The convergence of AI, digital twins, and accelerated computing at GTC 2025 signals a 
+        fundamental shift in how industries leverage technology. These technologies are not just 
+        transforming individual processes but entire business models and value chains.
+        """),
+        model.Paragraph("<b>Key Future Implications:</b>"),
+        model.BulletList(FUTURE_IMPLICATIONS),
+        model.Paragraph("""
+        <i>As these technologies mature, we can expect to see increasingly sophisticated applications
+        that combine multiple AI modalities with simulation capabilities, creating unprecedented
+        opportunities for innovation and efficiency gains. The organizations that successfully
+        integrate these technologies into their operations will likely establish significant
+        competitive advantages in their respective markets.</i>
+        """, style='emphasis')
+    )
+    return document
+
+
+@lru_cache(maxsize=None)
+def _pdf_styles():
+    styles = getSampleStyleSheet()
     body_style = ParagraphStyle(
         'CustomBody',
         parent=styles['Normal'],
@@ -170,223 +237,181 @@ def create_enhanced_narrative():
         spaceAfter=10,
         leading=16
     )
-    
-    emphasis_style = ParagraphStyle(
-        'Emphasis',
-        parent=body_style,
-        textColor=NVIDIA_GREEN,
-        fontSize=14,
-        leading=18
-    )
-    
-    caption_style = ParagraphStyle(
-        'Caption',
-        parent=styles['Italic'],
-        fontSize=10,
-        textColor=MID_GRAY,
-        alignment=1  # Center alignment
-    )
-    
-    # Story elements
+    return {
+        'title': ParagraphStyle(
+            'CustomTitle',
+            parent=styles['Heading1'],
+            fontSize=30,
+            spaceAfter=24,
+            textColor=NVIDIA_GREEN,
+            alignment=1  # Center alignment
+        ),
+        'subtitle': ParagraphStyle(
+            'CustomSubtitle',
+            parent=styles['Heading2'],
+            fontSize=18,
+            spaceAfter=12,
+            textColor=DARK_GRAY,
+            alignment=1  # Center alignment
+        ),
+        'heading': ParagraphStyle(
+            'CustomHeading',
+            parent=styles['Heading2'],
+            fontSize=20,
+            spaceBefore=18,
+            spaceAfter=12,
+            textColor=NVIDIA_GREEN
+        ),
+        'subheading': ParagraphStyle(
+            'CustomSubheading',
+            parent=styles['Heading3'],
+            fontSize=16,
+            spaceBefore=12,
+            spaceAfter=8,
+            textColor=DARK_GRAY
+        ),
+        'body': body_style,
+        'emphasis': ParagraphStyle(
+            'Emphasis',
+            parent=body_style,
+            textColor=NVIDIA_GREEN,
+            fontSize=14,
+            leading=18
+        ),
+        'caption': ParagraphStyle(
+            'Caption',
+            parent=styles['Italic'],
+            fontSize=10,
+            textColor=MID_GRAY,
+            alignment=1  # Center alignment
+        ),
+    }
+
+
+TABLE_STYLES = {
+    # Two-column figures: left-aligned labels, centred numbers
+    'summary': dict(header_font_size=14, body_font_size=12, align='LEFT', centred_columns=(1,)),
+    'detail': dict(header_font_size=12, body_font_size=10),
+}
+
+
+def _table_style(name):
+    return grid_table_style(NVIDIA_GREEN, LIGHT_GRAY, NVIDIA_GREEN, body_text_color=DARK_GRAY,
+                            **TABLE_STYLES[name])
+
+
+def _pdf_figure(figure, styles, image_dpi, charts):
+    """Flowables for a figure: a vector chart, the cached image or nothing, then its caption."""
+    width, height = figure.width*inch, figure.height*inch
+    chart = figure.chart
+    if chart is not None and charts == "vector":
+        flowable = horizontal_bar_chart(chart.labels, chart.values, width, height, chart.title, chart.value_label)
+    elif figure.image and os.path.exists(figure.image):
+        flowable = Image(prepare_image(figure.image, width, height, image_dpi), width=width, height=height)
+    else:
+        return []
+    return [flowable, Spacer(1, 6), Paragraph(escape(figure.caption), styles['caption']), Spacer(1, 18)]
+
+
+def render_pdf(document, output_file, image_dpi=DEFAULT_DPI, charts="vector"):
+    """Render a document model with the narrative's reportlab styles."""
+    styles = _pdf_styles()
     story = []
-    
-    # Cover page
-    story.append(Paragraph("NVIDIA GTC 2025", title_style))
-    story.append(Spacer(1, 12))
-    story.append(Paragraph("Insights & Analysis", subtitle_style))
-    story.append(Spacer(1, 36))
-    
-    # Add hero image if available
-    hero_image_path = os.path.join(output_dir, "category_distribution.png")
-    if os.path.exists(hero_image_path):
-        img = Image(hero_image_path, width=6.5*inch, height=4*inch)
-        story.append(img)
-        story.append(Spacer(1, 12))
-        story.append(Paragraph("Distribution of 1300+ Sessions Across Categories", caption_style))
-    
-    story.append(Spacer(1, 36))
-    story.append(Paragraph("April 2025", body_style))
-    story.append(PageBreak())
-    
-    # Introduction
-    story.append(Paragraph("Executive Summary", heading_style))
-    story.append(Paragraph("""
-    NVIDIA's GTC 2025 showcased the remarkable pace of innovation in AI, accelerated computing, 
-    and digital transformation technologies. With over 1300 sessions across multiple technical 
-    domains, the conference provided a comprehensive view of how these technologies are reshaping 
-    industries and creating new opportunities.
-    """, body_style))
-    
-    story.append(Paragraph("""
-    This document presents a data-driven analysis of GTC 2025, extracting key insights and trends 
-    to help navigate the rapidly evolving technological landscape. From the dominance of AI and 
-    machine learning to the transformative potential of digital twins, GTC 2025 offered a window 
-    into the future of technology and its impact across sectors.
-    """, body_style))
-    
-    # Key Insights Section
-    story.append(Paragraph("Key Insights", heading_style))
-    
-    # Top Categories Section
-    story.append(Paragraph("Technology Focus Areas", subheading_style))
-    
-    # Create a table for top categories
-    top_categories_data = [["Category", "Sessions"]]
-    for category, count in insights["top_categories"]:
-        top_categories_data.append([category, str(count)])
-    
-    top_categories_table = Table(top_categories_data, colWidths=[4*inch, 1.5*inch])
-    top_categories_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), NVIDIA_GREEN),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-        ('ALIGN', (1, 0), (1, -1), 'CENTER'),
-        ('FONTSIZE', (0, 0), (-1, 0), 14),
-        ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-        ('BACKGROUND', (0, 1), (-1, -1), LIGHT_GRAY),
-        ('TEXTCOLOR', (0, 1), (-1, -1), DARK_GRAY),
-        ('FONTSIZE', (0, 1), (-1, -1), 12),
-        ('GRID', (0, 0), (-1, -1), 1, NVIDIA_GREEN)
-    ]))
-    
-    story.append(top_categories_table)
-    story.append(Spacer(1, 18))
-    
-    # Add AI ML word cloud if available
-    ai_wordcloud_path = os.path.join(output_dir, "wordcloud_ai_machine_learning.png")
-    if os.path.exists(ai_wordcloud_path):
-        img = Image(ai_wordcloud_path, width=6.5*inch, height=3*inch)
-        story.append(img)
-        story.append(Spacer(1, 6))
-        story.append(Paragraph("Word Cloud: AI & Machine Learning Session Topics", caption_style))
-        story.append(Spacer(1, 18))
-    
-    # Emerging Trends Section
-    story.append(Paragraph("Emerging Trends", subheading_style))
-    
-    for trend in insights["emerging_trends"]:
-        story.append(Paragraph(f"• {trend}", body_style))
-    
-    story.append(Spacer(1, 12))
-    
-    # Add trend visualization if available
-    ml_keywords_path = os.path.join(output_dir, "keywords_ai_machine_learning.png")
-    if os.path.exists(ml_keywords_path):
-        img = Image(ml_keywords_path, width=6.5*inch, height=3*inch)
-        story.append(img)
-        story.append(Spacer(1, 6))
-        story.append(Paragraph("Top Keywords in AI & Machine Learning Sessions", caption_style))
-    
-    story.append(PageBreak())
-    
-    # Industry Impact
-    story.append(Paragraph("Industry Impact & Applications", heading_style))
-    
-    story.append(Paragraph("""
-    GTC 2025 demonstrated how AI and accelerated computing are transforming industries across 
-    the global economy. From healthcare to manufacturing, retail to financial services, 
-    organizations are leveraging these technologies to drive innovation, improve efficiency, 
-    and create new value.
-    """, body_style))
-    
-    # Industry Focus Section
-    for focus in insights["industry_focus"]:
-        story.append(Paragraph(f"• {focus}", body_style))
-    
-    story.append(Spacer(1, 12))
-    
-    # Add industry applications word cloud if available
-    industry_wordcloud_path = os.path.join(output_dir, "wordcloud_industry_applications.png")
-    if os.path.exists(industry_wordcloud_path):
-        img = Image(industry_wordcloud_path, width=6.5*inch, height=3*inch)
-        story.append(img)
-        story.append(Spacer(1, 6))
-        story.append(Paragraph("Word Cloud: Industry Applications", caption_style))
-    
-    story.append(PageBreak())
-    
-    # Digital Twins Section
-    story.append(Paragraph("Spotlight: Digital Twins Revolution", heading_style))
-    
-    story.append(Paragraph("""
-    One of the most transformative themes at GTC 2025 was the emergence of digital twins as a 
-    cornerstone of industrial innovation. These virtual replicas of physical systems are enabling
-    unprecedented capabilities for design, optimization, and real-time monitoring across industries.
-    """, body_style))
-    
-    # Add digital twins word cloud if available
-    dt_wordcloud_path = os.path.join(output_dir, "wordcloud_digital_twins_simulation.png")
-    if os.path.exists(dt_wordcloud_path):
-        img = Image(dt_wordcloud_path, width=6.5*inch, height=3*inch)
-        story.append(img)
-        story.append(Spacer(1, 6))
-        story.append(Paragraph("Word Cloud: Digital Twins & Simulation Topics", caption_style))
-        story.append(Spacer(1, 12))
-    
-    # Applications table
-    dt_applications = [
-        ["Industry", "Application", "Impact"],
-        ["Manufacturing", "Factory Planning & Optimization", "30% increase in operational efficiency"],
-        ["Automotive", "Production Line Simulation", "Reduced downtime by 45%"],
-        ["Construction", "Infrastructure Digital Twins", "20% cost reduction in project planning"],
-        ["Retail", "Store Layout Optimization", "15% increase in customer engagement"],
-        ["Healthcare", "Surgical Simulation", "Improved patient outcomes by 25%"]
-    ]
-    
-    dt_table = Table(dt_applications, colWidths=[1.5*inch, 2.5*inch, 2.5*inch])
-    dt_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), NVIDIA_GREEN),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-        ('FONTSIZE', (0, 0), (-1, 0), 12),
-        ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-        ('BACKGROUND', (0, 1), (-1, -1), LIGHT_GRAY),
-        ('TEXTCOLOR', (0, 1), (-1, -1), DARK_GRAY),
-        ('FONTSIZE', (0, 1), (-1, -1), 10),
-        ('GRID', (0, 0), (-1, -1), 1, NVIDIA_GREEN)
-    ]))
-    
-    story.append(dt_table)
-    story.append(PageBreak())
-    
-    # Future Outlook
-    story.append(Paragraph("Future Outlook & Implications", heading_style))
-    
-    story.append(Paragraph("""
-    The convergence of AI, digital twins, and accelerated computing at GTC 2025 signals a 
-    fundamental shift in how industries leverage technology. These technologies are not just 
-    transforming individual processes but entire business models and value chains.
-    """, body_style))
-    
-    story.append(Paragraph("""
-    <b>Key Future Implications:</b>
-    """, body_style))
-    
-    implications = [
-        "Organizations that successfully integrate AI and digital twins will establish significant competitive advantages",
-        "The line between physical and digital will continue to blur, creating new possibilities for innovation",
-        "Talent with expertise in these technologies will be increasingly valuable across all sectors",
-        "New business models will emerge that leverage real-time data and predictive capabilities",
-        "Cross-industry collaboration will accelerate to solve complex challenges"
-    ]
-    
-    for implication in implications:
-        story.append(Paragraph(f"• {implication}", body_style))
-    
-    story.append(Spacer(1, 24))
-    
-    story.append(Paragraph("""
-    <i>As these technologies mature, we can expect to see increasingly sophisticated applications
-    that combine multiple AI modalities with simulation capabilities, creating unprecedented
-    opportunities for innovation and efficiency gains. The organizations that successfully
-    integrate these technologies into their operations will likely establish significant
-    competitive advantages in their respective markets.</i>
-    """, emphasis_style))
-    
-    # Build PDF with page numbers
-    doc.build(story, canvasmaker=PageNumCanvas)
-    
-    print(f"Enhanced narrative document created: {output_file}")
+    for block in document.blocks:
+        if isinstance(block, model.Cover):
+            story.append(Paragraph(escape(block.title), styles['title']))
+            story.append(Spacer(1, 12))
+            if block.subtitle:
+                story.append(Paragraph(escape(block.subtitle), styles['subtitle']))
+            story.append(Spacer(1, 36))
+            if block.figure:
+                story.extend(_pdf_figure(block.figure, styles, image_dpi, charts))
+            if block.date:
+                story.append(Spacer(1, 18))
+                story.append(Paragraph(escape(block.date), styles['body']))
+        elif isinstance(block, model.Heading):
+            style = styles['heading'] if block.level == 1 else styles['subheading']
+            story.append(Paragraph(escape(block.text), style))
+        elif isinstance(block, model.Paragraph):
+            if block.style == 'emphasis':
+                story.append(Spacer(1, 12))
+            story.append(Paragraph(block.text, styles[block.style]))
+        elif isinstance(block, model.BulletList):
+            story.extend(Paragraph(f"• {item}", styles['body']) for item in block.items)
+            story.append(Spacer(1, 12))
+        elif isinstance(block, model.Table):
+            table = Table(block.rows, colWidths=[width*inch for width in block.widths] if block.widths else None)
+            table.setStyle(_table_style(block.style))
+            story.append(table)
+            story.append(Spacer(1, 18))
+        elif isinstance(block, model.Figure):
+            story.extend(_pdf_figure(block, styles, image_dpi, charts))
+        elif isinstance(block, model.PageBreak):
+            story.append(PageBreak())
+
+    doc = SimpleDocTemplate(
+        output_file,
+        pagesize=letter,
+        rightMargin=0.5*inch,
+        leftMargin=0.5*inch,
+        topMargin=0.75*inch,
+        bottomMargin=0.75*inch,
+        title=document.title
+    )
+    with stage("doc.build"):
+        doc.build(story, canvasmaker=PageNumCanvas)
+
+
+def create_enhanced_narrative(image_dpi=DEFAULT_DPI, charts="vector", formats=tuple(OUTPUT_FILES)):
+    """Create the enhanced narrative document with visualizations in each of formats.
+
+    The analysis output is loaded and the document model built once; the
+    renderers then run side by side. With charts="vector" the PDF draws the
+    bar charts with reportlab from the analysis JSON; with charts="raster"
+    the matplotlib PNGs are embedded. Images are embedded from a cache of
+    copies downsampled to their placed size at image_dpi rather than from
+    the 300-dpi analysis output.
+    """
+    # Load insights data
+    with stage("load_insights"):
+        artifacts = load_artifacts()
+        insights, trends = artifacts.insights, artifacts.trends
+
+    with stage("build_document"):
+        document = build_narrative_document(insights, trends)
+
+    renderers = {
+        "pdf": lambda document, output_file: render_pdf(document, output_file, image_dpi, charts),
+        "html": model.write_html,
+        "markdown": model.write_markdown,
+    }
+    # The PDF is built on this thread so its doc.build stage can be profiled;
+    # the HTML and Markdown are written alongside it
+    with stage("render"):
+        timings = model.render_document(
+            document, {OUTPUT_FILES[name]: renderers[name] for name in formats},
+            main_thread={OUTPUT_FILES["pdf"]}
+        )
+
+    for output_file, seconds in timings.items():
+        print(f"Enhanced narrative created: {output_file} ({seconds:.2f}s)")
 
 if __name__ == "__main__":
-    create_enhanced_narrative() 
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Create the enhanced GTC 2025 narrative as PDF, HTML and Markdown.")
+    parser.add_argument("--image-dpi", type=int, default=DEFAULT_DPI,
+                        help=f"Resolution of the embedded images at their placed size (default: {DEFAULT_DPI})")
+    parser.add_argument("--charts", choices=["vector", "raster"], default="vector",
+                        help="Draw the bar charts with reportlab (vector) or embed the matplotlib PNGs "
+                             "(raster); default: vector")
+    parser.add_argument("--formats", default=",".join(OUTPUT_FILES),
+                        help=f"Comma-separated formats to render (default: {','.join(OUTPUT_FILES)})")
+    add_report_arguments(parser)
+    args = parser.parse_args()
+
+    formats = [name.strip() for name in args.formats.split(",")]
+    for name in formats:
+        if name not in OUTPUT_FILES:
+            parser.error(f"unknown format {name!r} (choose from {', '.join(OUTPUT_FILES)})")
+
+    with RunReport.from_args("create_enhanced_narrative", args):
+        create_enhanced_narrative(image_dpi=args.image_dpi, charts=args.charts, formats=formats)
@@ -2,23 +2,20 @@ from reportlab.lib import colors
 from reportlab.lib.pagesizes import letter, landscape
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.units import inch
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, Image, PageBreak
+from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, Image, PageBreak
 from reportlab.pdfbase import pdfmetrics
 from reportlab.pdfbase.ttfonts import TTFont
 import os
+import argparse
+from functools import lru_cache
 
-def create_gtc_documentation():
-    # Create PDF document
-    doc = SimpleDocTemplate(
-        "GTC_2025_Documentation.pdf",
-        pagesize=letter,
-        rightMargin=72,
-        leftMargin=72,
-        topMargin=72,
-        bottomMargin=72
-    )
-    
-    # Get styles
+from run_report import RunReport, add_report_arguments, stage
+from page_furniture import grid_table_style
+from analysis_artifacts import load_artifacts
+
+@lru_cache(maxsize=None)
+def _styles():
+    """The documentation's paragraph styles, built once per process."""
     styles = getSampleStyleSheet()
     title_style = ParagraphStyle(
         'CustomTitle',
@@ -42,6 +39,21 @@ def create_gtc_documentation():
         spaceAfter=12
     )
     
+    return title_style, heading_style, body_style
+
+def create_gtc_documentation():
+    # Create PDF document
+    doc = SimpleDocTemplate(
+        "GTC_2025_Documentation.pdf",
+        pagesize=letter,
+        rightMargin=72,
+        leftMargin=72,
+        topMargin=72,
+        bottomMargin=72
+    )
+    
+    title_style, heading_style, body_style = _styles()
+    
     # Story elements
     story = []
     
@@ -67,27 +79,23 @@ def create_gtc_documentation():
     
     # Key Themes
     story.append(Paragraph("Key Themes", heading_style))
+    artifacts = load_artifacts()
     themes = [
         ["Theme", "Description"],
-        ["AI & Machine Learning", "601 sessions covering foundational models, LLMs, and AI applications"],
+        ["AI & Machine Learning",
+         f"{artifacts.category_count('AI & Machine Learning')} sessions covering foundational models, LLMs, and AI applications"],
         ["Digital Twins & Simulation", "Advanced simulation and digital twin technologies"],
-        ["Hardware & Infrastructure", "142 sessions on next-gen computing infrastructure"],
-        ["Industry Applications", "33 sessions on real-world AI implementations"],
-        ["Robotics & Autonomous Systems", "31 sessions on autonomous technologies"]
+        ["Hardware & Infrastructure",
+         f"{artifacts.category_count('Hardware & Infrastructure')} sessions on next-gen computing infrastructure"],
+        ["Industry Applications",
+         f"{artifacts.category_count('Industry Applications')} sessions on real-world AI implementations"],
+        ["Robotics & Autonomous Systems",
+         f"{artifacts.category_count('Robotics & Autonomous Systems')} sessions on autonomous technologies"]
     ]
     
     t = Table(themes, colWidths=[2*inch, 4*inch])
-    t.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-        ('FONTSIZE', (0, 0), (-1, 0), 14),
-        ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-        ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
-        ('TEXTCOLOR', (0, 1), (-1, -1), colors.black),
-        ('FONTSIZE', (0, 1), (-1, -1), 12),
-        ('GRID', (0, 0), (-1, -1), 1, colors.black)
-    ]))
+    t.setStyle(grid_table_style(colors.grey, colors.beige, colors.black, header_font_size=14, body_font_size=12,
+                                header_text_color=colors.whitesmoke))
     story.append(t)
     story.append(PageBreak())
     
@@ -111,17 +119,8 @@ def create_gtc_documentation():
     ]
     
     t = Table(apps, colWidths=[1.5*inch, 2*inch, 2.5*inch])
-    t.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-        ('FONTSIZE', (0, 0), (-1, 0), 12),
-        ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-        ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
-        ('TEXTCOLOR', (0, 1), (-1, -1), colors.black),
-        ('FONTSIZE', (0, 1), (-1, -1), 10),
-        ('GRID', (0, 0), (-1, -1), 1, colors.black)
-    ]))
+    t.setStyle(grid_table_style(colors.grey, colors.beige, colors.black, header_font_size=12, body_font_size=10,
+                                header_text_color=colors.whitesmoke))
     story.append(t)
     story.append(PageBreak())
     
@@ -135,7 +134,13 @@ def create_gtc_documentation():
     """, body_style))
     
     # Build PDF
-    doc.build(story)
+    with stage("doc.build"):
+        doc.build(story)
 
 if __name__ == "__main__":
-    create_gtc_documentation() 
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Create the GTC 2025 documentation PDF.")
+    add_report_arguments(parser)
+    args = parser.parse_args()
+    
+    with RunReport.from_args("create_gtc_documentation", args):
+        create_gtc_documentation() 
\ No newline at end of file
@@ -2,23 +2,32 @@ from reportlab.lib import colors
 from reportlab.lib.pagesizes import letter
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.units import inch
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, PageBreak
+from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, PageBreak
 from reportlab.pdfbase import pdfmetrics
 from reportlab.pdfbase.ttfonts import TTFont
 import os
+import argparse
+from functools import lru_cache
 
-def create_gtc_narrative():
-    # Create PDF document
-    doc = SimpleDocTemplate(
-        "GTC_2025_Narrative.pdf",
-        pagesize=letter,
-        rightMargin=72,
-        leftMargin=72,
-        topMargin=72,
-        bottomMargin=72
-    )
-    
-    # Get styles
+from run_report import RunReport, add_report_arguments, stage
+from page_furniture import grid_table_style
+from analysis_artifacts import load_artifacts
+
+NVIDIA_GREEN = colors.HexColor('#76B900')  # NVIDIA green
+LIGHT_GRAY = colors.HexColor('#F5F5F5')
+
+# Themes in the order they are presented; session counts come from the analysis
+THEME_IMPACTS = [
+    ("AI & Machine Learning", "Revolutionizing industries with LLMs and foundation models"),
+    ("Digital Twins & Simulation", "Bridging physical and digital worlds"),
+    ("Hardware & Infrastructure", "Powering the next generation of computing"),
+    ("Industry Applications", "Real-world transformation across sectors"),
+    ("Robotics & Autonomous Systems", "Shaping the future of automation"),
+]
+
+@lru_cache(maxsize=None)
+def _styles():
+    """The narrative's paragraph styles, built once per process."""
     styles = getSampleStyleSheet()
     title_style = ParagraphStyle(
         'CustomTitle',
@@ -26,7 +35,7 @@ def create_gtc_narrative():
         fontSize=28,
         spaceAfter=30,
         alignment=1,
-        textColor=colors.HexColor('#76B900')  # NVIDIA green
+        textColor=NVIDIA_GREEN
     )
     
     subtitle_style = ParagraphStyle(
@@ -43,7 +52,7 @@ def create_gtc_narrative():
         parent=styles['Heading2'],
         fontSize=18,
         spaceAfter=12,
-        textColor=colors.HexColor('#76B900')
+        textColor=NVIDIA_GREEN
     )
     
     body_style = ParagraphStyle(
@@ -54,6 +63,22 @@ def create_gtc_narrative():
         leading=16
     )
     
+    return title_style, subtitle_style, heading_style, body_style
+
+def create_gtc_narrative():
+    # Create PDF document
+    doc = SimpleDocTemplate(
+        "GTC_2025_Narrative.pdf",
+        pagesize=letter,
+        rightMargin=72,
+        leftMargin=72,
+        topMargin=72,
+        bottomMargin=72
+    )
+    
+    title_style, subtitle_style, heading_style, body_style = _styles()
+    artifacts = load_artifacts()
+    
     # Story elements
     story = []
     
@@ -79,34 +104,20 @@ def create_gtc_narrative():
     
     # Key Themes
     story.append(Paragraph("The Pillars of Innovation", heading_style))
-    story.append(Paragraph("""
-    The conference unfolded across 1,115 sessions, each a testament to the rapid evolution of 
-    technology. The sheer scale of innovation was staggering, with AI and machine learning 
-    dominating the landscape with 601 sessions. But this was more than just a numbers game—it 
-    was about the transformative power of these technologies across every industry.
+    story.append(Paragraph(f"""
+    The conference unfolded across {artifacts.session_count:,} sessions, each a testament to the rapid 
+    evolution of technology. The sheer scale of innovation was staggering, with AI and machine 
+    learning dominating the landscape with {artifacts.category_count("AI & Machine Learning")} sessions. But this was more than 
+    just a numbers game—it was about the transformative power of these technologies across 
+    every industry.
     """, body_style))
     
-    themes = [
-        ["Theme", "Sessions", "Impact"],
-        ["AI & Machine Learning", "601", "Revolutionizing industries with LLMs and foundation models"],
-        ["Digital Twins & Simulation", "5", "Bridging physical and digital worlds"],
-        ["Hardware & Infrastructure", "142", "Powering the next generation of computing"],
-        ["Industry Applications", "33", "Real-world transformation across sectors"],
-        ["Robotics & Autonomous Systems", "31", "Shaping the future of automation"]
+    themes = [["Theme", "Sessions", "Impact"]] + [
+        [theme, str(artifacts.category_count(theme)), impact] for theme, impact in THEME_IMPACTS
     ]
     
     t = Table(themes, colWidths=[2*inch, 1*inch, 3*inch])
-    t.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#76B900')),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-        ('FONTSIZE', (0, 0), (-1, 0), 14),
-        ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-        ('BACKGROUND', (0, 1), (-1, -1), colors.HexColor('#F5F5F5')),
-        ('TEXTCOLOR', (0, 1), (-1, -1), colors.black),
-        ('FONTSIZE', (0, 1), (-1, -1), 12),
-        ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#76B900'))
-    ]))
+    t.setStyle(grid_table_style(NVIDIA_GREEN, LIGHT_GRAY, NVIDIA_GREEN, header_font_size=14, body_font_size=12))
     story.append(t)
     story.append(PageBreak())
     
@@ -136,17 +147,7 @@ def create_gtc_narrative():
     ]
     
     t = Table(apps, colWidths=[1.5*inch, 2*inch, 2.5*inch])
-    t.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#76B900')),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-        ('FONTSIZE', (0, 0), (-1, 0), 12),
-        ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-        ('BACKGROUND', (0, 1), (-1, -1), colors.HexColor('#F5F5F5')),
-        ('TEXTCOLOR', (0, 1), (-1, -1), colors.black),
-        ('FONTSIZE', (0, 1), (-1, -1), 10),
-        ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#76B900'))
-    ]))
+    t.setStyle(grid_table_style(NVIDIA_GREEN, LIGHT_GRAY, NVIDIA_GREEN, header_font_size=12, body_font_size=10))
     story.append(t)
     story.append(PageBreak())
     
@@ -173,7 +174,13 @@ def create_gtc_narrative():
     """, body_style))
     
     # Build PDF
-    doc.build(story)
+    with stage("doc.build"):
+        doc.build(story)
 
 if __name__ == "__main__":
-    create_gtc_narrative() 
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Create the GTC 2025 narrative PDF.")
+    add_report_arguments(parser)
+    args = parser.parse_args()
+    
+    with RunReport.from_args("create_gtc_narrative", args):
+        create_gtc_narrative() 
\ No newline at end of file
@@ -7,8 +7,14 @@ based on insights from GTC 2025.
 """
 
 import os
-import json
-import shutil
+import re
+import csv
+import argparse
+import tempfile
+import importlib.util
+from functools import lru_cache
+from xml.sax.saxutils import escape
+from concurrent.futures import ProcessPoolExecutor
 from reportlab.lib import colors
 from reportlab.lib.pagesizes import letter, A4, landscape
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
@@ -23,6 +29,11 @@ from reportlab.graphics.charts.piecharts import Pie
 from reportlab.graphics.charts.legends import Legend
 from reportlab.graphics import renderPDF
 
+from run_report import RunReport, add_report_arguments, stage
+from analysis_artifacts import ANALYSIS_DIR, load_artifacts
+from split_render import concatenate_pages
+from asset_store import DEFAULT_STORE_DIR, LINK_MODES, AssetStore, checkout, write_manifest
+
 # Define colors for personal brand
 PRIMARY_COLOR = colors.HexColor('#1E88E5')  # Blue
 SECONDARY_COLOR = colors.HexColor('#43A047')  # Green
@@ -30,44 +41,406 @@ ACCENT_COLOR = colors.HexColor('#FF5722')  # Orange
 DARK_GRAY = colors.HexColor('#333333')
 LIGHT_GRAY = colors.HexColor('#F5F5F5')
 
+# Parts of the package, in build order; each can also be built on its own
+PACKAGE_PARTS = ["one_pager", "social_media", "presentation", "visualizations", "readme"]
+
+DEFAULT_OUTPUT_DIR = "outputs/marketing_package"
+DEFAULT_BATCH_OUTPUT_DIR = "outputs/marketing_packages"
+
+KEY_ASSETS = [
+    "category_distribution.png",
+    "wordcloud_ai_machine_learning.png",
+    "wordcloud_digital_twins_simulation.png",
+    "wordcloud_industry_applications.png",
+    "keywords_ai_machine_learning.png"
+]
+
+class Persona:
+    """The person a package is made for: contact details and focus categories."""
+    
+    def __init__(self, name, email="", linkedin="", title="", focus=()):
+        self.name = name
+        self.email = email
+        self.linkedin = linkedin
+        self.title = title
+        self.focus = list(focus)
+    
+    @property
+    def slug(self):
+        """A directory name for the persona's package."""
+        return re.sub(r'[^a-z0-9]+', '_', self.name.lower()).strip('_') or "persona"
+    
+    @property
+    def contact_details(self):
+        return [detail for detail in (self.email, self.linkedin) if detail]
+
+def load_roster(roster_file):
+    """Read personas from a CSV roster.
+    
+    The columns are name, email, linkedin, title and focus, where focus
+    lists analysis categories separated by semicolons. Only name is required.
+    """
+    personas = []
+    with open(roster_file, 'r', encoding='utf-8', newline='') as f:
+        for row in csv.DictReader(f):
+            if not (row.get('name') or '').strip():
+                continue
+            focus = [category.strip() for category in (row.get('focus') or '').split(';') if category.strip()]
+            personas.append(Persona(row['name'].strip(), (row.get('email') or '').strip(),
+                                    (row.get('linkedin') or '').strip(), (row.get('title') or '').strip(),
+                                    focus))
+    return personas
+
+@lru_cache(maxsize=None)
+def presentation_styles():
+    """The presentation's paragraph styles, built once per process."""
+    styles = getSampleStyleSheet()
+    
+    # Create custom styles
+    title_style = ParagraphStyle(
+        'CustomTitle',
+        parent=styles['Heading1'],
+        fontSize=28,
+        spaceAfter=12,
+        textColor=PRIMARY_COLOR,
+        alignment=1  # Center alignment
+    )
+    
+    slide_title_style = ParagraphStyle(
+        'SlideTitle',
+        parent=styles['Heading2'],
+        fontSize=24,
+        spaceAfter=12,
+        textColor=PRIMARY_COLOR
+    )
+    
+    subheading_style = ParagraphStyle(
+        'CustomSubheading',
+        parent=styles['Heading3'],
+        fontSize=20,
+        spaceBefore=10,
+        spaceAfter=8,
+        textColor=DARK_GRAY
+    )
+    
+    body_style = ParagraphStyle(
+        'CustomBody',
+        parent=styles['Normal'],
+        fontSize=16,
+        spaceAfter=10,
+        leading=20
+    )
+    
+    note_style = ParagraphStyle(
+        'NoteStyle',
+        parent=styles['Italic'],
+        fontSize=10,
+        textColor=DARK_GRAY,
+        alignment=0
+    )
+    
+    return {
+        'title': title_style,
+        'slide_title': slide_title_style,
+        'subheading': subheading_style,
+        'body': body_style,
+        'note': note_style
+    }
+
+@lru_cache(maxsize=None)
+def one_pager_styles():
+    """The executive one-pager's paragraph styles, built once per process."""
+    styles = getSampleStyleSheet()
+    
+    # Create custom styles
+    title_style = ParagraphStyle(
+        'CustomTitle',
+        parent=styles['Heading1'],
+        fontSize=24,
+        spaceAfter=16,
+        textColor=PRIMARY_COLOR,
+        alignment=1  # Center alignment
+    )
+    
+    subtitle_style = ParagraphStyle(
+        'CustomSubtitle',
+        parent=styles['Heading2'],
+        fontSize=16,
+        spaceAfter=12,
+        textColor=DARK_GRAY,
+        alignment=1  # Center alignment
+    )
+    
+    heading_style = ParagraphStyle(
+        'CustomHeading',
+        parent=styles['Heading2'],
+        fontSize=14,
+        spaceBefore=12,
+        spaceAfter=6,
+        textColor=PRIMARY_COLOR
+    )
+    
+    body_style = ParagraphStyle(
+        'CustomBody',
+        parent=styles['Normal'],
+        fontSize=10,
+        spaceAfter=8,
+        leading=14
+    )
+    
+    highlight_style = ParagraphStyle(
+        'Highlight',
+        parent=body_style,
+        fontName='Helvetica-Bold',
+        textColor=SECONDARY_COLOR
+    )
+    
+    return {
+        'title': title_style,
+        'subtitle': subtitle_style,
+        'heading': heading_style,
+        'body': body_style,
+        'highlight': highlight_style
+    }
+
+@lru_cache(maxsize=None)
+def social_media_styles():
+    """The social media guide's paragraph styles, built once per process."""
+    styles = getSampleStyleSheet()
+    
+    # Create custom styles
+    title_style = ParagraphStyle(
+        'CustomTitle',
+        parent=styles['Heading1'],
+        fontSize=24,
+        spaceAfter=16,
+        textColor=PRIMARY_COLOR,
+        alignment=1  # Center alignment
+    )
+    
+    heading_style = ParagraphStyle(
+        'CustomHeading',
+        parent=styles['Heading2'],
+        fontSize=16,
+        spaceBefore=12,
+        spaceAfter=8,
+        textColor=PRIMARY_COLOR
+    )
+    
+    subheading_style = ParagraphStyle(
+        'CustomSubheading',
+        parent=styles['Heading3'],
+        fontSize=14,
+        spaceBefore=8,
+        spaceAfter=6,
+        textColor=SECONDARY_COLOR
+    )
+    
+    body_style = ParagraphStyle(
+        'CustomBody',
+        parent=styles['Normal'],
+        fontSize=11,
+        spaceAfter=8,
+        leading=14
+    )
+    
+    return {
+        'title': title_style,
+        'heading': heading_style,
+        'subheading': subheading_style,
+        'body': body_style
+    }
+
+def presentation_body_slides():
+    """The slides between the title and closing slides, which are the same in every package."""
+    styles = presentation_styles()
+    slide_title_style, body_style, note_style = styles['slide_title'], styles['body'], styles['note']
+    story = []
+    
+    # Agenda Slide
+    story.append(Paragraph("Agenda", slide_title_style))
+    story.append(Spacer(1, 20))
+    
+    agenda_items = [
+        "GTC 2025 Overview",
+        "Key Technology Trends",
+        "Industry Applications & Use Cases",
+        "Strategic Implications",
+        "Recommended Next Steps",
+        "Q&A"
+    ]
+    
+    for item in agenda_items:
+        story.append(Paragraph(f"• {item}", body_style))
+    
+    story.append(Spacer(1, 40))
+    story.append(Paragraph("[Note: Customize the agenda based on your audience and presentation focus.]", note_style))
+    story.append(PageBreak())
+    
+    # Conference Overview Slide
+    story.append(Paragraph("GTC 2025 Overview", slide_title_style))
+    story.append(Spacer(1, 20))
+    
+    overview_points = [
+        "NVIDIA's annual GPU Technology Conference",
+        f"{load_artifacts().session_count:,} sessions across multiple technology domains",
+        "Focus areas: AI/ML, accelerated computing, digital twins",
+        "Sessions from industry leaders, researchers, and developers",
+        "Showcasing state-of-the-art technology applications"
+    ]
+    
+    for point in overview_points:
+        story.append(Paragraph(f"• {point}", body_style))
+    
+    story.append(Spacer(1, 40))
+    story.append(Paragraph("[Note: Add specific numbers and notable speakers as appropriate.]", note_style))
+    story.append(PageBreak())
+    
+    # Key Trends Slide
+    story.append(Paragraph("Key Technology Trends", slide_title_style))
+    story.append(Spacer(1, 20))
+    
+    # Create a table for presenting trends
+    trends_data = [
+        ["Technology Area", "Key Trends"],
+        ["AI & Machine Learning", "LLMs evolving beyond text to multimodal applications"],
+        ["", "AI agents emerging as the next frontier in automation"],
+        ["Digital Twins", "Moving from simulation to real-time operational systems"],
+        ["", "Enabling predictive maintenance and optimization"],
+        ["Hardware", "Next-gen GPUs bringing significant performance improvements"],
+        ["", "Infrastructure designed specifically for AI workloads"]
+    ]
+    
+    trends_table = Table(trends_data, colWidths=[3*inch, 6*inch])
+    trends_table.setStyle(TableStyle([
+        ('BACKGROUND', (0, 0), (-1, 0), PRIMARY_COLOR),
+        ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
+        ('ALIGN', (0, 0), (-1, 0), 'CENTER'),
+        ('FONTSIZE', (0, 0), (-1, 0), 18),
+        ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+        ('GRID', (0, 0), (-1, -1), 1, LIGHT_GRAY),
+        ('SPAN', (0, 1), (0, 2)),
+        ('SPAN', (0, 3), (0, 4)),
+        ('SPAN', (0, 5), (0, 6)),
+        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+        ('FONTSIZE', (0, 1), (-1, -1), 16)
+    ]))
+    
+    story.append(trends_table)
+    story.append(Spacer(1, 40))
+    story.append(Paragraph("[Note: Customize the trends based on your industry focus.]", note_style))
+    story.append(PageBreak())
+    
+    # Industry Applications Slide
+    story.append(Paragraph("Industry Applications & Use Cases", slide_title_style))
+    story.append(Spacer(1, 10))
+    
+    # Create a two-column layout for industry applications
+    industry_data = [
+        ["Industry", "Use Cases", "Impact"],
+        ["Healthcare", "AI-driven diagnostics, drug discovery", "Faster treatments, reduced costs"],
+        ["Manufacturing", "Digital twins for production lines", "45% reduction in downtime"],
+        ["Financial Services", "LLMs for risk assessment", "Improved accuracy, reduced fraud"],
+        ["Retail", "Computer vision, generative AI", "Enhanced customer experiences"]
+    ]
+    
+    industry_table = Table(industry_data, colWidths=[2*inch, 3.5*inch, 3.5*inch])
+    industry_table.setStyle(TableStyle([
+        ('BACKGROUND', (0, 0), (-1, 0), PRIMARY_COLOR),
+        ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
+        ('ALIGN', (0, 0), (-1, 0), 'CENTER'),
+        ('FONTSIZE', (0, 0), (-1, 0), 18),
+        ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+        ('GRID', (0, 0), (-1, -1), 1, LIGHT_GRAY),
+        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+        ('FONTSIZE', (0, 1), (-1, -1), 16)
+    ]))
+    
+    story.append(industry_table)
+    story.append(Spacer(1, 40))
+    story.append(Paragraph("[Note: Focus on the industries most relevant to your audience.]", note_style))
+    story.append(PageBreak())
+    
+    # Strategic Implications Slide
+    story.append(Paragraph("Strategic Implications", slide_title_style))
+    story.append(Spacer(1, 20))
+    
+    implications = [
+        "AI is transitioning from experimental to mission-critical",
+        "Organizations must develop AI literacy across all functions",
+        "Digital twins offer unprecedented operational visibility",
+        "Technology integration capabilities are becoming a key differentiator",
+        "Cross-industry collaboration is accelerating innovation"
+    ]
+    
+    for implication in implications:
+        story.append(Paragraph(f"• {implication}", body_style))
+    
+    story.append(Spacer(1, 40))
+    story.append(Paragraph("[Note: Tailor implications to your organization's specific context.]", note_style))
+    story.append(PageBreak())
+    
+    # Recommended Next Steps Slide
+    story.append(Paragraph("Recommended Next Steps", slide_title_style))
+    story.append(Spacer(1, 20))
+    
+    next_steps = [
+        "Evaluate current AI and digital twin capabilities",
+        "Identify high-impact use cases for immediate implementation",
+        "Develop a talent strategy to build necessary expertise",
+        "Create cross-functional teams to drive technology adoption",
+        "Establish partnerships with technology providers"
+    ]
+    
+    for step in next_steps:
+        story.append(Paragraph(f"• {step}", body_style))
+    
+    story.append(Spacer(1, 40))
+    story.append(Paragraph("[Note: Customize these steps based on your organization's maturity and goals.]", note_style))
+    story.append(PageBreak())
+    
+    return story
+
+def build_presentation(output_file, story):
+    """Lay out presentation slides in the landscape slide format."""
+    # Create PDF document in landscape orientation
+    doc = SimpleDocTemplate(
+        output_file,
+        pagesize=landscape(letter),
+        rightMargin=0.5*inch,
+        leftMargin=0.5*inch,
+        topMargin=0.5*inch,
+        bottomMargin=0.5*inch,
+    )
+    doc.build(story)
+
 class MarketingPackageGenerator:
-    """Class to generate a marketing package based on GTC insights."""
+    """Class to generate a marketing package based on GTC insights.
     
-    def __init__(self):
-        self.output_dir = "outputs/marketing_package"
-        self.analysis_dir = "outputs/analysis_output"
-        
-        # Create output directory if it doesn't exist
-        if not os.path.exists(self.output_dir):
-            os.makedirs(self.output_dir)
-        
-        # Load insights data
-        insights_path = os.path.join(self.analysis_dir, "gtc_insights.json")
-        if os.path.exists(insights_path):
-            with open(insights_path, "r") as f:
-                self.insights = json.load(f)
-        else:
-            self.insights = {
-                "top_categories": [
-                    ["AI & Machine Learning", 624],
-                    ["Hardware & Infrastructure", 155],
-                    ["Software & Development", 100],
-                    ["Computer Vision & Graphics", 56],
-                    ["Miscellaneous & Other Topics", 56]
-                ],
-                "emerging_trends": [
-                    "Large Language Models continue to dominate AI discussions",
-                    "Digital Twins are becoming central to industry transformation",
-                    "AI Agents are emerging as the next frontier in automation",
-                    "Multimodal AI is expanding beyond text-only applications"
-                ],
-                "industry_focus": [
-                    "Healthcare and life sciences see strong representation in AI applications",
-                    "Manufacturing transformation through digital twins is a key theme",
-                    "Financial services focus on AI for risk management and customer experience",
-                    "Retail industry embracing computer vision and generative AI"
-                ]
-            }
+    Without a persona the package carries placeholder contact details for
+    the reader to fill in.
+    """
+    
+    def __init__(self, persona=None, output_dir=DEFAULT_OUTPUT_DIR, asset_mode="hardlink",
+                 store_dir=DEFAULT_STORE_DIR):
+        self.persona = persona
+        self.output_dir = output_dir
+        self.analysis_dir = ANALYSIS_DIR
+        # Visualizations are kept once in the asset store and linked into the package
+        self.asset_mode = asset_mode
+        self.asset_store = AssetStore(store_dir)
+        
+        # Create output directory if it doesn't exist (several documents may be
+        # built at once in separate processes)
+        os.makedirs(self.output_dir, exist_ok=True)
+        
+        # Analysis output, loaded when first needed and shared with the other
+        # report generators in this process
+        self.artifacts = load_artifacts(self.analysis_dir)
+    
+    @property
+    def insights(self):
+        return self.artifacts.insights
     
     def create_one_pager(self):
         """Create a one-page executive summary for personal branding."""
@@ -83,51 +456,9 @@ class MarketingPackageGenerator:
             bottomMargin=0.75*inch,
         )
         
-        # Get styles
-        styles = getSampleStyleSheet()
-        
-        # Create custom styles
-        title_style = ParagraphStyle(
-            'CustomTitle',
-            parent=styles['Heading1'],
-            fontSize=24,
-            spaceAfter=16,
-            textColor=PRIMARY_COLOR,
-            alignment=1  # Center alignment
-        )
-        
-        subtitle_style = ParagraphStyle(
-            'CustomSubtitle',
-            parent=styles['Heading2'],
-            fontSize=16,
-            spaceAfter=12,
-            textColor=DARK_GRAY,
-            alignment=1  # Center alignment
-        )
-        
-        heading_style = ParagraphStyle(
-            'CustomHeading',
-            parent=styles['Heading2'],
-            fontSize=14,
-            spaceBefore=12,
-            spaceAfter=6,
-            textColor=PRIMARY_COLOR
-        )
-        
-        body_style = ParagraphStyle(
-            'CustomBody',
-            parent=styles['Normal'],
-            fontSize=10,
-            spaceAfter=8,
-            leading=14
-        )
-        
-        highlight_style = ParagraphStyle(
-            'Highlight',
-            parent=body_style,
-            fontName='Helvetica-Bold',
-            textColor=SECONDARY_COLOR
-        )
+        styles = one_pager_styles()
+        title_style, subtitle_style, heading_style = styles['title'], styles['subtitle'], styles['heading']
+        body_style, highlight_style = styles['body'], styles['highlight']
         
         # Story elements
         story = []
@@ -138,17 +469,19 @@ class MarketingPackageGenerator:
         story.append(Spacer(1, 10))
         
         # Introduction
-        story.append(Paragraph("""
-        As a technology leader focused on emerging technologies, I attended NVIDIA's 
+        focus = escape(", ".join(self.persona.focus)) if self.persona and self.persona.focus else "emerging technologies"
+        story.append(Paragraph(f"""
+        As a technology leader focused on {focus}, I attended NVIDIA's 
         GTC 2025 to identify key trends and opportunities that will shape the future 
         of AI, digital twins, and accelerated computing. This executive summary highlights 
-        the most significant insights from my analysis of over 1300 conference sessions.
+        the most significant insights from my analysis of {self.artifacts.session_count:,} conference sessions.
         """, body_style))
         
-        # Create horizontal bar chart for top categories
+        # Create horizontal bar chart for top categories, plus the persona's focus categories
+        categories = self._chart_categories()
         drawing = Drawing(400, 150)
         data = [
-            [cat[1] for cat in self.insights["top_categories"][:5]]
+            [count for _, count in categories]
         ]
         
         bc = VerticalBarChart()
@@ -165,8 +498,12 @@ class MarketingPackageGenerator:
         bc.categoryAxis.labels.dx = -8
         bc.categoryAxis.labels.dy = -2
         bc.categoryAxis.labels.angle = 30
-        bc.categoryAxis.categoryNames = [cat[0].replace(' & ', '\n') for cat in self.insights["top_categories"][:5]]
+        bc.categoryAxis.categoryNames = [category.replace(' & ', '\n') for category, _ in categories]
         bc.bars[0].fillColor = PRIMARY_COLOR
+        if self.persona:
+            for number, (category, _) in enumerate(categories):
+                if category in self.persona.focus:
+                    bc.bars[(0, number)].fillColor = ACCENT_COLOR
         
         drawing.add(bc)
         story.append(drawing)
@@ -229,12 +566,26 @@ class MarketingPackageGenerator:
         
         # Contact Information
         story.append(Paragraph("For more insights or to discuss these trends in detail:", body_style))
-        story.append(Paragraph("Your Name | your.email@example.com | linkedin.com/in/yourprofile", body_style))
+        if self.persona:
+            contact = " | ".join([self.persona.name] + self.persona.contact_details)
+        else:
+            contact = "Your Name | your.email@example.com | linkedin.com/in/yourprofile"
+        story.append(Paragraph(escape(contact), body_style))
         
         # Build PDF
-        doc.build(story)
+        with stage("doc.build"):
+            doc.build(story)
         print(f"Created one-page executive summary: {output_file}")
     
+    def _chart_categories(self):
+        """(category, sessions) for the one-pager chart: the top five, then any other focus categories."""
+        categories = [tuple(cat) for cat in self.insights["top_categories"][:5]]
+        if self.persona:
+            shown = {category for category, _ in categories}
+            categories += [(category, self.artifacts.category_count(category)) for category in self.persona.focus
+                           if category not in shown]
+        return categories
+    
     def create_social_media_content(self):
         """Create social media content based on GTC insights."""
         output_file = os.path.join(self.output_dir, "Social_Media_Content_Guide.pdf")
@@ -249,44 +600,9 @@ class MarketingPackageGenerator:
             bottomMargin=0.75*inch,
         )
         
-        # Get styles
-        styles = getSampleStyleSheet()
-        
-        # Create custom styles
-        title_style = ParagraphStyle(
-            'CustomTitle',
-            parent=styles['Heading1'],
-            fontSize=24,
-            spaceAfter=16,
-            textColor=PRIMARY_COLOR,
-            alignment=1  # Center alignment
-        )
-        
-        heading_style = ParagraphStyle(
-            'CustomHeading',
-            parent=styles['Heading2'],
-            fontSize=16,
-            spaceBefore=12,
-            spaceAfter=8,
-            textColor=PRIMARY_COLOR
-        )
-        
-        subheading_style = ParagraphStyle(
-            'CustomSubheading',
-            parent=styles['Heading3'],
-            fontSize=14,
-            spaceBefore=8,
-            spaceAfter=6,
-            textColor=SECONDARY_COLOR
-        )
-        
-        body_style = ParagraphStyle(
-            'CustomBody',
-            parent=styles['Normal'],
-            fontSize=11,
-            spaceAfter=8,
-            leading=14
-        )
+        styles = social_media_styles()
+        title_style, heading_style = styles['title'], styles['heading']
+        subheading_style, body_style = styles['subheading'], styles['body']
         
         # Story elements
         story = []
@@ -308,9 +624,9 @@ class MarketingPackageGenerator:
         
         # Post 1: Overall Conference Summary
         story.append(Paragraph("Post 1: Overall Conference Summary", subheading_style))
-        story.append(Paragraph("""
+        story.append(Paragraph(f"""
         <b>Just returned from #NVIDIGTC 2025</b> where the convergence of AI, digital twins, and 
-        accelerated computing was on full display across 1300+ sessions. Here are my top 3 takeaways:
+        accelerated computing was on full display across {self.artifacts.session_count:,} sessions. Here are my top 3 takeaways:
         
         1️⃣ <b>AI Evolution:</b> Large Language Models are evolving beyond text to become multimodal, 
         with applications spanning industries from healthcare to manufacturing
@@ -369,10 +685,12 @@ class MarketingPackageGenerator:
         story.append(PageBreak())
         story.append(Paragraph("Twitter Post Templates", heading_style))
         
+        # Rounded down to the hundred, as in "600+ AI sessions"
+        ai_sessions = self.artifacts.category_count("AI & Machine Learning") // 100 * 100
         twitter_posts = [
             """<b>My top insight from #NVIDIGTC 2025:</b> Digital twins aren't just simulations anymore—they're becoming the central operating system for industries from manufacturing to healthcare, enabling real-time optimization and predictive capabilities. #DigitalTransformation""",
             
-            """Just wrapped up #NVIDIGTC 2025! The 600+ AI sessions made one thing clear: We're moving beyond foundation models to multimodal AI that combines text, vision, audio, and simulation for unprecedented capabilities. #AITrends #MachineLearning""",
+            f"""Just wrapped up #NVIDIGTC 2025! The {ai_sessions}+ AI sessions made one thing clear: We're moving beyond foundation models to multimodal AI that combines text, vision, audio, and simulation for unprecedented capabilities. #AITrends #MachineLearning""",
             
             """#NVIDIGTC 2025 Insight: The line between physical and digital continues to blur, with digital twins showing 30% operational efficiency improvements in manufacturing. This is no longer experimental—it's mainstream. #DigitalTwins #IndustryTransformation""",
             
@@ -466,70 +784,20 @@ class MarketingPackageGenerator:
             story.append(Paragraph(f"• {tip}", body_style))
         
         # Build PDF
-        doc.build(story)
+        with stage("doc.build"):
+            doc.build(story)
         print(f"Created social media content guide: {output_file}")
     
-    def create_presentation_template(self):
-        """Create a presentation template for sharing GTC insights."""
-        output_file = os.path.join(self.output_dir, "GTC_2025_Presentation_Template.pdf")
-        
-        # Create PDF document in landscape orientation
-        doc = SimpleDocTemplate(
-            output_file,
-            pagesize=landscape(letter),
-            rightMargin=0.5*inch,
-            leftMargin=0.5*inch,
-            topMargin=0.5*inch,
-            bottomMargin=0.5*inch,
-        )
-        
-        # Get styles
-        styles = getSampleStyleSheet()
-        
-        # Create custom styles
-        title_style = ParagraphStyle(
-            'CustomTitle',
-            parent=styles['Heading1'],
-            fontSize=28,
-            spaceAfter=12,
-            textColor=PRIMARY_COLOR,
-            alignment=1  # Center alignment
-        )
-        
-        slide_title_style = ParagraphStyle(
-            'SlideTitle',
-            parent=styles['Heading2'],
-            fontSize=24,
-            spaceAfter=12,
-            textColor=PRIMARY_COLOR
-        )
-        
-        subheading_style = ParagraphStyle(
-            'CustomSubheading',
-            parent=styles['Heading3'],
-            fontSize=20,
-            spaceBefore=10,
-            spaceAfter=8,
-            textColor=DARK_GRAY
-        )
-        
-        body_style = ParagraphStyle(
-            'CustomBody',
-            parent=styles['Normal'],
-            fontSize=16,
-            spaceAfter=10,
-            leading=20
-        )
-        
-        note_style = ParagraphStyle(
-            'NoteStyle',
-            parent=styles['Italic'],
-            fontSize=10,
-            textColor=DARK_GRAY,
-            alignment=0
-        )
-        
-        # Story elements
+    def _contact_lines(self):
+        """The persona's name and contact details, or placeholders for them."""
+        if self.persona:
+            return [self.persona.name] + self.persona.contact_details
+        return ["[Your Name]", "[Your Email]", "[Your LinkedIn/Social Media]"]
+    
+    def _presentation_title_slide(self):
+        styles = presentation_styles()
+        title_style, subheading_style = styles['title'], styles['subheading']
+        body_style, note_style = styles['body'], styles['note']
         story = []
         
         # Title Slide
@@ -537,154 +805,24 @@ class MarketingPackageGenerator:
         story.append(Spacer(1, 10))
         story.append(Paragraph("Key Insights & Industry Implications", subheading_style))
         story.append(Spacer(1, 100))
-        story.append(Paragraph("Presented by: [Your Name]", body_style))
-        story.append(Paragraph("[Your Title/Company]", body_style))
-        story.append(Paragraph("April 2025", body_style))
-        story.append(Spacer(1, 20))
-        story.append(Paragraph("[Note: This is a slide template. Replace with your details.]", note_style))
-        story.append(PageBreak())
-        
-        # Agenda Slide
-        story.append(Paragraph("Agenda", slide_title_style))
-        story.append(Spacer(1, 20))
-        
-        agenda_items = [
-            "GTC 2025 Overview",
-            "Key Technology Trends",
-            "Industry Applications & Use Cases",
-            "Strategic Implications",
-            "Recommended Next Steps",
-            "Q&A"
-        ]
-        
-        for item in agenda_items:
-            story.append(Paragraph(f"• {item}", body_style))
-        
-        story.append(Spacer(1, 40))
-        story.append(Paragraph("[Note: Customize the agenda based on your audience and presentation focus.]", note_style))
-        story.append(PageBreak())
-        
-        # Conference Overview Slide
-        story.append(Paragraph("GTC 2025 Overview", slide_title_style))
-        story.append(Spacer(1, 20))
-        
-        overview_points = [
-            "NVIDIA's annual GPU Technology Conference",
-            "1300+ sessions across multiple technology domains",
-            "Focus areas: AI/ML, accelerated computing, digital twins",
-            "Sessions from industry leaders, researchers, and developers",
-            "Showcasing state-of-the-art technology applications"
-        ]
-        
-        for point in overview_points:
-            story.append(Paragraph(f"• {point}", body_style))
-        
-        story.append(Spacer(1, 40))
-        story.append(Paragraph("[Note: Add specific numbers and notable speakers as appropriate.]", note_style))
-        story.append(PageBreak())
-        
-        # Key Trends Slide
-        story.append(Paragraph("Key Technology Trends", slide_title_style))
-        story.append(Spacer(1, 20))
-        
-        # Create a table for presenting trends
-        trends_data = [
-            ["Technology Area", "Key Trends"],
-            ["AI & Machine Learning", "LLMs evolving beyond text to multimodal applications"],
-            ["", "AI agents emerging as the next frontier in automation"],
-            ["Digital Twins", "Moving from simulation to real-time operational systems"],
-            ["", "Enabling predictive maintenance and optimization"],
-            ["Hardware", "Next-gen GPUs bringing significant performance improvements"],
-            ["", "Infrastructure designed specifically for AI workloads"]
-        ]
-        
-        trends_table = Table(trends_data, colWidths=[3*inch, 6*inch])
-        trends_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), PRIMARY_COLOR),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-            ('ALIGN', (0, 0), (-1, 0), 'CENTER'),
-            ('FONTSIZE', (0, 0), (-1, 0), 18),
-            ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-            ('GRID', (0, 0), (-1, -1), 1, LIGHT_GRAY),
-            ('SPAN', (0, 1), (0, 2)),
-            ('SPAN', (0, 3), (0, 4)),
-            ('SPAN', (0, 5), (0, 6)),
-            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-            ('FONTSIZE', (0, 1), (-1, -1), 16)
-        ]))
-        
-        story.append(trends_table)
-        story.append(Spacer(1, 40))
-        story.append(Paragraph("[Note: Customize the trends based on your industry focus.]", note_style))
-        story.append(PageBreak())
-        
-        # Industry Applications Slide
-        story.append(Paragraph("Industry Applications & Use Cases", slide_title_style))
-        story.append(Spacer(1, 10))
-        
-        # Create a two-column layout for industry applications
-        industry_data = [
-            ["Industry", "Use Cases", "Impact"],
-            ["Healthcare", "AI-driven diagnostics, drug discovery", "Faster treatments, reduced costs"],
-            ["Manufacturing", "Digital twins for production lines", "45% reduction in downtime"],
-            ["Financial Services", "LLMs for risk assessment", "Improved accuracy, reduced fraud"],
-            ["Retail", "Computer vision, generative AI", "Enhanced customer experiences"]
-        ]
-        
-        industry_table = Table(industry_data, colWidths=[2*inch, 3.5*inch, 3.5*inch])
-        industry_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), PRIMARY_COLOR),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-            ('ALIGN', (0, 0), (-1, 0), 'CENTER'),
-            ('FONTSIZE', (0, 0), (-1, 0), 18),
-            ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-            ('GRID', (0, 0), (-1, -1), 1, LIGHT_GRAY),
-            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-            ('FONTSIZE', (0, 1), (-1, -1), 16)
-        ]))
-        
-        story.append(industry_table)
-        story.append(Spacer(1, 40))
-        story.append(Paragraph("[Note: Focus on the industries most relevant to your audience.]", note_style))
-        story.append(PageBreak())
-        
-        # Strategic Implications Slide
-        story.append(Paragraph("Strategic Implications", slide_title_style))
-        story.append(Spacer(1, 20))
-        
-        implications = [
-            "AI is transitioning from experimental to mission-critical",
-            "Organizations must develop AI literacy across all functions",
-            "Digital twins offer unprecedented operational visibility",
-            "Technology integration capabilities are becoming a key differentiator",
-            "Cross-industry collaboration is accelerating innovation"
-        ]
-        
-        for implication in implications:
-            story.append(Paragraph(f"• {implication}", body_style))
-        
-        story.append(Spacer(1, 40))
-        story.append(Paragraph("[Note: Tailor implications to your organization's specific context.]", note_style))
-        story.append(PageBreak())
-        
-        # Recommended Next Steps Slide
-        story.append(Paragraph("Recommended Next Steps", slide_title_style))
-        story.append(Spacer(1, 20))
-        
-        next_steps = [
-            "Evaluate current AI and digital twin capabilities",
-            "Identify high-impact use cases for immediate implementation",
-            "Develop a talent strategy to build necessary expertise",
-            "Create cross-functional teams to drive technology adoption",
-            "Establish partnerships with technology providers"
-        ]
-        
-        for step in next_steps:
-            story.append(Paragraph(f"• {step}", body_style))
-        
-        story.append(Spacer(1, 40))
-        story.append(Paragraph("[Note: Customize these steps based on your organization's maturity and goals.]", note_style))
+        if self.persona:
+            story.append(Paragraph(f"Presented by: {escape(self.persona.name)}", body_style))
+            if self.persona.title:
+                story.append(Paragraph(escape(self.persona.title), body_style))
+            story.append(Paragraph("April 2025", body_style))
+        else:
+            story.append(Paragraph("Presented by: [Your Name]", body_style))
+            story.append(Paragraph("[Your Title/Company]", body_style))
+            story.append(Paragraph("April 2025", body_style))
+            story.append(Spacer(1, 20))
+            story.append(Paragraph("[Note: This is a slide template. Replace with your details.]", note_style))
         story.append(PageBreak())
+        return story
+    
+    def _presentation_closing_slide(self):
+        styles = presentation_styles()
+        slide_title_style, body_style = styles['slide_title'], styles['body']
+        story = []
         
         # Questions Slide
         story.append(Paragraph("Questions & Discussion", slide_title_style))
@@ -692,47 +830,68 @@ class MarketingPackageGenerator:
         
         story.append(Paragraph("Thank you!", body_style))
         story.append(Spacer(1, 20))
-        story.append(Paragraph("[Your Name]", body_style))
-        story.append(Paragraph("[Your Email]", body_style))
-        story.append(Paragraph("[Your LinkedIn/Social Media]", body_style))
-        
-        # Build PDF
-        doc.build(story)
-        print(f"Created presentation template: {output_file}")
+        for line in self._contact_lines():
+            story.append(Paragraph(escape(line), body_style))
+        return story
     
-    def copy_visualization_assets(self):
-        """Copy relevant visualization assets to the marketing package directory."""
-        key_assets = [
-            "category_distribution.png",
-            "wordcloud_ai_machine_learning.png",
-            "wordcloud_digital_twins_simulation.png",
-            "wordcloud_industry_applications.png",
-            "keywords_ai_machine_learning.png"
-        ]
+    def create_presentation_template(self, shared_slides=None):
+        """Create a presentation template for sharing GTC insights.
         
-        # Create visualizations directory
-        vis_dir = os.path.join(self.output_dir, "visualizations")
-        if not os.path.exists(vis_dir):
-            os.makedirs(vis_dir)
+        shared_slides is an already rendered PDF of presentation_body_slides();
+        with it only the title and closing slides are laid out here, and the
+        shared slides are copied in between them (this needs pypdf).
+        """
+        output_file = os.path.join(self.output_dir, "GTC_2025_Presentation_Template.pdf")
         
-        # Copy assets
-        for asset in key_assets:
+        if shared_slides:
+            own_slides = os.path.join(self.output_dir, ".presentation_own_slides.pdf")
+            with stage("doc.build"):
+                build_presentation(own_slides, self._presentation_title_slide() + self._presentation_closing_slide())
+            with stage("concatenate_pages"):
+                concatenate_pages([(own_slides, [0]), (shared_slides, None), (own_slides, [1])], output_file)
+            os.remove(own_slides)
+        else:
+            story = self._presentation_title_slide() + presentation_body_slides() + self._presentation_closing_slide()
+            with stage("doc.build"):
+                build_presentation(output_file, story)
+        print(f"Created presentation template: {output_file}")
+    
+    def store_visualization_assets(self):
+        """Add the key visualizations to the asset store; returns {file name: stored object}."""
+        assets = {}
+        for asset in KEY_ASSETS:
             src_path = os.path.join(self.analysis_dir, asset)
             if os.path.exists(src_path):
-                dst_path = os.path.join(vis_dir, asset)
-                shutil.copy2(src_path, dst_path)
-                print(f"Copied {asset} to marketing package")
+                assets[asset] = self.asset_store.add(src_path)
+        return assets
+    
+    def copy_visualization_assets(self):
+        """Link the relevant visualization assets into the marketing package directory."""
+        vis_dir = os.path.join(self.output_dir, "visualizations")
+        assets = self.store_visualization_assets()
+        place_assets(assets, vis_dir, self.asset_mode)
+        for asset in assets:
+            print(f"Added {asset} to marketing package ({self.asset_mode})")
     
-    def create_full_package(self):
-        """Create the complete marketing package."""
+    def create_full_package(self, parts=None):
+        """Create the complete marketing package, or only the given parts."""
         print("Generating GTC 2025 Personal Brand Marketing Package...")
+        builders = {
+            "one_pager": self.create_one_pager,
+            "social_media": self.create_social_media_content,
+            "presentation": self.create_presentation_template,
+            "visualizations": self.copy_visualization_assets,
+            "readme": self.write_readme
+        }
+        
+        for part in parts or PACKAGE_PARTS:
+            with stage(builders[part].__name__):
+                builders[part]()
         
-        self.create_one_pager()
-        self.create_social_media_content()
-        self.create_presentation_template()
-        self.copy_visualization_assets()
-        
-        # Create a README file for the package
+        print(f"\nMarketing package created successfully in the '{self.output_dir}' directory.")
+    
+    def write_readme(self):
+        """Create a README file for the package."""
         readme_path = os.path.join(self.output_dir, "README.md")
         with open(readme_path, "w") as f:
             f.write("""# GTC 2025 Personal Brand Marketing Package
@@ -760,13 +919,119 @@ This package contains materials to help you leverage your GTC 2025 insights for
 
 To update any of these materials or for further insights from GTC 2025, please contact:
 
-[Your Name]
-[Your Email]
-[Your LinkedIn/Social Media]
 """)
-        
-        print(f"\nMarketing package created successfully in the '{self.output_dir}' directory.")
+            f.write("\n".join(self._contact_lines()) + "\n")
+
+def place_assets(assets, directory, mode="hardlink"):
+    """Put stored assets ({file name: stored object}) into directory.
+    
+    In "manifest" mode the directory gets a manifest.json pointing at the
+    stored objects instead of the files themselves.
+    """
+    os.makedirs(directory, exist_ok=True)
+    for name, object_path in assets.items():
+        checkout(object_path, os.path.join(directory, name), mode)
+    if mode == "manifest":
+        write_manifest(directory, assets)
+
+def build_persona_package(job):
+    """Build one persona's package around the shared parts (a batch worker)."""
+    persona, package_dir, shared_documents, shared_visuals, shared_slides, asset_mode = job
+    generator = MarketingPackageGenerator(persona, package_dir)
+    generator.create_one_pager()
+    generator.create_presentation_template(shared_slides)
+    generator.write_readme()
+    
+    place_assets(shared_documents, package_dir, asset_mode)
+    place_assets(shared_visuals, os.path.join(package_dir, "visualizations"), asset_mode)
+    return package_dir
+
+def create_persona_packages(personas, output_dir=DEFAULT_BATCH_OUTPUT_DIR, workers=None,
+                            asset_mode="hardlink", store_dir=DEFAULT_STORE_DIR):
+    """Build a package for each persona in output_dir/<persona slug>.
+    
+    The parts that are the same for everyone (the social media guide, the
+    visualizations and the presentation slides between the title and
+    closing slides) are built once; the guide and visualizations are kept
+    in the asset store and linked into every package (asset_mode). Each
+    persona's one-pager, README and title and closing slides are then built
+    across a process pool (workers=1 builds them in this process). Without
+    pypdf the presentation is laid out in full for every persona.
+    """
+    known = load_artifacts().category_counts
+    for persona in personas:
+        unknown = [category for category in persona.focus if category not in known]
+        if unknown:
+            print(f"Warning: {persona.name} has unknown focus categories: {', '.join(unknown)}")
+    
+    # People with the same name get numbered directories
+    package_dirs = []
+    for persona in personas:
+        slug, number = persona.slug, 2
+        while os.path.join(output_dir, slug) in package_dirs:
+            slug, number = f"{persona.slug}_{number}", number + 1
+        package_dirs.append(os.path.join(output_dir, slug))
+    
+    os.makedirs(output_dir, exist_ok=True)
+    with tempfile.TemporaryDirectory(prefix=".shared_", dir=output_dir) as shared_dir:
+        with stage("shared_parts"):
+            shared = MarketingPackageGenerator(output_dir=shared_dir, store_dir=store_dir)
+            shared.create_social_media_content()
+            guide = "Social_Media_Content_Guide.pdf"
+            shared_documents = {guide: shared.asset_store.add(os.path.join(shared_dir, guide))}
+            shared_visuals = shared.store_visualization_assets()
+            shared_slides = None
+            if importlib.util.find_spec("pypdf") is not None:
+                shared_slides = os.path.join(shared_dir, "presentation_shared_slides.pdf")
+                build_presentation(shared_slides, presentation_body_slides())
+        
+        jobs = [(persona, package_dir, shared_documents, shared_visuals, shared_slides, asset_mode)
+                for persona, package_dir in zip(personas, package_dirs)]
+        print(f"Building {len(jobs)} persona packages...")
+        with stage("persona_packages"):
+            if workers == 1:
+                results = [build_persona_package(job) for job in jobs]
+            else:
+                with ProcessPoolExecutor(max_workers=workers or os.cpu_count()) as executor:
+                    results = list(executor.map(build_persona_package, jobs))
+    
+    print(f"\n{len(results)} marketing packages created in the '{output_dir}' directory.")
+    return results
 
 if __name__ == "__main__":
-    generator = MarketingPackageGenerator()
-    generator.create_full_package() 
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Create the GTC 2025 personal brand marketing package.")
+    parser.add_argument("--parts", default=",".join(PACKAGE_PARTS),
+                        help=f"Comma-separated parts to build (default: {','.join(PACKAGE_PARTS)})")
+    parser.add_argument("--roster",
+                        help="CSV of personas (name, email, linkedin, title, focus) to build one "
+                             "package each for, instead of the single template package")
+    parser.add_argument("--output-dir",
+                        help=f"Output directory (default: {DEFAULT_OUTPUT_DIR}, "
+                             f"or {DEFAULT_BATCH_OUTPUT_DIR} with --roster)")
+    parser.add_argument("--workers", type=int, default=0,
+                        help="Processes building persona packages (0 uses all cores, default: 0)")
+    parser.add_argument("--asset-mode", choices=LINK_MODES, default="hardlink",
+                        help="How shared assets are put into packages: hard links to the asset "
+                             "store, symbolic links, copies, or a manifest.json (default: hardlink)")
+    parser.add_argument("--asset-store", default=DEFAULT_STORE_DIR,
+                        help=f"Content-addressed asset store directory (default: {DEFAULT_STORE_DIR})")
+    add_report_arguments(parser)
+    args = parser.parse_args()
+    
+    parts = [part.strip() for part in args.parts.split(",")]
+    for part in parts:
+        if part not in PACKAGE_PARTS:
+            parser.error(f"unknown part {part!r} (choose from {', '.join(PACKAGE_PARTS)})")
+    if args.roster and parts != PACKAGE_PARTS:
+        parser.error("--parts can't be combined with --roster, which builds whole packages")
+    
+    with RunReport.from_args("create_marketing_package", args):
+        if args.roster:
+            personas = load_roster(args.roster)
+            create_persona_packages(personas, args.output_dir or DEFAULT_BATCH_OUTPUT_DIR,
+                                    workers=args.workers or None, asset_mode=args.asset_mode,
+                                    store_dir=args.asset_store)
+        else:
+            generator = MarketingPackageGenerator(output_dir=args.output_dir or DEFAULT_OUTPUT_DIR,
+                                                  asset_mode=args.asset_mode, store_dir=args.asset_store)
+            generator.create_full_package(parts) 
\ No newline at end of file
@@ -0,0 +1,489 @@
+#!/usr/bin/env python3
+"""
+GTC 2025 Session Catalog Generator
+----------------------------------
+Build a PDF catalog of every extracted session (code, title, abstract,
+speakers, time and room) grouped by category, with a table of contents
+and a speaker index. Sessions are streamed from the CSV into one
+temporary JSONL file per group, and the story is produced by a generator
+of flowables, so only the page being laid out is held in memory. With
+more than one worker, groups are split into sections that are laid out
+in parallel and merged (see split_render.py). CJK text is set in a
+CJK-capable font (see font_manager.py).
+"""
+
+import os
+import csv
+import argparse
+import tempfile
+from functools import lru_cache
+from itertools import groupby, islice
+from xml.sax.saxutils import escape
+
+from reportlab.lib import colors
+from reportlab.lib.pagesizes import letter
+from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+from reportlab.lib.units import inch
+from reportlab.platypus import (
+    BaseDocTemplate, PageTemplate, Frame, Paragraph, Spacer, PageBreak,
+    CondPageBreak, LongTable, TableStyle
+)
+from reportlab.platypus.tableofcontents import TableOfContents, SimpleIndex
+
+from font_manager import has_cjk, with_cjk_font
+from page_furniture import FurnitureCanvas
+from run_report import RunReport, add_report_arguments, stage
+from split_render import RecordingIndex, iter_placeholder_pages, merge_sections, render_sections
+from session_markdown import (
+    DEFAULT_CATEGORIES_FILE, SESSION_CODE_PATTERN, is_valid_time, load_category_lookup,
+    session_code_of, session_code_prefix
+)
+from session_store import JsonlSessionWriter, iter_jsonl_sessions
+
+NVIDIA_GREEN = colors.HexColor('#76B900')
+DARK_GRAY = colors.HexColor('#333333')
+LIGHT_GRAY = colors.HexColor('#F5F5F5')
+MID_GRAY = colors.HexColor('#999999')
+
+DEFAULT_CSV_FILE = "data/gtc_sessions_extracted.csv"
+DEFAULT_OUTPUT_FILE = "outputs/GTC_2025_Session_Catalog.pdf"
+
+# Rows per LongTable: small tables keep splitting cheap and memory flat
+TABLE_CHUNK_SIZE = 40
+# Long abstracts are cut so a single row always fits on a page
+ABSTRACT_LIMIT = 700
+# Sessions per section when rendering in parallel; each section starts a new page
+DEFAULT_SECTION_SIZE = 250
+COLUMN_WIDTHS = [0.8*inch, 3.6*inch, 1.8*inch, 1.3*inch]
+
+
+def iter_csv_sessions(csv_file):
+    """Yield sessions from the one-row-per-speaker CSV export, one at a time."""
+    with open(csv_file, 'r', encoding='utf-8', newline='') as f:
+        rows = csv.DictReader(f)
+        for _, session_rows in groupby(rows, key=lambda row: (row['session_code'], row['title'])):
+            session_rows = list(session_rows)
+            session = dict(session_rows[0])
+            session['speakers'] = [
+                {'name': row['speaker_name'], 'title_organization': row['speaker_title_org']}
+                for row in session_rows if row['speaker_name']
+            ]
+            yield session
+
+
+def group_sessions(sessions, group_key, work_dir):
+    """Spill sessions into one JSONL file per group; return {group: (path, count)}."""
+    writers = {}
+    try:
+        for session in sessions:
+            name = group_key(session)
+            if name not in writers:
+                path = os.path.join(work_dir, f"group_{len(writers)}.jsonl")
+                writers[name] = JsonlSessionWriter(path)
+            writers[name].write(session)
+    finally:
+        for writer in writers.values():
+            writer.close()
+    return {name: (writer.path, writer.completed) for name, writer in writers.items()}
+
+
+class LazyStory:
+    """A list-like window over a flowable generator for BaseDocTemplate.build().
+
+    build() only looks at, removes and re-inserts flowables at the front of
+    the story, so a short lookahead buffer is enough and flowables are
+    created just before they are laid out.
+    """
+
+    def __init__(self, flowables, lookahead=8):
+        self._source = iter(flowables)
+        self._buffer = []
+        self.lookahead = lookahead
+
+    def _fill(self, count):
+        while len(self._buffer) < count and self._source is not None:
+            try:
+                self._buffer.append(next(self._source))
+            except StopIteration:
+                self._source = None
+
+    def _fill_for(self, index):
+        if isinstance(index, slice):
+            self._fill(index.stop if index.stop is not None else self.lookahead)
+        else:
+            self._fill(index + 1)
+
+    def __len__(self):
+        self._fill(self.lookahead)
+        return len(self._buffer)
+
+    def __getitem__(self, index):
+        self._fill_for(index)
+        return self._buffer[index]
+
+    def __setitem__(self, index, value):
+        self._fill_for(index)
+        self._buffer[index] = value
+
+    def __delitem__(self, index):
+        self._fill_for(index)
+        del self._buffer[index]
+
+    def insert(self, index, value):
+        self._buffer.insert(index, value)
+
+
+class CatalogCanvas(FurnitureCanvas):
+    """Page header, footer and "Page X of Y" on every page but the cover."""
+
+    reserved_digits = 4
+
+    def draw_furniture(self):
+        self.setFillColor(MID_GRAY)
+        self.setStrokeColor(MID_GRAY)
+        self.setFont("Helvetica", 8)
+        self.drawString(0.5*inch, letter[1] - 0.4*inch, "NVIDIA GTC 2025 Session Catalog")
+        self.line(0.5*inch, 0.6*inch, letter[0] - 0.5*inch, 0.6*inch)
+
+    def draw_page_decorations(self):
+        if self._pageNumber > 1:
+            self.place_furniture()
+            self.setFillColor(MID_GRAY)
+            self.draw_page_number(letter[0] - 0.5*inch, 0.45*inch)
+
+
+# multiBuild() has no hook for a story that is regenerated on each pass, so
+# build_lazily() drives the passes itself through the private state
+# multiBuild() keeps on the document: _indexingFlowables (the flowables
+# build() notifies and _allSatisfied() checks) and _doSave (0 stops build()
+# saving the canvas after each pass). These two functions are the only
+# place that state is touched. Checked against reportlab 5.0.1; the pinned
+# 4.0.8's multiBuild() uses the same attributes. Re-check them when
+# upgrading reportlab.
+def _begin_multi_pass(doc, indexing_flowables):
+    """Prepare doc for repeated build() calls, as multiBuild() does; returns the indexing flowables."""
+    doc._indexingFlowables = list(indexing_flowables)
+    doc._doSave = 0
+    return doc._indexingFlowables
+
+
+def _multi_pass_satisfied(doc):
+    """Whether every indexing flowable has resolved its entries."""
+    return doc._allSatisfied()
+
+
+class CatalogDocTemplate(BaseDocTemplate):
+    """Letter-size document that lists section headings in the TOC and outline."""
+
+    def __init__(self, filename, **kwargs):
+        BaseDocTemplate.__init__(self, filename, pagesize=letter, leftMargin=0.5*inch,
+                                 rightMargin=0.5*inch, topMargin=0.6*inch, bottomMargin=0.75*inch,
+                                 **kwargs)
+        frame = Frame(self.leftMargin, self.bottomMargin, self.width, self.height, id='normal')
+        self.addPageTemplates([PageTemplate(id='catalog', frames=[frame])])
+
+    def afterFlowable(self, flowable):
+        key = getattr(flowable, 'bookmark_key', None)
+        if key:
+            self.add_heading(flowable.getPlainText(), key)
+
+    def add_heading(self, text, key):
+        """Bookmark the current page and list it in the outline and TOC."""
+        self.canv.bookmarkPage(key)
+        self.canv.addOutlineEntry(text, key, level=0, closed=True)
+        self.notify('TOCEntry', (0, text, self.page, key))
+
+    def build_lazily(self, story_factory, indexing_flowables, canvasmaker, max_passes=10):
+        """Like multiBuild(), but each pass streams a fresh story from story_factory().
+
+        multiBuild() copies the whole story list before every pass and logs
+        an undo edit (holding the flowable) for every flowable it postpones
+        to the next frame. Here the indexing flowables are given up front,
+        and as every pass lays out new flowables there is nothing to undo,
+        so no flowable outlives its page.
+        """
+        indexing_flowables = _begin_multi_pass(self, indexing_flowables)
+        passes = 0
+        while True:
+            passes += 1
+            for flowable in indexing_flowables:
+                flowable.beforeBuild()
+            with stage("build_pass"):
+                self.build(LazyStory(story_factory()), canvasmaker=canvasmaker)
+            for flowable in indexing_flowables:
+                flowable.afterBuild()
+
+            if _multi_pass_satisfied(self):
+                with stage("save"):
+                    self.canv.save()
+                break
+            if passes > max_passes:
+                raise IndexError(f"Index entries not resolved after {max_passes} passes")
+        return passes
+
+
+class SpeakerIndex(SimpleIndex):
+    """The speaker index, with CJK names and their heading letters set in the CJK font."""
+
+    def _build(self, availWidth, availHeight):
+        SimpleIndex._build(self, availWidth, availHeight)
+        for row in self._flowable._cellvalues:
+            cell = row[0]
+            if isinstance(cell, Paragraph) and has_cjk(cell.text):
+                row[0] = Paragraph(with_cjk_font(cell.text), cell.style)
+
+
+class CatalogSectionTemplate(CatalogDocTemplate):
+    """A section laid out by a split-rendering worker: headings are recorded, not bookmarked."""
+
+    def __init__(self, filename, **kwargs):
+        CatalogDocTemplate.__init__(self, filename, **kwargs)
+        self.headings = []
+
+    def add_heading(self, text, key):
+        self.headings.append((text, key, self.page))
+
+
+@lru_cache(maxsize=None)
+def _catalog_styles():
+    styles = getSampleStyleSheet()
+    return {
+        'title': ParagraphStyle('CatalogTitle', parent=styles['Heading1'], fontSize=30,
+                                spaceAfter=24, textColor=NVIDIA_GREEN, alignment=1),
+        'subtitle': ParagraphStyle('CatalogSubtitle', parent=styles['Heading2'], fontSize=16,
+                                   spaceAfter=12, textColor=DARK_GRAY, alignment=1),
+        'heading': ParagraphStyle('CatalogHeading', parent=styles['Heading2'], fontSize=18,
+                                  spaceBefore=6, spaceAfter=10, textColor=NVIDIA_GREEN),
+        'body': ParagraphStyle('CatalogBody', parent=styles['Normal'], fontSize=10, leading=13,
+                               spaceAfter=8),
+        'header_cell': ParagraphStyle('CatalogHeaderCell', parent=styles['Normal'], fontSize=8,
+                                      leading=10, textColor=colors.white, fontName='Helvetica-Bold'),
+        'cell': ParagraphStyle('CatalogCell', parent=styles['Normal'], fontSize=7.5, leading=9.5),
+        'abstract': ParagraphStyle('CatalogAbstract', parent=styles['Normal'], fontSize=7,
+                                   leading=9, textColor=DARK_GRAY, spaceBefore=2),
+    }
+
+
+SESSION_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), NVIDIA_GREEN),
+    ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, LIGHT_GRAY]),
+    ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+    ('LINEBELOW', (0, 0), (-1, -1), 0.25, colors.HexColor('#DDDDDD')),
+    ('TOPPADDING', (0, 0), (-1, -1), 3),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 3),
+])
+
+
+def _heading(text, style, key):
+    heading = Paragraph(escape(text), style)
+    heading.bookmark_key = key
+    return heading
+
+
+def _session_row(session, styles):
+    code = session_code_of(session) or ""
+    title = SESSION_CODE_PATTERN.sub('', session.get('title') or '').strip()
+    abstract = ' '.join((session.get('abstract') or '').split())
+    if len(abstract) > ABSTRACT_LIMIT:
+        abstract = abstract[:ABSTRACT_LIMIT].rsplit(' ', 1)[0] + "..."
+
+    speakers = []
+    for speaker in session.get('speakers') or []:
+        name = ' '.join(speaker['name'].split())
+        # Commas separate index levels, so they are doubled to keep them literal
+        entry = escape(name.replace(',', ',,'), {'"': '&quot;'})
+        line = f'<b>{escape(name)}</b><index item="{entry}"/>'
+        organization = speaker.get('title_organization')
+        if organization and organization != speaker['name']:
+            line += f'<br/><font color="#666666">{escape(organization)}</font>'
+        speakers.append(with_cjk_font(line))
+
+    when_where = []
+    if is_valid_time(session.get('date_time')):
+        when_where.append(with_cjk_font(escape(session['date_time'])))
+    if session.get('location'):
+        when_where.append(with_cjk_font(escape(session['location'])))
+
+    return [
+        Paragraph(escape(code), styles['cell']),
+        [Paragraph(with_cjk_font(f"<b>{escape(title)}</b>"), styles['cell']),
+         Paragraph(with_cjk_font(escape(abstract)), styles['abstract'])],
+        Paragraph('<br/>'.join(speakers), styles['cell']),
+        Paragraph('<br/>'.join(when_where), styles['cell']),
+    ]
+
+
+def _session_table(rows, styles):
+    header = [Paragraph(text, styles['header_cell']) for text in ("Code", "Session", "Speakers", "When / Where")]
+    table = LongTable([header] + rows, colWidths=COLUMN_WIDTHS, repeatRows=1)
+    table.setStyle(SESSION_TABLE_STYLE)
+    return table
+
+
+def _iter_front_matter(group_count, toc, styles, session_count):
+    yield Spacer(1, 2*inch)
+    yield Paragraph("NVIDIA GTC 2025", styles['title'])
+    yield Paragraph("Session Catalog", styles['subtitle'])
+    yield Paragraph(f"{session_count} sessions in {group_count} groups", styles['subtitle'])
+    yield PageBreak()
+
+    yield Paragraph("Contents", styles['heading'])
+    yield toc
+    yield PageBreak()
+
+
+def _iter_group_heading(name, number, count, styles):
+    yield _heading(name, styles['heading'], f"group-{number}")
+    yield Paragraph(f"{count} sessions", styles['body'])
+
+
+def _iter_session_tables(sessions, styles):
+    rows = []
+    for session in sessions:
+        rows.append(_session_row(session, styles))
+        if len(rows) == TABLE_CHUNK_SIZE:
+            yield _session_table(rows, styles)
+            rows = []
+    if rows:
+        yield _session_table(rows, styles)
+
+
+def iter_catalog_story(groups, toc, index, styles, session_count):
+    """Yield the catalog's flowables: cover, contents, one section per group, speaker index."""
+    yield from _iter_front_matter(len(groups), toc, styles, session_count)
+
+    for number, (name, (path, count)) in enumerate(groups):
+        yield CondPageBreak(2*inch)
+        yield from _iter_group_heading(name, number, count, styles)
+        yield from _iter_session_tables(iter_jsonl_sessions(path), styles)
+
+    yield PageBreak()
+    yield _heading("Speaker Index", styles['heading'], "speaker-index")
+    yield index
+
+
+def render_catalog_section(job):
+    """Lay out sessions start:stop of one group without page furniture (a split-rendering worker)."""
+    styles = _catalog_styles()
+    index = RecordingIndex()
+    doc = CatalogSectionTemplate(job['file'])
+
+    def story():
+        if job['start'] == 0:
+            yield from _iter_group_heading(job['name'], job['number'], job['count'], styles)
+        sessions = islice(iter_jsonl_sessions(job['path']), job['start'], job['stop'])
+        yield from _iter_session_tables(sessions, styles)
+
+    doc.build(LazyStory(story()), canvasmaker=index.getCanvasMaker())
+    return {'file': job['file'], 'pages': doc.page, 'headings': doc.headings, 'index_marks': index.marks}
+
+
+def iter_skeleton_story(groups, sections, placements, toc, index, styles, session_count):
+    """Yield the split-rendered catalog's skeleton: the story with placeholders for the sections."""
+    yield from _iter_front_matter(len(groups), toc, styles, session_count)
+    for section in sections:
+        yield from iter_placeholder_pages(section, placements, index)
+    # The last placeholder fills its page, so the index starts on a new one
+    yield _heading("Speaker Index", styles['heading'], "speaker-index")
+    yield index
+
+
+def _section_jobs(groups, section_size, work_dir):
+    jobs = []
+    for number, (name, (path, count)) in enumerate(groups):
+        for start in range(0, count, section_size):
+            jobs.append({
+                'name': name, 'number': number, 'path': path, 'count': count,
+                'start': start, 'stop': min(start + section_size, count),
+                'file': os.path.join(work_dir, f"section_{len(jobs)}.pdf")
+            })
+    return jobs
+
+
+def create_session_catalog(csv_file=DEFAULT_CSV_FILE, output_file=DEFAULT_OUTPUT_FILE,
+                           group_by='category', categories_file=DEFAULT_CATEGORIES_FILE,
+                           workers=1, section_size=DEFAULT_SECTION_SIZE):
+    """Build the session catalog PDF and return its session and page counts.
+
+    workers=1 lays the catalog out in this process; any other value splits
+    it into sections of up to section_size sessions, renders them across
+    that many processes (0 uses all cores) and merges them.
+    """
+    if group_by == 'category':
+        lookup = load_category_lookup(categories_file)
+        group_key = lambda session: lookup.get(session_code_of(session), "Uncategorized")
+    elif group_by == 'prefix':
+        group_key = session_code_prefix
+    else:
+        raise ValueError(f"Unknown grouping: {group_by!r} (expected 'category' or 'prefix')")
+
+    output_dir = os.path.dirname(output_file)
+    if output_dir:
+        os.makedirs(output_dir, exist_ok=True)
+
+    with tempfile.TemporaryDirectory(prefix="gtc_catalog_") as work_dir:
+        print(f"Grouping sessions from {csv_file}...")
+        with stage("group_sessions"):
+            groups = group_sessions(iter_csv_sessions(csv_file), group_key, work_dir)
+        # Largest groups first, with the catch-all group last
+        ordered = sorted(groups.items(), key=lambda item: (item[0] == "Uncategorized", -item[1][1], item[0]))
+        session_count = sum(count for _, count in groups.values())
+
+        styles = _catalog_styles()
+        toc = TableOfContents()
+        index = SpeakerIndex(dot=' . ', headers=True)
+        title = "NVIDIA GTC 2025 Session Catalog"
+
+        print(f"Rendering {session_count} sessions in {len(ordered)} groups...")
+        if workers == 1:
+            doc = CatalogDocTemplate(output_file, title=title)
+            passes = doc.build_lazily(
+                lambda: iter_catalog_story(ordered, toc, index, styles, session_count),
+                indexing_flowables=[toc, index],
+                canvasmaker=index.getCanvasMaker(canvasmaker=CatalogCanvas)
+            )
+        else:
+            with stage("render_sections"):
+                sections = render_sections(render_catalog_section,
+                                           _section_jobs(ordered, section_size, work_dir), workers)
+            skeleton_file = os.path.join(work_dir, "skeleton.pdf")
+            placements = {}
+            doc = CatalogDocTemplate(skeleton_file, title=title)
+            passes = doc.build_lazily(
+                lambda: iter_skeleton_story(ordered, sections, placements, toc, index, styles, session_count),
+                indexing_flowables=[toc, index],
+                canvasmaker=CatalogCanvas
+            )
+            with stage("merge_sections"):
+                merge_sections(skeleton_file, placements, output_file)
+
+    print(f"Session catalog ({session_count} sessions, {doc.page} pages, {passes} passes) "
+          f"saved to {output_file}")
+    return session_count, doc.page
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Create a PDF catalog of every GTC 2025 session.")
+    parser.add_argument("--csv", default=DEFAULT_CSV_FILE,
+                        help=f"Extracted sessions CSV (default: {DEFAULT_CSV_FILE})")
+    parser.add_argument("--output", default=DEFAULT_OUTPUT_FILE,
+                        help=f"Output PDF (default: {DEFAULT_OUTPUT_FILE})")
+    parser.add_argument("--group-by", choices=["category", "prefix"], default="category",
+                        help="Group sessions by analysis category or session-code prefix (default: category)")
+    parser.add_argument("--categories-file", default=DEFAULT_CATEGORIES_FILE,
+                        help=f"Categorized sessions from the analysis (default: {DEFAULT_CATEGORIES_FILE})")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="Render sections in this many processes and merge them; needs pypdf "
+                             "(0 uses all cores, default: 1)")
+    parser.add_argument("--section-size", type=int, default=DEFAULT_SECTION_SIZE,
+                        help=f"Sessions per section when rendering in parallel (default: {DEFAULT_SECTION_SIZE})")
+    add_report_arguments(parser)
+    args = parser.parse_args()
+
+    with RunReport.from_args("create_session_catalog", args):
+        create_session_catalog(args.csv, args.output, args.group_by, args.categories_file,
+                               workers=args.workers, section_size=args.section_size)
+
+
+if __name__ == "__main__":
+    main()
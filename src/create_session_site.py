@@ -0,0 +1,579 @@
+#!/usr/bin/env python3
+"""
+GTC 2025 Session Site Generator
+-------------------------------
+Build a static website for browsing and searching every extracted
+session: a page per session, a page per category, and a search page
+backed by a prebuilt index. The index is split into small JSON shards by
+the first two characters of each term, and the result listings (title,
+code and category) are kept in blocks of 16 sessions, so a search only
+downloads the shards for the words typed and the blocks holding the top
+results, however large the catalog grows.
+
+Rebuilds are incremental. Each file of the site is recorded in a state
+file with the hash of what produced it; a session page is only rendered
+and written when its session changed, other pages and shards only when
+their contents changed, and files of sessions that disappeared are
+removed. Sessions keep their index ids from build to build, so adding a
+session only rewrites the shards of its own terms and the last block, and
+the index isn't rebuilt at all if no session changed.
+
+Browsers don't fetch files from file:// URLs, so serve the site over
+HTTP to search it:
+
+    python src/create_session_site.py
+    python -m http.server -d outputs
+"""
+
+import os
+import re
+import json
+import hashlib
+import argparse
+from html import escape
+from collections import defaultdict
+
+from font_manager import CJK_RUN
+from run_report import RunReport, add_report_arguments, stage
+from atomic_files import atomic_path
+from session_markdown import (
+    DEFAULT_CATEGORIES_FILE, SESSION_CODE_PATTERN, consolidate_sessions, is_valid_time,
+    load_category_lookup, session_code_of
+)
+from create_session_catalog import DEFAULT_CSV_FILE, iter_csv_sessions
+
+DEFAULT_SITE_DIR = "outputs/sessions"
+STATE_FILE = ".site_state.json"
+
+# Terms are sharded by their first PREFIX_LENGTH characters; shorter query
+# words only match whole terms
+PREFIX_LENGTH = 2
+# Sessions per result block: the top results are spread over the catalog, so
+# small blocks keep a search's download to a few KB per result shown
+DOC_BLOCK_SIZE = 16
+MAX_RESULTS = 20
+# A term's score in a session is the sum of the weights of the fields it occurs in
+FIELD_WEIGHTS = {"code": 8, "title": 3, "speakers": 2, "category": 2, "abstract": 1}
+STOP_WORDS = sorted(
+    "a an and are as at be by can for from how in into is it its of on or our that the their "
+    "this to using we what with you your".split()
+)
+WORD = re.compile(r"[^\W_]+")
+
+SITE_CSS = """body {
+    font-family: Arial, sans-serif;
+    line-height: 1.6;
+    max-width: 800px;
+    margin: 0 auto;
+    padding: 20px;
+    color: #333;
+}
+h1 {
+    color: #76B900; /* NVIDIA green */
+    border-bottom: 2px solid #76B900;
+    padding-bottom: 10px;
+}
+h2 {
+    color: #76B900;
+    margin-top: 30px;
+}
+a {
+    color: #4a7500;
+}
+nav, .meta, .count {
+    color: #666;
+}
+.code {
+    font-family: monospace;
+    color: #666;
+}
+ul.sessions li {
+    margin-bottom: 8px;
+}
+#query {
+    width: 100%;
+    box-sizing: border-box;
+    padding: 10px;
+    font-size: 1.1em;
+    border: 2px solid #76B900;
+    border-radius: 4px;
+}
+"""
+
+SEARCH_JS = """(function () {
+    "use strict";
+    var CONFIG = %(config)s;
+    var WORD = /[\\p{L}\\p{N}]+/gu;
+    var CJK = new RegExp(CONFIG.cjk, "gu");
+    var STOP_WORDS = new Set(CONFIG.stopWords);
+    var cache = new Map();
+
+    // The same terms the site generator indexes
+    function tokenize(text) {
+        var terms = [];
+        (text.toLowerCase().match(WORD) || []).forEach(function (word) {
+            var position = 0;
+            for (var run of word.matchAll(CJK)) {
+                if (run.index > position) terms.push(word.slice(position, run.index));
+                terms.push.apply(terms, Array.from(run[0]));
+                position = run.index + run[0].length;
+            }
+            if (position < word.length) terms.push(word.slice(position));
+        });
+        return Array.from(new Set(terms.filter(function (term) { return !STOP_WORDS.has(term); })));
+    }
+
+    function shardKey(term) {
+        return Array.from(term).slice(0, CONFIG.prefixLength).map(function (char) {
+            return /^[a-z0-9]$/.test(char) ? char : "_" + char.codePointAt(0).toString(16) + "_";
+        }).join("");
+    }
+
+    function fetchJson(url) {
+        if (!cache.has(url)) {
+            cache.set(url, fetch(url).then(function (response) {
+                return response.ok ? response.json() : {};
+            }).catch(function () { return {}; }));
+        }
+        return cache.get(url);
+    }
+
+    // Scores of the sessions matching one query term: every indexed term it
+    // starts (or, if shorter than a shard prefix, equals)
+    function termScores(term, shard) {
+        var exact = Array.from(term).length < CONFIG.prefixLength;
+        var scores = new Map();
+        Object.keys(shard).forEach(function (indexed) {
+            if (exact ? indexed !== term : !indexed.startsWith(term)) return;
+            var postings = shard[indexed];
+            for (var i = 0; i < postings.length; i += 2) {
+                scores.set(postings[i], (scores.get(postings[i]) || 0) + postings[i + 1]);
+            }
+        });
+        return scores;
+    }
+
+    function search(query) {
+        var terms = tokenize(query);
+        if (!terms.length) return Promise.resolve(null);
+        return Promise.all(terms.map(function (term) {
+            return fetchJson("search/terms/" + shardKey(term) + ".json");
+        })).then(function (shards) {
+            // Sessions must match every term
+            var scores = null;
+            terms.forEach(function (term, i) {
+                var next = termScores(term, shards[i]);
+                if (scores === null) { scores = next; return; }
+                scores.forEach(function (score, id) {
+                    if (next.has(id)) scores.set(id, score + next.get(id));
+                    else scores.delete(id);
+                });
+            });
+            var ranked = Array.from(scores.entries()).sort(function (a, b) {
+                return b[1] - a[1] || a[0] - b[0];
+            });
+            var top = ranked.slice(0, CONFIG.maxResults).map(function (entry) { return entry[0]; });
+            var blocks = Array.from(new Set(top.map(function (id) {
+                return Math.floor(id / CONFIG.blockSize);
+            })));
+            return Promise.all(blocks.map(function (block) {
+                return fetchJson("search/docs/" + block + ".json");
+            })).then(function (loaded) {
+                var docs = {};
+                loaded.forEach(function (block) { Object.assign(docs, block); });
+                return {total: ranked.length, docs: top.map(function (id) { return docs[id]; }).filter(Boolean)};
+            });
+        });
+    }
+
+    function render(results) {
+        var list = document.getElementById("results");
+        var status = document.getElementById("status");
+        list.textContent = "";
+        if (results === null) { status.textContent = ""; return; }
+        status.textContent = results.total === 1 ? "1 session" :
+            results.total + " sessions" + (results.total > results.docs.length ? ", showing the top " + results.docs.length : "");
+        results.docs.forEach(function (doc) {
+            var item = document.createElement("li");
+            var link = document.createElement("a");
+            link.href = "session/" + doc[0] + ".html";
+            link.textContent = doc[1];
+            item.appendChild(link);
+            var details = document.createElement("span");
+            details.className = "code";
+            details.textContent = " " + [doc[2], doc[3]].filter(Boolean).join(" \\u00b7 ");
+            item.appendChild(details);
+            list.appendChild(item);
+        });
+    }
+
+    var input = document.getElementById("query");
+    var latest = 0;
+    var timer = null;
+    function update() {
+        var query = input.value;
+        var request = ++latest;
+        history.replaceState(null, "", query ? "?q=" + encodeURIComponent(query) : location.pathname);
+        search(query).then(function (results) {
+            if (request === latest) render(results);
+        });
+    }
+    input.addEventListener("input", function () {
+        clearTimeout(timer);
+        timer = setTimeout(update, 150);
+    });
+    var initial = new URLSearchParams(location.search).get("q");
+    if (initial) { input.value = initial; update(); }
+})();
+"""
+
+
+def tokenize(text):
+    """The search terms of text: lower-cased words, with CJK runs split into characters."""
+    terms = []
+    for word in WORD.findall(text.lower()):
+        position = 0
+        for run in CJK_RUN.finditer(word):
+            if run.start() > position:
+                terms.append(word[position:run.start()])
+            terms.extend(run.group(0))
+            position = run.end()
+        if position < len(word):
+            terms.append(word[position:])
+    return [term for term in terms if term not in STOP_WORDS]
+
+
+def shard_key(term):
+    """The name of the shard holding term: its first characters, non-ASCII ones as _hex_."""
+    return "".join(char if char.isascii() and char.isalnum() else f"_{ord(char):x}_"
+                   for char in term[:PREFIX_LENGTH])
+
+
+def _slug(text):
+    return re.sub(r'[^a-z0-9]+', '-', text.lower()).strip('-') or "other"
+
+
+def _parse_files(files):
+    """Split the CSV's "name: url; name: url" files column into (name, url) pairs."""
+    pairs = []
+    for item in (files or "").split("; "):
+        parts = re.split(r': (?=https?://)', item, maxsplit=1)
+        if len(parts) == 2:
+            pairs.append(parts)
+    return pairs
+
+
+def site_sessions(csv_files, categories_file=DEFAULT_CATEGORIES_FILE):
+    """Read and merge the sessions of one or more CSV exports into the records the site shows."""
+    lookup = load_category_lookup(categories_file)
+    records = []
+    slugs = set()
+    for csv_file in csv_files:
+        for session in consolidate_sessions(iter_csv_sessions(csv_file)):
+            code = session_code_of(session) or ""
+            title = SESSION_CODE_PATTERN.sub('', session.get('title') or '').strip()
+            base = code.lower() or "session-" + hashlib.sha256(title.encode('utf-8')).hexdigest()[:10]
+            slug, number = base, 2
+            while slug in slugs:
+                slug, number = f"{base}-{number}", number + 1
+            slugs.add(slug)
+            date_time = session.get('date_time') or ""
+            records.append({
+                "slug": slug,
+                "code": code,
+                "title": title,
+                "category": lookup.get(code, "Uncategorized"),
+                "abstract": session.get('abstract') or "",
+                "date_time": date_time if is_valid_time(date_time) else "",
+                "location": session.get('location') or "",
+                "speakers": [[speaker['name'], speaker.get('title_organization') or ""]
+                             for speaker in session['speakers']],
+                "files": _parse_files(session.get('files')),
+                "url": session.get('url') or "",
+                "replay_url": session.get('replay_url') or "",
+            })
+    return records
+
+
+def _field_text(record, field):
+    if field == "speakers":
+        return " ".join(name for name, _ in record["speakers"])
+    return record[field]
+
+
+def build_index(records, ids):
+    """Return the term shards {key: {term: [id, score, id, score, ...]}} and the
+    result blocks {block: {id: [slug, title, code, category]}}.
+
+    Postings are listed best score first.
+    """
+    postings = defaultdict(lambda: defaultdict(int))
+    for record in records:
+        doc_id = ids[record["slug"]]
+        for field, weight in FIELD_WEIGHTS.items():
+            for term in set(tokenize(_field_text(record, field))):
+                postings[term][doc_id] += weight
+
+    shards = defaultdict(dict)
+    for term in sorted(postings):
+        ranked = sorted(postings[term].items(), key=lambda item: (-item[1], item[0]))
+        shards[shard_key(term)][term] = [value for item in ranked for value in item]
+
+    blocks = defaultdict(dict)
+    for record in sorted(records, key=lambda record: ids[record["slug"]]):
+        doc_id = ids[record["slug"]]
+        blocks[doc_id // DOC_BLOCK_SIZE][str(doc_id)] = [
+            record["slug"], record["title"], record["code"], record["category"]
+        ]
+    return shards, blocks
+
+
+def _json(data):
+    return json.dumps(data, ensure_ascii=False, separators=(',', ':'))
+
+
+def _hash(text):
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+
+def _page(title, body, root=""):
+    return f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>{escape(title)}</title>
+    <link rel="stylesheet" href="{root}site.css">
+</head>
+<body>
+{body}
+</body>
+</html>
+"""
+
+
+def render_session_page(record):
+    category_link = f'../category/{_slug(record["category"])}.html'
+    lines = [
+        f'    <nav><a href="../index.html">All sessions</a> &rsaquo; '
+        f'<a href="{category_link}">{escape(record["category"])}</a></nav>',
+        f'    <h1>{escape(record["title"])}</h1>',
+    ]
+    meta = [f'<span class="code">{escape(record["code"])}</span>' if record["code"] else ""]
+    meta += [escape(record[field]) for field in ("date_time", "location") if record[field]]
+    meta = [part for part in meta if part]
+    if meta:
+        lines.append(f'    <p class="meta">{" &middot; ".join(meta)}</p>')
+    if record["speakers"]:
+        lines.append("    <h2>Speakers</h2>")
+        lines.append("    <ul>")
+        for name, organization in record["speakers"]:
+            detail = f", {escape(organization)}" if organization and organization != name else ""
+            lines.append(f"        <li>{escape(name)}{detail}</li>")
+        lines.append("    </ul>")
+    if record["abstract"]:
+        lines.append("    <h2>Abstract</h2>")
+        lines += [f"    <p>{escape(paragraph.strip())}</p>"
+                  for paragraph in record["abstract"].split("\n") if paragraph.strip()]
+    if record["files"]:
+        lines.append("    <h2>Files</h2>")
+        lines.append("    <ul>")
+        lines += [f'        <li><a href="{escape(url)}">{escape(name)}</a></li>' for name, url in record["files"]]
+        lines.append("    </ul>")
+    links = [f'<a href="{escape(record[field])}">{label}</a>'
+             for field, label in (("url", "Session in the GTC catalog"), ("replay_url", "Replay"))
+             if record[field]]
+    if links:
+        lines.append(f'    <p>{" &middot; ".join(links)}</p>')
+    return _page(record["title"], "\n".join(lines), root="../")
+
+
+def render_category_page(category, records):
+    lines = [
+        '    <nav><a href="../index.html">All sessions</a></nav>',
+        f"    <h1>{escape(category)}</h1>",
+        f'    <p class="count">{len(records)} sessions</p>',
+        '    <ul class="sessions">',
+    ]
+    for record in sorted(records, key=lambda record: (record["title"].lower(), record["slug"])):
+        code = f' <span class="code">{escape(record["code"])}</span>' if record["code"] else ""
+        lines.append(f'        <li><a href="../session/{record["slug"]}.html">{escape(record["title"])}</a>{code}</li>')
+    lines.append("    </ul>")
+    return _page(category, "\n".join(lines), root="../")
+
+
+def render_index_page(categories, session_count):
+    lines = [
+        "    <h1>NVIDIA GTC 2025 Sessions</h1>",
+        f'    <input id="query" type="search" placeholder="Search {session_count} sessions by title, '
+        'speaker, topic or code" autofocus>',
+        '    <p id="status" class="count"></p>',
+        '    <ul id="results" class="sessions"></ul>',
+        "    <noscript><p>Search needs JavaScript; browse the categories below instead.</p></noscript>",
+        "    <h2>Browse by Category</h2>",
+        '    <ul class="sessions">',
+    ]
+    for category, records in categories:
+        lines.append(f'        <li><a href="category/{_slug(category)}.html">{escape(category)}</a> '
+                     f'<span class="count">({len(records)})</span></li>')
+    lines += ["    </ul>", '    <script src="search.js"></script>']
+    return _page("NVIDIA GTC 2025 Sessions", "\n".join(lines))
+
+
+def render_search_js():
+    config = {
+        "prefixLength": PREFIX_LENGTH,
+        "blockSize": DOC_BLOCK_SIZE,
+        "maxResults": MAX_RESULTS,
+        "stopWords": STOP_WORDS,
+        "cjk": CJK_RUN.pattern,
+    }
+    return SEARCH_JS % {"config": _json(config)}
+
+
+class SiteWriter:
+    """Write the site's files whose fingerprint changed since the last build.
+
+    A file's fingerprint is the hash of whatever produced it, by default
+    its contents; force writes every file regardless. Files the build
+    doesn't produce again are removed by remove_stale().
+    """
+
+    def __init__(self, site_dir, previous, force=False):
+        self.site_dir = site_dir
+        self.previous = previous
+        self.force = force
+        self.current = {}
+        self.written = 0
+        self.unchanged = 0
+        self.removed = 0
+
+    def write(self, relpath, render, fingerprint=None):
+        """Write render()'s text to relpath unless the fingerprint is unchanged."""
+        text = None
+        if fingerprint is None:
+            text = render()
+            fingerprint = _hash(text)
+        self.current[relpath] = fingerprint
+        path = os.path.join(self.site_dir, relpath)
+        if not self.force and self.previous.get(relpath) == fingerprint and os.path.exists(path):
+            self.unchanged += 1
+            return
+        if text is None:
+            text = render()
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with atomic_path(path) as partial_path, open(partial_path, 'w', encoding='utf-8') as f:
+            f.write(text)
+        self.written += 1
+
+    def remove_stale(self):
+        for relpath in self.previous:
+            if relpath not in self.current:
+                path = os.path.join(self.site_dir, relpath)
+                if os.path.exists(path):
+                    os.remove(path)
+                self.removed += 1
+
+
+def _load_state(state_file):
+    if not os.path.exists(state_file):
+        return {}
+    with open(state_file, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def _assign_ids(records, previous_ids):
+    """Keep each session's id from the last build and give new sessions the next free ones."""
+    ids = {record["slug"]: previous_ids[record["slug"]]
+           for record in records if record["slug"] in previous_ids}
+    next_id = max(previous_ids.values(), default=-1) + 1
+    for record in records:
+        if record["slug"] not in ids:
+            ids[record["slug"]] = next_id
+            next_id += 1
+    return ids
+
+
+def create_session_site(csv_files=(DEFAULT_CSV_FILE,), site_dir=DEFAULT_SITE_DIR,
+                        categories_file=DEFAULT_CATEGORIES_FILE, full=False):
+    """Build or update the session site; returns the SiteWriter with the write counts.
+
+    full=True writes every file and assigns session ids afresh; files of
+    the last build that are no longer produced are still removed.
+    """
+    state_file = os.path.join(site_dir, STATE_FILE)
+    state = _load_state(state_file)
+    # Session pages are fingerprinted by their record and this generator's code
+    with open(__file__, 'rb') as f:
+        code_hash = hashlib.sha256(f.read()).hexdigest()
+
+    with stage("load_sessions"):
+        records = site_sessions(csv_files, categories_file)
+    previous_ids = {} if full else state.get("ids", {})
+    ids = _assign_ids(records, previous_ids)
+
+    categories = defaultdict(list)
+    for record in records:
+        categories[record["category"]].append(record)
+    # Largest categories first, with the catch-all last
+    ordered = sorted(categories.items(), key=lambda item: (item[0] == "Uncategorized", -len(item[1]), item[0]))
+
+    writer = SiteWriter(site_dir, state.get("files", {}), force=full)
+    print(f"Building the session site for {len(records)} sessions in {site_dir}...")
+    with stage("session_pages"):
+        fingerprints = [_hash(code_hash + _json(record)) for record in records]
+        for record, fingerprint in zip(records, fingerprints):
+            writer.write(f"session/{record['slug']}.html", lambda record=record: render_session_page(record),
+                         fingerprint)
+    with stage("browse_pages"):
+        for category, category_records in ordered:
+            writer.write(f"category/{_slug(category)}.html",
+                         lambda: render_category_page(category, category_records))
+        writer.write("index.html", lambda: render_index_page(ordered, len(records)))
+        writer.write("site.css", lambda: SITE_CSS)
+        writer.write("search.js", render_search_js)
+    with stage("search_index"):
+        # The index depends only on the session records and their ids
+        index_fingerprint = _hash("".join(fingerprints) + _json(ids))
+        index_files = [relpath for relpath in writer.previous if relpath.startswith("search/")]
+        if (not full and state.get("index") == index_fingerprint
+                and all(os.path.exists(os.path.join(site_dir, relpath)) for relpath in index_files)):
+            for relpath in index_files:
+                writer.current[relpath] = writer.previous[relpath]
+            writer.unchanged += len(index_files)
+        else:
+            shards, blocks = build_index(records, ids)
+            for key, terms in shards.items():
+                writer.write(f"search/terms/{key}.json", lambda terms=terms: _json(terms))
+            for block, docs in blocks.items():
+                writer.write(f"search/docs/{block}.json", lambda docs=docs: _json(docs))
+    writer.remove_stale()
+
+    with open(state_file, 'w', encoding='utf-8') as f:
+        # Removed sessions keep their ids in case they come back
+        json.dump({"ids": dict(previous_ids, **ids), "index": index_fingerprint, "files": writer.current},
+                  f, ensure_ascii=False)
+    print(f"Session site: {writer.written} files written, {writer.unchanged} unchanged, "
+          f"{writer.removed} removed")
+    return writer
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build a static website to browse and search the GTC sessions.")
+    parser.add_argument("--csv", nargs="+", default=[DEFAULT_CSV_FILE],
+                        help=f"Extracted sessions CSV files, e.g. one per year (default: {DEFAULT_CSV_FILE})")
+    parser.add_argument("--output-dir", default=DEFAULT_SITE_DIR,
+                        help=f"Site directory (default: {DEFAULT_SITE_DIR})")
+    parser.add_argument("--categories-file", default=DEFAULT_CATEGORIES_FILE,
+                        help=f"Categorized sessions from the analysis (default: {DEFAULT_CATEGORIES_FILE})")
+    parser.add_argument("--full", action="store_true",
+                        help="Rewrite every file and renumber the sessions instead of updating the last build")
+    add_report_arguments(parser)
+    args = parser.parse_args()
+
+    with RunReport.from_args("create_session_site", args):
+        create_session_site(args.csv, args.output_dir, args.categories_file, full=args.full)
+
+
+if __name__ == "__main__":
+    main()
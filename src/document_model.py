@@ -0,0 +1,331 @@
+#!/usr/bin/env python3
+"""
+Document Model
+--------------
+A format-neutral document: a title and a list of blocks (cover, headings,
+paragraphs, bullet lists, tables, figures and page breaks). A document is
+built once from the analysis output and then handed to each renderer, so
+the PDF, HTML and Markdown versions share one load and one layout. The
+HTML and Markdown renderers live here; the reportlab renderer sits with
+the PDF styles in create_enhanced_narrative.py.
+
+Paragraph text and list items use the small inline markup reportlab
+paragraphs accept: <b>, <i> and XML-escaped text. Headings, captions and
+table cells are plain text.
+"""
+
+import os
+import re
+import html
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+
+class Cover:
+    def __init__(self, title, subtitle=None, figure=None, date=None):
+        self.title = title
+        self.subtitle = subtitle
+        self.figure = figure
+        self.date = date
+
+
+class Heading:
+    """A section (level 1) or subsection (level 2) heading."""
+
+    def __init__(self, text, level=1):
+        self.text = text
+        self.level = level
+
+
+class Paragraph:
+    """Body text; style is 'body' or 'emphasis' (a closing call-out)."""
+
+    def __init__(self, text, style='body'):
+        self.text = ' '.join(text.split())
+        self.style = style
+
+
+class BulletList:
+    def __init__(self, items):
+        self.items = list(items)
+
+
+class Table:
+    """A table whose first row is the header.
+
+    widths are column widths in inches and style names the PDF table style
+    ('summary' or 'detail'); other renderers ignore both.
+    """
+
+    def __init__(self, rows, widths=None, style='detail'):
+        self.rows = [[str(cell) for cell in row] for row in rows]
+        self.widths = widths
+        self.style = style
+
+
+class BarChart:
+    """Horizontal bar chart data, drawn natively where the renderer can."""
+
+    def __init__(self, labels, values, title=None, value_label=None):
+        self.labels = list(labels)
+        self.values = list(values)
+        self.title = title
+        self.value_label = value_label
+
+
+class Figure:
+    """An image, or a chart with the image as its rendered fallback, sized in inches."""
+
+    def __init__(self, image=None, caption=None, width=6.5, height=3, chart=None):
+        self.image = image
+        self.caption = caption
+        self.width = width
+        self.height = height
+        self.chart = chart
+
+
+class PageBreak:
+    """Starts a new page in paged formats."""
+
+
+class Document:
+    def __init__(self, title, blocks=()):
+        self.title = title
+        self.blocks = list(blocks)
+
+    def add(self, *blocks):
+        self.blocks.extend(blocks)
+
+
+def _image_path(figure, output_file):
+    """The figure's image relative to output_file, or None if there is no image file."""
+    if not figure.image or not os.path.exists(figure.image):
+        return None
+    return os.path.relpath(figure.image, os.path.dirname(os.path.abspath(output_file)))
+
+
+def _markdown_inline(text):
+    text = re.sub(r'</?b>', '**', text)
+    text = re.sub(r'</?i>', '*', text)
+    return html.unescape(re.sub(r'<[^>]+>', '', text))
+
+
+def _markdown_cell(text):
+    return text.replace('|', '\\|')
+
+
+def _markdown_figure(figure, output_file):
+    path = _image_path(figure, output_file)
+    return [f"![{figure.caption or ''}]({path})", ""] if path else []
+
+
+def render_markdown(document, output_file):
+    """Return the document as Markdown, with image paths relative to output_file."""
+    lines = []
+    for block in document.blocks:
+        if isinstance(block, Cover):
+            lines += [f"# {block.title}", ""]
+            if block.subtitle:
+                lines += [f"**{block.subtitle}**", ""]
+            if block.figure:
+                lines += _markdown_figure(block.figure, output_file)
+            if block.date:
+                lines += [block.date, ""]
+        elif isinstance(block, Heading):
+            lines += [f"{'#' * (block.level + 1)} {block.text}", ""]
+        elif isinstance(block, Paragraph):
+            lines += [_markdown_inline(block.text), ""]
+        elif isinstance(block, BulletList):
+            lines += [f"- {_markdown_inline(item)}" for item in block.items] + [""]
+        elif isinstance(block, Table):
+            header, rows = block.rows[0], block.rows[1:]
+            lines.append("| " + " | ".join(_markdown_cell(cell) for cell in header) + " |")
+            lines.append("|" + "|".join("-" * (len(cell) + 2) for cell in header) + "|")
+            lines += ["| " + " | ".join(_markdown_cell(cell) for cell in row) + " |" for row in rows]
+            lines.append("")
+        elif isinstance(block, Figure):
+            lines += _markdown_figure(block, output_file)
+    return "\n".join(lines)
+
+
+HTML_STYLE = """
+        body {
+            font-family: Arial, sans-serif;
+            line-height: 1.6;
+            max-width: 800px;
+            margin: 0 auto;
+            padding: 20px;
+            color: #333;
+        }
+        h1 {
+            color: #76B900; /* NVIDIA green */
+            text-align: center;
+            margin-bottom: 30px;
+            border-bottom: 2px solid #76B900;
+            padding-bottom: 10px;
+        }
+        h2 {
+            color: #76B900;
+            margin-top: 30px;
+            margin-bottom: 15px;
+        }
+        h3 {
+            color: #333;
+            border-left: 4px solid #76B900;
+            padding-left: 10px;
+            margin-top: 25px;
+        }
+        p {
+            margin-bottom: 15px;
+            text-align: justify;
+        }
+        .subtitle, .date {
+            text-align: center;
+            color: #666;
+        }
+        table {
+            border-collapse: collapse;
+            width: 100%;
+            margin: 20px 0;
+        }
+        th, td {
+            border: 1px solid #ddd;
+            padding: 10px;
+            text-align: left;
+        }
+        th {
+            background-color: #76B900;
+            color: white;
+        }
+        tr:nth-child(even) {
+            background-color: #f2f2f2;
+        }
+        ul {
+            padding-left: 20px;
+        }
+        li {
+            margin-bottom: 8px;
+        }
+        figure {
+            margin: 20px 0;
+            text-align: center;
+        }
+        figure img {
+            max-width: 100%;
+        }
+        figcaption {
+            font-style: italic;
+            color: #999;
+        }
+        .emphasis {
+            font-style: italic;
+            color: #76B900;
+            background-color: #f9f9f9;
+            padding: 15px;
+            border-radius: 5px;
+            margin: 25px 0;
+            line-height: 1.8;
+        }"""
+
+
+def _html_figure(figure, output_file):
+    path = _image_path(figure, output_file)
+    if not path:
+        return []
+    caption = html.escape(figure.caption or '')
+    image = f'<img src="{html.escape(path)}" alt="{caption}">'
+    # Offer the optimizer's WebP copy to browsers that take it, unless the
+    # PNG was re-rendered after it (the optimizer writes the WebP last)
+    webp = os.path.splitext(figure.image)[0] + ".webp"
+    if os.path.exists(webp) and os.path.getmtime(webp) >= os.path.getmtime(figure.image):
+        source = os.path.splitext(path)[0] + ".webp"
+        image = f'<picture><source srcset="{html.escape(source)}" type="image/webp">{image}</picture>'
+    lines = ["    <figure>", f"        {image}"]
+    if figure.caption:
+        lines.append(f"        <figcaption>{caption}</figcaption>")
+    return lines + ["    </figure>"]
+
+
+def render_html(document, output_file):
+    """Return the document as a standalone HTML page, with image paths relative to output_file."""
+    lines = [
+        "<!DOCTYPE html>",
+        '<html lang="en">',
+        "<head>",
+        '    <meta charset="UTF-8">',
+        '    <meta name="viewport" content="width=device-width, initial-scale=1.0">',
+        f"    <title>{html.escape(document.title)}</title>",
+        f"    <style>{HTML_STYLE}\n    </style>",
+        "</head>",
+        "<body>",
+    ]
+    for block in document.blocks:
+        if isinstance(block, Cover):
+            lines.append(f"    <h1>{html.escape(block.title)}</h1>")
+            if block.subtitle:
+                lines.append(f'    <p class="subtitle">{html.escape(block.subtitle)}</p>')
+            if block.figure:
+                lines += _html_figure(block.figure, output_file)
+            if block.date:
+                lines.append(f'    <p class="date">{html.escape(block.date)}</p>')
+        elif isinstance(block, Heading):
+            tag = f"h{block.level + 1}"
+            lines.append(f"    <{tag}>{html.escape(block.text)}</{tag}>")
+        elif isinstance(block, Paragraph):
+            if block.style == 'emphasis':
+                lines.append(f'    <div class="emphasis">{block.text}</div>')
+            else:
+                lines.append(f"    <p>{block.text}</p>")
+        elif isinstance(block, BulletList):
+            lines.append("    <ul>")
+            lines += [f"        <li>{item}</li>" for item in block.items]
+            lines.append("    </ul>")
+        elif isinstance(block, Table):
+            lines.append("    <table>")
+            for number, row in enumerate(block.rows):
+                tag = "th" if number == 0 else "td"
+                cells = "".join(f"<{tag}>{html.escape(cell)}</{tag}>" for cell in row)
+                lines.append(f"        <tr>{cells}</tr>")
+            lines.append("    </table>")
+        elif isinstance(block, Figure):
+            lines += _html_figure(block, output_file)
+    lines += ["</body>", "</html>", ""]
+    return "\n".join(lines)
+
+
+def _write_text(text, output_file):
+    with open(output_file, 'w', encoding='utf-8') as f:
+        f.write(text)
+
+
+def write_markdown(document, output_file):
+    _write_text(render_markdown(document, output_file), output_file)
+
+
+def write_html(document, output_file):
+    _write_text(render_html(document, output_file), output_file)
+
+
+def render_document(document, renderers, main_thread=()):
+    """Render one document with several renderers at once.
+
+    renderers maps an output file to a function taking (document,
+    output_file). The output files in main_thread are rendered on the
+    calling thread, where run-report stages and the profiler see them,
+    while the rest run on a thread pool. Returns {output_file: seconds}.
+    """
+    def run(item):
+        output_file, render = item
+        start = time.perf_counter()
+        render(document, output_file)
+        return output_file, time.perf_counter() - start
+
+    pooled = [item for item in renderers.items() if item[0] not in main_thread]
+    local = [item for item in renderers.items() if item[0] in main_thread]
+    if not pooled:
+        return dict(run(item) for item in local)
+    with ThreadPoolExecutor(max_workers=len(pooled)) as executor:
+        futures = [executor.submit(run, item) for item in pooled]
+        timings = dict(run(item) for item in local)
+        timings.update(future.result() for future in futures)
+    return {output_file: timings[output_file] for output_file in renderers}
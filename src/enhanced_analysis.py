@@ -18,6 +18,11 @@ from sklearn.cluster import KMeans
 from sklearn.decomposition import PCA
 from wordcloud import WordCloud
 import json
+import argparse
+
+from run_report import RunReport, add_report_arguments, stage
+from asset_store import release
+from image_optimizer import find_pngs, optimize_images
 
 # Set up styling for plots
 plt.style.use('seaborn-v0_8')
@@ -25,10 +30,16 @@ sns.set(font_scale=1.2)
 sns.set_style("whitegrid")
 
 class GTCAnalyzer:
-    def __init__(self, data_file=None, titles_file='data/gtc_sessions_titles.txt'):
-        """Initialize the GTC data analyzer with input files."""
+    def __init__(self, data_file=None, titles_file='data/gtc_sessions_titles.txt', optimize=True, webp=False):
+        """Initialize the GTC data analyzer with input files.
+        
+        optimize shrinks the charts and word clouds once they are rendered,
+        and webp also writes WebP copies of them for the HTML outputs.
+        """
         self.titles_file = titles_file
         self.data_file = data_file
+        self.optimize = optimize
+        self.webp = webp
         self.titles = []
         self.session_codes = []
         self.df = None
@@ -256,7 +267,10 @@ class GTCAnalyzer:
         
         # Save the chart
         chart_file = os.path.join(self.output_dir, 'category_distribution.png')
-        plt.savefig(chart_file, dpi=300, bbox_inches='tight')
+        # The chart may be hard-linked into the asset store; write a new file
+        release(chart_file)
+        with stage("savefig"):
+            plt.savefig(chart_file, dpi=300, bbox_inches='tight')
         plt.close()
         
         print(f"Category distribution chart saved to {chart_file}")
@@ -273,18 +287,23 @@ class GTCAnalyzer:
             text = ' '.join([title for title, _ in titles])
             
             # Create word cloud
-            wordcloud = WordCloud(
-                width=800, 
-                height=400, 
-                background_color='white',
-                colormap='viridis',
-                max_words=100,
-                contour_width=1
-            ).generate(text)
+            with stage("layout"):
+                wordcloud = WordCloud(
+                    width=800, 
+                    height=400, 
+                    background_color='white',
+                    colormap='viridis',
+                    max_words=100,
+                    contour_width=1,
+                    # Fixed layout so unchanged titles give byte-identical images
+                    random_state=42
+                ).generate(text)
             
             # Save word cloud
             output_file = os.path.join(self.output_dir, f'wordcloud_{category.replace(" & ", "_").replace(" ", "_").lower()}.png')
-            wordcloud.to_file(output_file)
+            release(output_file)
+            with stage("to_file"):
+                wordcloud.to_file(output_file)
             
         print(f"Word clouds saved to {self.output_dir}")
     
@@ -354,7 +373,9 @@ class GTCAnalyzer:
             
             # Save the chart
             chart_file = os.path.join(self.output_dir, f'keywords_{category.replace(" & ", "_").replace(" ", "_").lower()}.png')
-            plt.savefig(chart_file, dpi=300, bbox_inches='tight')
+            release(chart_file)
+            with stage("savefig"):
+                plt.savefig(chart_file, dpi=300, bbox_inches='tight')
             plt.close()
     
     def extract_insights(self, categorized_titles):
@@ -413,6 +434,8 @@ class GTCAnalyzer:
         """Create a narrative summary of the insights."""
         print("Creating narrative summary...")
         
+        # Plain Markdown, so the analysis doesn't depend on the document model
+        # (or rerun in the pipeline whenever its renderers change)
         narrative = "# Key Insights from NVIDIA GTC 2025\n\n"
         
         # Add a section on top categories
@@ -444,7 +467,7 @@ class GTCAnalyzer:
         narrative += "applications that combine multiple AI modalities with simulation capabilities, "
         narrative += "creating unprecedented opportunities for innovation and efficiency gains. The "
         narrative += "organizations that successfully integrate these technologies into their operations "
-        narrative += "will likely establish significant competitive advantages in their respective markets."
+        narrative += "will likely establish significant competitive advantages in their respective markets.\n"
         
         # Save narrative
         output_file = os.path.join(self.output_dir, 'gtc_narrative_summary.md')
@@ -455,21 +478,42 @@ class GTCAnalyzer:
     
     def run_full_analysis(self):
         """Run full analysis workflow."""
-        self.load_titles()
-        self.load_data()
-        categorized_titles = self.categorize_sessions()
-        self.generate_word_clouds(categorized_titles)
-        self.create_category_trend_analysis(categorized_titles)
-        insights = self.extract_insights(categorized_titles)
-        self.create_insightful_narrative(insights)
+        with stage("load_titles"):
+            self.load_titles()
+        with stage("load_data"):
+            self.load_data()
+        with stage("categorize_sessions"):
+            categorized_titles = self.categorize_sessions()
+        with stage("generate_word_clouds"):
+            self.generate_word_clouds(categorized_titles)
+        with stage("create_category_trend_analysis"):
+            self.create_category_trend_analysis(categorized_titles)
+        if self.optimize:
+            with stage("optimize_images"):
+                optimize_images(find_pngs(self.output_dir), webp=self.webp)
+        with stage("extract_insights"):
+            insights = self.extract_insights(categorized_titles)
+        with stage("create_insightful_narrative"):
+            self.create_insightful_narrative(insights)
         
         print("\nAnalysis complete! Output files saved to:", self.output_dir)
         return self
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Analyze GTC 2025 session data.")
+    parser.add_argument("--no-optimize-images", action="store_true",
+                        help="Keep the charts and word clouds as rendered instead of shrinking them")
+    parser.add_argument("--webp", action="store_true",
+                        help="Also write WebP copies of the charts and word clouds for the HTML outputs")
+    add_report_arguments(parser)
+    args = parser.parse_args()
+    
     # Create and run the analyzer
-    analyzer = GTCAnalyzer(
-        data_file="data/gtc_sessions_extracted.csv",
-        titles_file="data/gtc_sessions_titles.txt"
-    )
-    analyzer.run_full_analysis() 
\ No newline at end of file
+    with RunReport.from_args("enhanced_analysis", args):
+        analyzer = GTCAnalyzer(
+            data_file="data/gtc_sessions_extracted.csv",
+            titles_file="data/gtc_sessions_titles.txt",
+            optimize=not args.no_optimize_images,
+            webp=args.webp
+        )
+        analyzer.run_full_analysis() 
\ No newline at end of file
@@ -7,133 +7,63 @@ Extract session details from the NVIDIA GTC HTML catalog page.
 
 import os
 import sys
-import pandas as pd
+import csv
+import argparse
+from itertools import islice
 from bs4 import BeautifulSoup
 from playwright.sync_api import sync_playwright, TimeoutError as PlaywrightTimeoutError
 
-def export_to_markdown(sessions):
-    print("Generating Markdown table...")
-    
-    # Consolidate sessions by session_code to avoid duplicate rows
-    consolidated_sessions = {}
-    for session in sessions:
-        session_code = session.get('session_code', '')
-        session_id = f"{session_code}_{session.get('title', '')}"
-        
-        if session_id not in consolidated_sessions:
-            consolidated_sessions[session_id] = session.copy()
-            # Initialize speakers as a list
-            consolidated_sessions[session_id]['speakers'] = []
-            
-        # Add speaker if not already in the list
-        if session.get('speakers'):
-            for speaker in session['speakers']:
-                speaker_name = speaker.get('name', '')
-                if speaker_name and speaker_name not in [s.get('name', '') for s in consolidated_sessions[session_id]['speakers']]:
-                    consolidated_sessions[session_id]['speakers'].append(speaker)
-    
-    # Convert to list
-    sessions_list = list(consolidated_sessions.values())
-    print(f"Preparing Markdown for {len(sessions_list)} unique sessions...")
-    
-    # Start building the markdown content
-    md_content = "# NVIDIA GTC 2025 Sessions\n\n"
-    
-    # Create the table header with additional columns for files and replay links
-    md_content += "| Session Code | Title | Speakers | Date/Time | Location | Files | Replay | Abstract |\n"
-    md_content += "|-------------|-------|----------|-----------|----------|-------|--------|----------|\n"
-    
-    # Helper function to clean text for markdown
-    def clean_text_for_markdown(text):
-        if text is None:
-            return ""
-        # Replace newlines, pipe characters, and excessive spaces
-        cleaned = str(text).replace('\n', ' ').replace('|', '\\|').replace('\r', ' ')
-        # Remove any non-breaking spaces or other problematic characters
-        cleaned = ' '.join(cleaned.split())
-        return cleaned
+from session_extraction import SessionExtractor, ProgressReporter, iter_fragments_parallel, split_into_fragments
+from catalog_stream import iter_catalog_fragments
+from session_store import JsonlSessionWriter, iter_jsonl_sessions
+from session_markdown import export_to_markdown, DEFAULT_CATEGORIES_FILE
+from run_report import RunReport, add_report_arguments, stage
+from extraction_state import (
+    ExtractionState, DEFAULT_STATE_FILE, DEFAULT_DIFF_FILE, extract_incremental, write_diff
+)
+
+# Columns of the flattened CSV export, one row per speaker
+CSV_COLUMNS = [
+    "session_code", "title", "url", "abstract", "date_time", 
+    "location", "files", "replay_url", "speaker_name", "speaker_title_org"
+]
+
+def export_to_csv(sessions, output_file="gtc_sessions_extracted.csv"):
+    """Stream sessions to a CSV with one row per speaker; returns the session count."""
+    print(f"Saving data to {output_file}...")
     
-    # Helper to validate if text is a time string (containing AM or PM but not as part of another word)
-    def is_valid_time(text):
-        if not text:
-            return False
-        return bool((" AM" in text or " PM" in text) and not ("LAM" in text))
+    session_count = 0
+    total_replay_urls = 0
     
-    # Process each session
-    for session in sessions_list:
-        session_code = clean_text_for_markdown(session.get('session_code', ''))
-        title = clean_text_for_markdown(session.get('title', ''))
-        
-        # Format speakers as a list with line breaks
-        speakers_list = []
-        for speaker in session.get('speakers', []):
-            if isinstance(speaker, dict) and 'name' in speaker:
-                name = speaker['name']
-                if speaker.get('title_organization'):
-                    name += f" ({speaker['title_organization']})"
-                speakers_list.append(name)
-            elif isinstance(speaker, str):
-                speakers_list.append(speaker)
-        
-        speakers = "<br>".join([clean_text_for_markdown(s) for s in speakers_list if s])
+    with open(output_file, 'w', encoding='utf-8', newline='') as f:
+        csv_writer = csv.DictWriter(f, fieldnames=CSV_COLUMNS, lineterminator='\n')
+        csv_writer.writeheader()
         
-        # Ensure date/time and location are in the correct columns and contain valid data
-        date_time = clean_text_for_markdown(session.get('date_time', ''))
-        if not is_valid_time(date_time):
-            date_time = ""  # Clear invalid time strings
+        for session in sessions:
+            session_count += 1
+            if session.get("replay_url"):
+                total_replay_urls += 1
             
-        location = clean_text_for_markdown(session.get('location', ''))
-        
-        # Format files as links with line breaks
-        files_list = session.get('files', [])
-        if files_list:
-            files_md = []
-            for file in files_list:
-                file_name = clean_text_for_markdown(file.get('file_name', ''))
-                file_url = file.get('file_url', '')
-                if file_name and file_url:
-                    files_md.append(f"[{file_name}]({file_url})")
-            files = "<br>".join(files_md)
-        else:
-            files = ""
-        
-        # Add replay link if available
-        replay_url = session.get('replay_url', '')
-        if replay_url:
-            replay = f"[Replay]({replay_url})"
-        else:
-            replay = ""
-        
-        # Truncate abstract to a reasonable length to avoid huge cells
-        abstract = session.get('abstract', '')
-        if abstract:
-            abstract = clean_text_for_markdown(abstract)
-            if len(abstract) > 100:
-                abstract = abstract[:100] + "..."
-        
-        # Add row to the table with the new columns
-        row = f"| {session_code} | {title} | {speakers} | {date_time} | {location} | {files} | {replay} | {abstract} |\n"
-        md_content += row
-    
-    # Write to file
-    output_file = "gtc_sessions_table.md"
-    with open(output_file, 'w', encoding='utf-8') as f:
-        f.write(md_content)
-    
-    print(f"Markdown table generated and saved to {output_file}")
-    return output_file
+            # Convert files list to string representation for CSV
+            files = "; ".join(
+                f"{file['file_name']}: {file['file_url']}" for file in session.get("files") or []
+            ) or None
+            
+            row = {column: session.get(column) for column in CSV_COLUMNS}
+            row["files"] = files
+            
+            # Sessions without speakers still get a single row
+            speakers = session.get("speakers") or [{}]
+            for speaker in speakers:
+                row["speaker_name"] = speaker.get("name")
+                row["speaker_title_org"] = speaker.get("title_organization")
+                csv_writer.writerow(row)
+    
+    print(f"Found {total_replay_urls} sessions with replay URLs out of {session_count} total sessions")
+    return session_count
 
-def main():
-    # Path to the HTML file
-    html_file_path = os.path.abspath("Attendee Portal - Session Catalog.html")
-    
-    if not os.path.exists(html_file_path):
-        print(f"Error: HTML file not found at {html_file_path}")
-        sys.exit(1)
-    
-    print(f"Processing HTML file: {html_file_path}")
-    
-    # Step 1: Load the HTML file using Playwright
+def render_catalog(html_file_path):
+    """Load the saved catalog page in a headless browser and return the rendered HTML."""
     print("Initializing browser...")
     with sync_playwright() as p:
         browser = p.chromium.launch(headless=True)
@@ -157,226 +87,167 @@ def main():
         print("Closing browser...")
         browser.close()
     
-    # Step 2: Parse the Rendered HTML
-    print("Parsing HTML...")
-    soup = BeautifulSoup(rendered_html, 'html.parser')
-    
-    # Step 3: Extract All Sessions Elements
-    print("Finding session containers...")
-    # First, try to find by exact class
-    sessions_containers = soup.find_all('div', class_='catalog-result-title session-title')
-    
-    if not sessions_containers:
-        print("Warning: No sessions found using first selector. Trying alternative...")
-        # Try alternative approaches if the first one fails
-        sessions_containers = soup.find_all('div', class_=lambda c: c and 'session-title' in c)
-    
-    print(f"Found {len(sessions_containers)} session containers.")
+    return rendered_html
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Extract session details from the GTC catalog page.")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="Number of extraction processes (0 uses all cores, default: 1)")
+    parser.add_argument("--chunk-size", type=int, default=50,
+                        help="Sessions per work unit in parallel mode (default: 50)")
+    parser.add_argument("--jsonl", default="gtc_sessions_extracted.jsonl",
+                        help="Checkpoint file sessions are streamed to; .gz or .zst compresses it "
+                             "(default: gtc_sessions_extracted.jsonl)")
+    parser.add_argument("--output", default="gtc_sessions_extracted.csv",
+                        help="Where to write the one-row-per-speaker CSV (default: gtc_sessions_extracted.csv)")
+    parser.add_argument("--md-output", default="gtc_sessions_table.md",
+                        help="Where to write the Markdown table (default: gtc_sessions_table.md)")
+    parser.add_argument("--resume", action="store_true",
+                        help="Continue after the sessions already saved in the checkpoint file")
+    parser.add_argument("--md-shard-by", choices=["prefix", "category"],
+                        help="Split the Markdown table into one file per session-code prefix or "
+                             "category, with the --md-output file as the index")
+    parser.add_argument("--categories-file", default=DEFAULT_CATEGORIES_FILE,
+                        help=f"Categorized sessions used by --md-shard-by category (default: {DEFAULT_CATEGORIES_FILE})")
+    parser.add_argument("--stream", action="store_true",
+                        help="Stream-parse the saved HTML with bounded memory instead of rendering it")
+    parser.add_argument("--incremental", action="store_true",
+                        help="Only re-extract sessions whose HTML changed since the last run and write a diff")
+    parser.add_argument("--state-file", default=DEFAULT_STATE_FILE,
+                        help=f"Per-session hash store for incremental runs (default: {DEFAULT_STATE_FILE})")
+    parser.add_argument("--diff-file", default=DEFAULT_DIFF_FILE,
+                        help=f"Where to write the session diff (default: {DEFAULT_DIFF_FILE})")
+    add_report_arguments(parser)
+    return parser.parse_args()
+
+def main():
+    args = parse_args()
+    with RunReport.from_args("extract_sessions", args):
+        run_extraction(args)
+
+def run_extraction(args):
+    # Path to the HTML file
+    html_file_path = os.path.abspath("Attendee Portal - Session Catalog.html")
     
-    if not sessions_containers:
-        print("Error: No session containers found. Extraction failed.")
+    if not os.path.exists(html_file_path):
+        print(f"Error: HTML file not found at {html_file_path}")
         sys.exit(1)
     
+    print(f"Processing HTML file: {html_file_path}")
+    extractor = SessionExtractor()
+    
+    # Sessions are checkpointed to JSONL as they are extracted. Incremental runs
+    # rewrite the whole file, since every session is needed for the diff.
+    resume = args.resume and not args.incremental
+    writer = JsonlSessionWriter(args.jsonl, resume=resume)
+    completed = writer.completed
+    if completed:
+        print(f"Resuming after {completed} sessions already saved in {args.jsonl}")
+    
+    if args.stream:
+        # Steps 1-3: Locate sessions by streaming the saved file
+        print("Streaming session data...")
+        fragments = iter_catalog_fragments(html_file_path)
+        total = None
+    else:
+        # Step 1: Load the HTML file using Playwright
+        with stage("render"):
+            rendered_html = render_catalog(html_file_path)
+        
+        # Step 2: Parse the Rendered HTML
+        print("Parsing HTML...")
+        with stage("parse"):
+            soup = BeautifulSoup(rendered_html, 'html.parser')
+        
+        # Step 3: Extract All Sessions Elements
+        print("Finding session containers...")
+        with stage("find_containers"):
+            sessions_containers = extractor.find_containers(soup)
+        total = len(sessions_containers)
+        
+        print(f"Found {total} session containers.")
+        
+        if not sessions_containers:
+            print("Error: No session containers found. Extraction failed.")
+            writer.close()
+            sys.exit(1)
+    
     # Step 4: Iterate and Extract Session Data
     print("Extracting session data...")
-    sessions_extracted = []
+    if args.incremental:
+        state = ExtractionState(args.state_file)
+        if not args.stream:
+            fragments = split_into_fragments(sessions_containers)
+        with stage("extract"):
+            sessions = extract_incremental(
+                fragments, state, extractor,
+                workers=args.workers, chunk_size=args.chunk_size
+            )
+        
+        # The diff and state are written once the exports are, so a run that
+        # fails part-way is redone in full next time
+        diff = state.diff()
+        
+        # Nothing changed since the last snapshot, so the exports are still current
+        unchanged = not (diff["added"] or diff["removed"] or diff["modified"])
+        exports = (args.output, args.md_output)
+        if unchanged and all(os.path.exists(f) for f in exports):
+            # Restore the snapshot the writer truncated
+            for session in sessions:
+                writer.write(session)
+            writer.close()
+            write_diff(diff, args.diff_file)
+            state.save()
+            print("No session changes detected; existing exports are up to date.")
+            return
+    elif args.stream:
+        sessions = (extractor.extract_fragment(fragment, index)
+                    for fragment, index in islice(fragments, completed, None))
+    elif args.workers != 1:
+        sessions = iter_fragments_parallel(
+            # Fragment every container, then skip: a card's container indexes
+            # count from its first container, which may be before the resume point
+            split_into_fragments(sessions_containers)[completed:],
+            workers=args.workers or None,
+            chunk_size=args.chunk_size,
+            timer=extractor.timer
+        )
+    else:
+        sessions = (extractor.extract(container) for container in sessions_containers[completed:])
+    
+    # Extraction is lazy outside incremental mode, so it is measured as it is written
+    with stage("write_jsonl" if args.incremental else "extract"), writer:
+        progress = ProgressReporter(total, "Extracted sessions")
+        progress.done = completed
+        for session in sessions:
+            writer.write(session)
+            progress.update()
+    
+    if not writer.completed:
+        print("Error: No session containers found. Extraction failed.")
+        sys.exit(1)
     
-    for i, container in enumerate(sessions_containers, 1):
-        print(f"Processing session {i}/{len(sessions_containers)}")
-        parent = container.find_parent()
-
-        # Title & URL
-        title_element = container.find('a')
-        session_title = title_element.text.strip() if title_element else None
-        session_url = title_element['href'] if title_element and 'href' in title_element.attrs else None
-        
-        # Find session code/ID
-        session_code = None
-        code_element = parent.find('div', text=lambda t: t and t.strip().startswith('[') and ']' in t)
-        if code_element:
-            session_code = code_element.text.strip()
-        
-        # Abstract
-        abstract_div = parent.find('div', class_='description')
-        if not abstract_div:
-            abstract_div = parent.find('div', class_=lambda c: c and 'description' in c)
-        abstract = abstract_div.text.strip() if abstract_div else None
-
-        # Speakers
-        speakers_list = []
-        speakers_area = parent.find('div', class_=lambda c: c and 'speaker-details' in c)
-        if speakers_area:
-            # Try to extract speakers with different possible structures
-            speaker_elements = speakers_area.find_all('button', class_=lambda c: c and 'speaker' in c)
-            if speaker_elements:
-                for speaker_elem in speaker_elements:
-                    speaker_name = speaker_elem.text.strip()
-                    # Try to find associated details for this speaker
-                    next_elem = speaker_elem.find_next('span')
-                    title_org = next_elem.text.strip() if next_elem else None
-                    
-                    speakers_list.append({
-                        "name": speaker_name,
-                        "title_organization": title_org
-                    })
-            else:
-                # If the button method doesn't work, try other selectors
-                speaker_texts = speakers_area.get_text().strip().split('\n')
-                for text in speaker_texts:
-                    if text.strip():
-                        speakers_list.append({
-                            "name": text.strip(),
-                            "title_organization": None
-                        })
-
-        # Date and Time
-        date_time = None
-        # Look for text containing AM/PM
-        date_time_div = parent.find(lambda tag: tag.name and tag.string and 
-                                  isinstance(tag.string, str) and 
-                                  ('AM' in tag.string or 'PM' in tag.string) and
-                                  not ('LAM' in tag.string))  # Avoid matching terms like "LAM" which aren't time
-        if date_time_div:
-            date_time = date_time_div.text.strip()
-        
-        # Location
-        location = None
-        # Look for text containing location emoji or "Room" text
-        location_div = parent.find(lambda tag: tag.name and tag.string and 
-                                 isinstance(tag.string, str) and 
-                                 ('📍' in tag.string or 'Room' in tag.string) and
-                                 not ('LAM' in tag.string))  # Avoid matching terms like "LAM" which aren't location
-        if location_div:
-            location = location_div.text.strip()
-            if '📍' in location:
-                location = location.replace('📍', '').strip()
-
-        # Files (optional)
-        files = []
-        files_component = parent.find('div', class_=lambda c: c and 'session-files' in c)
-        if files_component:
-            for link in files_component.find_all('a', href=True):
-                files.append({
-                    "file_name": link.text.strip(),
-                    "file_url": link['href']
-                })
-
-        # Replay button/link (optional)
-        replay_url = None
-        
-        # Check all links for replay indicators with detailed HTML inspection
-        replay_indicators = ['replay', 'watch', 'video', 'stream', 'recording']
-        all_links = parent.find_all('a', href=True)
-        
-        for link in all_links:
-            link_text = link.text.lower()
-            link_href = link['href'].lower()
-            
-            # Check for replay indicators in the link text or URL
-            if any(indicator in link_text for indicator in replay_indicators) or any(indicator in link_href for indicator in replay_indicators):
-                replay_url = link['href']
-                break
-        
-        # Fallback: If no explicit replay link found, check if the session URL itself could be a replay
-        if not replay_url and session_url:
-            # For sessions with certain codes, the session URL is likely the replay URL
-            session_prefixes = ['D', 'P', 'S']
-            if session_code and any(code in session_code for code in session_prefixes):
-                replay_url = session_url
-
-        sessions_extracted.append({
-            "session_code": session_code,
-            "title": session_title,
-            "url": session_url,
-            "abstract": abstract,
-            "speakers": speakers_list,
-            "date_time": date_time,
-            "location": location,
-            "files": files,
-            "replay_url": replay_url
-        })
+    extractor.timer.report()
+    print(f"Sessions saved to {args.jsonl}")
     
-    # Step 5: Save Extracted Data
+    # Step 5: Derive the CSV and Markdown exports from the JSONL checkpoint
     print("Preparing data for export...")
     
     # Export to Markdown table format
-    export_to_markdown(sessions_extracted)
-    
-    # First, count total sessions with replay URLs
-    total_replay_urls = sum(1 for session in sessions_extracted if session.get("replay_url"))
-    print(f"Found {total_replay_urls} sessions with replay URLs out of {len(sessions_extracted)} total sessions")
+    with stage("export_markdown"):
+        export_to_markdown(iter_jsonl_sessions(args.jsonl), args.md_output, shard_by=args.md_shard_by,
+                           categories_file=args.categories_file)
     
-    # Process each session for CSV export
-    flat_sessions = []
+    # Export the flattened one-row-per-speaker CSV
+    with stage("export_csv"):
+        session_count = export_to_csv(iter_jsonl_sessions(args.jsonl), args.output)
     
-    # Track the number of sessions with replay URLs in the flattened data
-    replay_count = 0
-    
-    for session in sessions_extracted:
-        # Store a local copy of replay_url to ensure it's preserved across all rows
-        session_replay_url = session.get("replay_url", "")
-        
-        # Handle sessions with no speakers
-        if not session["speakers"]:
-            flat_session = session.copy()
-            flat_session["speaker_name"] = None
-            flat_session["speaker_title_org"] = None
-            flat_session["replay_url"] = session_replay_url  # Ensure replay_url is preserved
-            del flat_session["speakers"]
-            
-            # Count replay URLs for debugging
-            if session_replay_url:
-                replay_count += 1
-                
-            flat_sessions.append(flat_session)
-        else:
-            # For sessions with speakers, create a row for each speaker
-            for speaker in session["speakers"]:
-                flat_session = session.copy()
-                flat_session["speaker_name"] = speaker.get("name")
-                flat_session["speaker_title_org"] = speaker.get("title_organization")
-                flat_session["replay_url"] = session_replay_url  # Ensure replay_url is preserved
-                del flat_session["speakers"]
-                
-                # Only count the replay URL once per session, even if multiple speakers
-                if session_replay_url and speaker == session["speakers"][0]:
-                    replay_count += 1
-                    
-                flat_sessions.append(flat_session)
-    
-    # Convert files list to string representation for CSV
-    for session in flat_sessions:
-        if session["files"]:
-            file_strings = []
-            for file in session["files"]:
-                file_strings.append(f"{file['file_name']}: {file['file_url']}")
-            session["files"] = "; ".join(file_strings)
-        else:
-            session["files"] = None
-    
-    # Create DataFrame
-    df_sessions = pd.DataFrame(flat_sessions)
-    
-    # Log the number of sessions with replay URLs in the flattened data
-    print(f"Found {replay_count} sessions with replay URLs in the flattened data")
-    
-    # Ensure all expected columns are present
-    required_columns = [
-        "session_code", "title", "url", "abstract", "date_time", 
-        "location", "files", "replay_url", "speaker_name", "speaker_title_org"
-    ]
-    
-    for col in required_columns:
-        if col not in df_sessions.columns:
-            df_sessions[col] = None
-    
-    # Save to CSV
-    output_file = "gtc_sessions_extracted.csv"
-    print(f"Saving data to {output_file}...")
-    df_sessions.to_csv(output_file, index=False)
+    if args.incremental:
+        write_diff(diff, args.diff_file)
+        state.save()
     
-    print(f"Extraction complete! Extracted {len(sessions_extracted)} sessions.")
-    print(f"Data saved to {output_file} and gtc_sessions_table.md")
+    print(f"Extraction complete! Extracted {session_count} sessions.")
+    print(f"Data saved to {args.output} and {args.md_output}")
 
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    main()
@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+Incremental Extraction State
+----------------------------
+Records a content hash for every session fragment extracted from the
+catalog, so a rerun only re-parses sessions whose HTML changed, and
+produces a machine-readable diff of added, removed and modified sessions
+against the previous snapshot.
+"""
+
+import os
+import json
+import hashlib
+from datetime import datetime
+
+from session_extraction import SessionExtractor, ProgressReporter, extract_fragments_parallel
+
+DEFAULT_STATE_FILE = "gtc_extraction_state.json"
+DEFAULT_DIFF_FILE = "gtc_sessions_diff.json"
+
+# Fields compared when deciding whether a session was modified
+TRACKED_FIELDS = [
+    "title", "url", "abstract", "speakers", "date_time",
+    "location", "files", "replay_url"
+]
+
+
+def fragment_hash(fragment, index=0):
+    """Return the content hash identifying a session fragment."""
+    digest = hashlib.sha256(fragment.encode('utf-8'))
+    digest.update(f"#{index}".encode('utf-8'))
+    return digest.hexdigest()
+
+
+def session_key(session):
+    """Return the identity of a session across catalog snapshots."""
+    return f"{session.get('session_code') or ''}_{session.get('title') or ''}"
+
+
+class ExtractionState:
+    """Per-session content hashes and records from the previous extraction."""
+
+    def __init__(self, state_file=DEFAULT_STATE_FILE):
+        self.state_file = state_file
+        self.previous = {}
+        self.current = {}
+        # Records of fragments repeating a session key already in current,
+        # by hash; the diff compares one record per key, but every fragment
+        # must be reusable or its duplicates are re-extracted on every run
+        self.duplicates = {}
+        previous_duplicates = {}
+
+        if os.path.exists(state_file):
+            with open(state_file, 'r', encoding='utf-8') as f:
+                state = json.load(f)
+            self.previous = state.get("sessions", {})
+            previous_duplicates = state.get("duplicates", {})
+            print(f"Loaded extraction state for {len(self.previous)} sessions from {state_file}")
+
+        # Index previous records by fragment hash for reuse
+        self.by_hash = dict(previous_duplicates)
+        self.by_hash.update((entry["hash"], entry["record"]) for entry in self.previous.values())
+
+    def lookup(self, content_hash):
+        """Return the cached record for an unchanged fragment, or None."""
+        return self.by_hash.get(content_hash)
+
+    def add(self, content_hash, session):
+        """Record a session extracted (or reused) in the current run."""
+        key = session_key(session)
+        if key not in self.current:
+            self.current[key] = {"hash": content_hash, "record": session}
+        elif self.current[key]["hash"] != content_hash:
+            self.duplicates[content_hash] = session
+
+    def diff(self):
+        """Compare the current run with the previous snapshot."""
+        added = [self.current[key]["record"] for key in self.current if key not in self.previous]
+        removed = [self.previous[key]["record"] for key in self.previous if key not in self.current]
+        modified = []
+        unchanged = 0
+
+        for key, entry in self.current.items():
+            old_entry = self.previous.get(key)
+            if old_entry is None:
+                continue
+            if old_entry["hash"] == entry["hash"]:
+                unchanged += 1
+                continue
+
+            old_record, new_record = old_entry["record"], entry["record"]
+            changes = {
+                field: {"old": old_record.get(field), "new": new_record.get(field)}
+                for field in TRACKED_FIELDS
+                if old_record.get(field) != new_record.get(field)
+            }
+            if changes:
+                modified.append({
+                    "key": key,
+                    "session_code": new_record.get("session_code"),
+                    "changes": changes
+                })
+            else:
+                # Markup changed but none of the extracted fields did
+                unchanged += 1
+
+        return {
+            "generated_at": datetime.now().isoformat(timespec='seconds'),
+            "added": added,
+            "removed": removed,
+            "modified": modified,
+            "unchanged": unchanged
+        }
+
+    def save(self):
+        """Persist the current run as the snapshot for the next one."""
+        with open(self.state_file, 'w', encoding='utf-8') as f:
+            json.dump({"sessions": self.current, "duplicates": self.duplicates}, f)
+        print(f"Extraction state saved to {self.state_file}")
+
+
+def extract_incremental(fragments, state, extractor=None, workers=1, chunk_size=50):
+    """Extract (fragment, index) pairs, re-parsing only fragments that changed.
+
+    Returns the sessions in catalog order. Unchanged fragments reuse the
+    record stored in the state; changed ones are extracted serially or,
+    with workers other than 1, across a process pool.
+    """
+    extractor = extractor or SessionExtractor()
+    sessions = []
+    hashes = []
+    stale = []
+
+    for fragment, index in fragments:
+        content_hash = fragment_hash(fragment, index)
+        cached = state.lookup(content_hash)
+        if cached is None:
+            stale.append((len(sessions), fragment, index))
+        sessions.append(cached)
+        hashes.append(content_hash)
+
+    print(f"Reusing {len(sessions) - len(stale)} unchanged sessions, re-extracting {len(stale)}")
+
+    if stale:
+        stale_fragments = [(fragment, index) for _, fragment, index in stale]
+        if workers != 1:
+            records, _ = extract_fragments_parallel(stale_fragments, workers=workers or None,
+                                                    chunk_size=chunk_size, timer=extractor.timer)
+        else:
+            records = []
+            progress = ProgressReporter(len(stale_fragments), "Re-extracted sessions")
+            for fragment, index in stale_fragments:
+                records.append(extractor.extract_fragment(fragment, index))
+                progress.update()
+        for (position, _, _), record in zip(stale, records):
+            sessions[position] = record
+
+    for content_hash, session in zip(hashes, sessions):
+        state.add(content_hash, session)
+    return sessions
+
+
+def write_diff(diff, diff_file=DEFAULT_DIFF_FILE):
+    """Write the session diff as JSON and print a summary."""
+    with open(diff_file, 'w', encoding='utf-8') as f:
+        json.dump(diff, f, indent=2, ensure_ascii=False)
+    print(f"Session changes: {len(diff['added'])} added, {len(diff['removed'])} removed, "
+          f"{len(diff['modified'])} modified, {diff['unchanged']} unchanged")
+    print(f"Diff saved to {diff_file}")
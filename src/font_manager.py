@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+Font Manager
+------------
+Register fonts with reportlab once per process and switch paragraph text
+to a CJK-capable font where it needs one. Latin text stays in Helvetica;
+runs of Chinese, Japanese or Korean characters are wrapped in a <font>
+tag for the first CJK TrueType font found in the directories listed in
+GTC_FONT_PATH, the repository's fonts/ directory or the system font
+directories. reportlab embeds a TrueType font as subsets of the glyphs
+actually drawn, so a catalog with a few hundred CJK titles carries only
+those glyphs rather than the whole font. If no such font is installed,
+the built-in STSong-Light CID font is used instead; PDF viewers supply
+it, so it adds nothing to the file.
+
+Parsing a font is cheap next to laying out a document (about 50 ms for
+the 10 MB SimHei.ttf), so fonts are parsed once per process and not
+cached on disk.
+"""
+
+import os
+import re
+from functools import lru_cache
+
+from reportlab.lib.fonts import addMapping
+from reportlab.pdfbase import pdfmetrics
+from reportlab.pdfbase.cidfonts import UnicodeCIDFont
+from reportlab.pdfbase.ttfonts import TTFont, TTFError
+
+from run_report import stage
+
+FONT_PATH_VARIABLE = "GTC_FONT_PATH"
+DEFAULT_FONT_DIRS = [
+    "fonts",
+    "/usr/share/fonts",
+    "/usr/local/share/fonts",
+    "~/.local/share/fonts",
+    "~/.fonts",
+    "/Library/Fonts",
+    "/System/Library/Fonts",
+    "C:/Windows/Fonts",
+]
+# TrueType-outline fonts reportlab can embed, in order of preference
+# (OpenType/CFF fonts such as Noto Sans CJK .otf are not supported)
+CJK_FONT_FILES = [
+    "SimHei.ttf",
+    "simhei.ttf",
+    "NotoSansSC-Regular.ttf",
+    "wqy-microhei.ttc",
+    "wqy-zenhei.ttc",
+    "DroidSansFallbackFull.ttf",
+    "DroidSansFallback.ttf",
+    "msyh.ttc",
+    "simsun.ttc",
+    "Arial Unicode.ttf",
+]
+CJK_FONT_NAME = "CJK"
+CJK_CID_FONT = "STSong-Light"
+
+# Ideographs, radicals, kana, Hangul, CJK punctuation and full-width forms
+CJK_RUN = re.compile(
+    "[\u1100-\u11ff\u2e80-\u2fdf\u3000-\u30ff\u3130-\u318f\u31f0-\u31ff\u3400-\u4dbf"
+    "\u4e00-\u9fff\uac00-\ud7af\uf900-\ufaff\ufe30-\ufe4f\uff00-\uffef]+"
+)
+MARKUP_TAG = re.compile(r'(<[^>]*>)')
+
+
+def font_dirs():
+    """The directories searched for fonts: GTC_FONT_PATH first, then the defaults."""
+    configured = [path for path in os.environ.get(FONT_PATH_VARIABLE, "").split(os.pathsep) if path]
+    return [os.path.expanduser(path) for path in configured + DEFAULT_FONT_DIRS]
+
+
+def find_font_file(filenames, dirs=None):
+    """Return the path of the first of filenames found under dirs, or None.
+
+    Earlier filenames win over later ones, wherever they are found.
+    """
+    found = {}
+    for directory in dirs if dirs is not None else font_dirs():
+        if os.path.isfile(directory) and os.path.basename(directory) in filenames:
+            found.setdefault(os.path.basename(directory), directory)
+            continue
+        for root, _, files in os.walk(directory):
+            for filename in files:
+                if filename in filenames:
+                    found.setdefault(filename, os.path.join(root, filename))
+    for filename in filenames:
+        if filename in found:
+            return found[filename]
+    return None
+
+
+def _register_family(name):
+    # A single face serves bold and italic too, so <b> and <i> keep working inside it
+    for bold in (0, 1):
+        for italic in (0, 1):
+            addMapping(name, bold, italic, name)
+
+
+def register_ttf(name, path, subfont_index=0):
+    """Register a TrueType font (or one face of a .ttc collection) unless it already is."""
+    if name not in pdfmetrics.getRegisteredFontNames():
+        with stage("register_font"):
+            pdfmetrics.registerFont(TTFont(name, path, subfontIndex=subfont_index))
+        _register_family(name)
+    return name
+
+
+@lru_cache(maxsize=None)
+def cjk_font():
+    """Register and return the name of the font used for CJK text in this process."""
+    path = find_font_file(CJK_FONT_FILES)
+    if path:
+        try:
+            name = register_ttf(CJK_FONT_NAME, path)
+            print(f"Using {path} for CJK text")
+            return name
+        except TTFError as e:
+            print(f"Warning: could not load {path} ({e}); using {CJK_CID_FONT} for CJK text")
+    pdfmetrics.registerFont(UnicodeCIDFont(CJK_CID_FONT))
+    _register_family(CJK_CID_FONT)
+    return CJK_CID_FONT
+
+
+def has_cjk(text):
+    return bool(CJK_RUN.search(text))
+
+
+def with_cjk_font(markup):
+    """Wrap every run of CJK characters in paragraph markup in the CJK font.
+
+    Only text between tags is changed, so tag attributes (such as index
+    terms) are left as they are.
+    """
+    if not has_cjk(markup):
+        return markup
+    font = cjk_font()
+    parts = MARKUP_TAG.split(markup)
+    for number in range(0, len(parts), 2):
+        parts[number] = CJK_RUN.sub(lambda run: f'<font name="{font}">{run.group(0)}</font>', parts[number])
+    return ''.join(parts)
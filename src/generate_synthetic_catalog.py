@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Synthetic GTC Catalog Generator
+-------------------------------
+Generate session catalog HTML with the same structure the extractor targets
+(session-title containers, descriptions, speaker details, session files,
+time and location nodes), at any scale, for benchmarking extraction.
+"""
+
+import os
+import random
+import argparse
+from html import escape
+
+CODE_PREFIXES = ['S', 'S', 'S', 'P', 'P', 'CWE', 'EXS', 'DLIT', 'WP', 'SE', 'D']
+
+TITLE_SUBJECTS = [
+    'LLM Inference', 'Digital Twins', 'CUDA Kernels', 'Robotics Simulation', 'RAG Pipelines',
+    'AI Agents', 'Quantum Computing', 'Data Center Cooling', 'Medical Imaging', 'Omniverse',
+    'Multimodal Models', 'Apache Spark', 'Graph Neural Networks', 'Autonomous Vehicles',
+    'Synthetic Data', 'Climate Simulation', 'Recommender Systems', 'Video Analytics'
+]
+TITLE_PATTERNS = [
+    'Accelerate {subject} With NVIDIA {product}',
+    'Scaling {subject} From Prototype to Production',
+    'A Practical Guide to {subject}',
+    'Building {subject} on {product}',
+    'What\'s New in {subject}',
+    '{subject}: Lessons Learned at Scale'
+]
+PRODUCTS = ['Blackwell', 'Grace Hopper', 'DGX Cloud', 'NIM', 'TensorRT-LLM', 'RAPIDS', 'Isaac Sim', 'BioNeMo']
+FIRST_NAMES = ['Alex', 'Priya', 'Wei', 'Maria', 'Jordan', 'Kenji', 'Fatima', 'Lucas', 'Olga', 'Sam']
+LAST_NAMES = ['Chen', 'Garcia', 'Patel', 'Kim', 'Nguyen', 'Müller', 'Okafor', 'Rossi', 'Silva', 'Tanaka']
+ROLES = ['Senior Engineer', 'Research Scientist', 'Product Manager', 'Solutions Architect', 'CTO']
+ORGANIZATIONS = ['NVIDIA', 'Microsoft', 'Google Cloud', 'Siemens', 'BMW Group', 'Stanford University']
+DAYS = ['Monday, Mar 17', 'Tuesday, Mar 18', 'Wednesday, Mar 19', 'Thursday, Mar 20', 'Friday, Mar 21']
+ABSTRACT_SENTENCES = [
+    'Learn how teams are moving from experiments to production deployments.',
+    'We will walk through the architecture, the trade-offs and the results.',
+    'This session covers performance tuning on the latest GPU platforms.',
+    'Attendees will see live demos and leave with reusable reference code.',
+    'We share benchmarks and best practices gathered from real customer workloads.',
+    'Discover how accelerated computing shortens time to insight across industries.'
+]
+
+
+def _session_card(rng, number):
+    """Return the HTML for one session card."""
+    prefix = rng.choice(CODE_PREFIXES)
+    code = f"{prefix}{70000 + number}"
+    title = rng.choice(TITLE_PATTERNS).format(
+        subject=rng.choice(TITLE_SUBJECTS), product=rng.choice(PRODUCTS)
+    )
+    session_url = f"https://register.nvidia.com/flow/nvidia/gtcs25/ap/page/catalog/session/{1727280000000000 + number}"
+    abstract = ' '.join(rng.sample(ABSTRACT_SENTENCES, rng.randint(2, 4)))
+
+    speakers = []
+    for _ in range(rng.randint(1, 4)):
+        name = f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}"
+        role = f"{rng.choice(ROLES)}, {rng.choice(ORGANIZATIONS)}"
+        speakers.append(
+            f'<button class="speaker-name">{escape(name)}</button>'
+            f'<span class="speaker-title">{escape(role)}</span>'
+        )
+
+    hour = rng.randint(8, 17)
+    start = f"{(hour - 1) % 12 + 1}:00 {'AM' if hour < 12 else 'PM'}"
+    end = f"{(hour - 1) % 12 + 1}:40 {'AM' if hour < 12 else 'PM'}"
+
+    parts = [
+        '<div class="catalog-result">',
+        f'<div class="catalog-result-title session-title"><a href="{session_url}">{escape(title)} [{code}]</a></div>',
+        f'<div class="session-code">[{code}]</div>',
+        f'<div class="description">{escape(abstract)}</div>',
+        f'<div class="speaker-details">{"".join(speakers)}</div>',
+        f'<div class="session-time"><span>{rng.choice(DAYS)} | {start} - {end} PDT</span></div>',
+        f'<div class="session-location"><span>📍 Room {rng.randint(100, 299)}</span></div>',
+    ]
+    if rng.random() < 0.3:
+        parts.append(
+            f'<div class="session-files"><a href="https://static.rainfocus.com/nvidia/gtcs25/{code}.pdf">'
+            f'{code}_slides.pdf</a></div>'
+        )
+    if rng.random() < 0.5:
+        parts.append(f'<a class="replay-link" href="https://www.nvidia.com/on-demand/session/{code}/">Watch Replay</a>')
+    parts.append('</div>\n')
+    return ''.join(parts)
+
+
+def generate_catalog(output_file, num_sessions, seed=2025):
+    """Write a synthetic catalog page with num_sessions session cards."""
+    rng = random.Random(seed)
+    with open(output_file, 'w', encoding='utf-8') as f:
+        f.write('<!DOCTYPE html>\n<html><head><meta charset="utf-8">'
+                '<title>Attendee Portal - Session Catalog</title></head><body>\n')
+        f.write('<div class="catalog-header"><h1>Session Catalog</h1></div>\n')
+        f.write('<div class="catalog-results">\n')
+        for number in range(num_sessions):
+            f.write(_session_card(rng, number))
+        f.write('</div>\n</body></html>\n')
+    return output_file
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate a synthetic GTC session catalog page.")
+    parser.add_argument("--sessions", type=int, default=1000, help="Number of sessions (default: 1000)")
+    parser.add_argument("--seed", type=int, default=2025, help="Random seed (default: 2025)")
+    parser.add_argument("--output", default="Attendee Portal - Session Catalog.html",
+                        help="Output HTML file (default: the name extract_sessions.py reads)")
+    args = parser.parse_args()
+
+    generate_catalog(args.output, args.sessions, args.seed)
+    size_mb = os.path.getsize(args.output) / (1024 * 1024)
+    print(f"Synthetic catalog with {args.sessions} sessions ({size_mb:.1f} MB) saved to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
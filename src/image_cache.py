@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Image Cache
+-----------
+Prepare chart and word-cloud images for embedding in PDFs. Each image is
+resized to the size it is placed at on the page and the target DPI,
+flattened onto white and recompressed as a 256-colour palette PNG (charts
+and word clouds use few colours, and reportlab keeps the palette, which
+roughly halves the embedded size), then cached by the content hash of
+the source so later builds reuse it until the source changes.
+
+Every edit of a chart leaves its old cached copies behind, so run this as
+a script now and then to prune entries that haven't been used for a while
+and, past a size limit, the least recently used ones:
+
+    python src/image_cache.py --max-age-days 30 --max-mb 200
+"""
+
+import os
+import time
+import hashlib
+import argparse
+
+from PIL import Image as PILImage
+
+from run_report import RunReport, add_report_arguments, stage
+from atomic_files import atomic_path
+
+DEFAULT_CACHE_DIR = "outputs/image_cache"
+DEFAULT_MAX_AGE_DAYS = 30
+DEFAULT_MAX_MB = 200
+DEFAULT_DPI = 150
+PALETTE_COLORS = 256
+POINTS_PER_INCH = 72.0
+
+
+def _cache_key(source_path, size):
+    digest = hashlib.sha256()
+    with open(source_path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    digest.update(f"{size[0]}x{size[1]}:p{PALETTE_COLORS}".encode('utf-8'))
+    return digest.hexdigest()[:16]
+
+
+def prepare_image(source_path, width, height, dpi=DEFAULT_DPI, cache_dir=DEFAULT_CACHE_DIR):
+    """Return the path of a copy of source_path sized for a width x height point box.
+
+    Images are only ever scaled down; a source that is already smaller than
+    the target is recompressed at its own size.
+    """
+    with PILImage.open(source_path) as source:
+        source_size = source.size
+    target = (
+        min(source_size[0], round(width / POINTS_PER_INCH * dpi)),
+        min(source_size[1], round(height / POINTS_PER_INCH * dpi))
+    )
+
+    stem = os.path.splitext(os.path.basename(source_path))[0]
+    cached_path = os.path.join(cache_dir, f"{stem}_{_cache_key(source_path, target)}.png")
+    if os.path.exists(cached_path):
+        # Mark the entry as used, which is what prune_cache() goes by
+        os.utime(cached_path)
+        return cached_path
+
+    os.makedirs(cache_dir, exist_ok=True)
+    with stage("prepare_image"):
+        with PILImage.open(source_path) as source:
+            image = source.convert('RGBA')
+        # The charts sit on a white page, so drop the alpha channel (and its soft mask in the PDF)
+        flattened = PILImage.new('RGB', image.size, 'white')
+        flattened.paste(image, mask=image.getchannel('A'))
+        if flattened.size != target:
+            flattened = flattened.resize(target, PILImage.LANCZOS)
+        paletted = flattened.convert('P', palette=PILImage.ADAPTIVE, colors=PALETTE_COLORS)
+
+        with atomic_path(cached_path) as partial_path:
+            paletted.save(partial_path, format='PNG', optimize=True, dpi=(dpi, dpi))
+    return cached_path
+
+
+def prune_cache(cache_dir=DEFAULT_CACHE_DIR, max_age_days=DEFAULT_MAX_AGE_DAYS,
+                max_mb=DEFAULT_MAX_MB, dry_run=False):
+    """Remove cached images unused for max_age_days, then the least recently used past max_mb.
+
+    Returns (files removed, bytes freed). Leftover .partial files from
+    interrupted builds count as entries like any other.
+    """
+    if not os.path.isdir(cache_dir):
+        return 0, 0
+    entries = []
+    for name in os.listdir(cache_dir):
+        path = os.path.join(cache_dir, name)
+        if os.path.isfile(path):
+            info = os.stat(path)
+            entries.append((info.st_mtime, info.st_size, path))
+    # Most recently used first, so the entries kept under the size limit are the newest
+    entries.sort(reverse=True)
+
+    cutoff = time.time() - max_age_days * 24 * 3600
+    limit = max_mb * 1024 * 1024
+    kept_bytes = 0
+    removed, freed = 0, 0
+    for mtime, size, path in entries:
+        if mtime >= cutoff and kept_bytes + size <= limit:
+            kept_bytes += size
+            continue
+        if not dry_run:
+            os.remove(path)
+        removed += 1
+        freed += size
+    return removed, freed
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Prune old and excess entries from the PDF image cache.")
+    parser.add_argument("--cache-dir", default=DEFAULT_CACHE_DIR,
+                        help=f"Image cache directory (default: {DEFAULT_CACHE_DIR})")
+    parser.add_argument("--max-age-days", type=float, default=DEFAULT_MAX_AGE_DAYS,
+                        help=f"Remove entries unused for this many days (default: {DEFAULT_MAX_AGE_DAYS})")
+    parser.add_argument("--max-mb", type=float, default=DEFAULT_MAX_MB,
+                        help=f"Then remove the least recently used entries past this size (default: {DEFAULT_MAX_MB})")
+    parser.add_argument("--dry-run", action="store_true",
+                        help="Show what would be removed without removing anything")
+    add_report_arguments(parser)
+    args = parser.parse_args()
+
+    with RunReport.from_args("image_cache", args):
+        with stage("prune_cache"):
+            removed, freed = prune_cache(args.cache_dir, args.max_age_days, args.max_mb, dry_run=args.dry_run)
+        action = "Would remove" if args.dry_run else "Removed"
+        print(f"{action} {removed} cached images from {args.cache_dir}, "
+              f"freeing {freed / (1024 * 1024):.1f} MB")
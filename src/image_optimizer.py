@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+Image Optimizer
+---------------
+Shrink the charts and word clouds after they are rendered. Each PNG is
+quantized to a 256-colour palette (the charts use about 270 colours and
+the word clouds a few thousand antialiasing shades, so the difference
+doesn't show), saved at zlib level 9 and kept if it beats the original.
+On these images level 9 is a fifth smaller than the default level 6, and
+the filtered, RLE and Huffman-only strategies never beat the default one,
+so one encode is enough. Text chunks such as matplotlib's "Software" tag
+are dropped; the DPI is kept. With webp=True each image also gets a lossless WebP
+sibling for the HTML outputs, which prefer it where the browser supports
+it.
+
+Images are optimized in a pool of worker processes, and a palette image
+that is already optimized is only recompressed, so running this twice
+doesn't degrade anything.
+
+    python src/image_optimizer.py outputs/analysis_output --webp
+"""
+
+import io
+import os
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+
+from PIL import Image as PILImage
+
+from run_report import RunReport, add_report_arguments, stage
+from atomic_files import atomic_path
+
+DEFAULT_IMAGE_DIR = "outputs/analysis_output"
+PALETTE_COLORS = 256
+ZLIB_LEVEL = 9
+WEBP_METHOD = 6
+
+
+def _without_unused_alpha(image):
+    if image.mode == 'RGBA' and image.getextrema()[3] == (255, 255):
+        return image.convert('RGB')
+    return image
+
+
+def _encode_png(image, dpi):
+    buffer = io.BytesIO()
+    options = {'dpi': dpi} if dpi else {}
+    image.save(buffer, format='PNG', compress_level=ZLIB_LEVEL, **options)
+    return buffer.getvalue()
+
+
+def webp_path(png_path):
+    return os.path.splitext(png_path)[0] + ".webp"
+
+
+def optimize_png(path, quantize=True, webp=False):
+    """Optimize one PNG in place; returns (bytes before, bytes after, WebP bytes or 0).
+
+    quantize=False keeps the colours exact and only recompresses (and
+    strips metadata).
+    """
+    before = os.path.getsize(path)
+    with PILImage.open(path) as source:
+        dpi = source.info.get('dpi')
+        original = _without_unused_alpha(source.copy())
+    image = original
+    if quantize and image.mode not in ('P', 'L', '1'):
+        # Median cut keeps the charts' flat colours exact; it can't do alpha
+        method = PILImage.Quantize.FASTOCTREE if image.mode == 'RGBA' else PILImage.Quantize.MEDIANCUT
+        image = image.quantize(PALETTE_COLORS, method=method, dither=PILImage.Dither.NONE)
+
+    data = _encode_png(image, dpi)
+    after = before
+    if len(data) < before:
+        with atomic_path(path) as partial_path, open(partial_path, 'wb') as f:
+            f.write(data)
+        after = len(data)
+    else:
+        # The PNG stays as it was, so the WebP must show the same pixels
+        image = original
+
+    webp_bytes = 0
+    if webp:
+        target = webp_path(path)
+        mode = 'RGBA' if 'transparency' in image.info or image.mode == 'RGBA' else 'RGB'
+        with atomic_path(target) as partial_path:
+            image.convert(mode).save(partial_path, format='WEBP', lossless=True, method=WEBP_METHOD)
+        webp_bytes = os.path.getsize(target)
+    return before, after, webp_bytes
+
+
+def _optimize_job(job):
+    path, quantize, webp = job
+    return (path,) + optimize_png(path, quantize, webp)
+
+
+def optimize_images(paths, quantize=True, webp=False, workers=None):
+    """Optimize the given PNGs across a process pool (workers=1 runs them here).
+
+    Returns [(path, bytes before, bytes after, WebP bytes)] and prints the
+    bytes saved.
+    """
+    jobs = [(path, quantize, webp) for path in paths]
+    if not jobs:
+        return []
+    if workers == 1 or len(jobs) == 1:
+        results = [_optimize_job(job) for job in jobs]
+    else:
+        with ProcessPoolExecutor(max_workers=min(workers or os.cpu_count(), len(jobs))) as executor:
+            results = list(executor.map(_optimize_job, jobs))
+
+    before = sum(result[1] for result in results)
+    after = sum(result[2] for result in results)
+    saved = before - after
+    print(f"Optimized {len(results)} images: {before / 1024:.0f} KB -> {after / 1024:.0f} KB "
+          f"({saved / 1024:.0f} KB saved, {saved / before:.0%})")
+    if webp:
+        webp_total = sum(result[3] for result in results)
+        print(f"WebP copies: {webp_total / 1024:.0f} KB")
+    return results
+
+
+def find_pngs(directory):
+    """The PNGs directly in directory, sorted by name."""
+    return [os.path.join(directory, name) for name in sorted(os.listdir(directory))
+            if name.lower().endswith('.png')]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Optimize the generated PNG charts and word clouds in place.")
+    parser.add_argument("paths", nargs="*", default=[DEFAULT_IMAGE_DIR],
+                        help=f"PNG files or directories of them (default: {DEFAULT_IMAGE_DIR})")
+    parser.add_argument("--lossless", action="store_true",
+                        help="Keep exact colours: recompress without palette quantization")
+    parser.add_argument("--webp", action="store_true",
+                        help="Also write a lossless WebP next to each PNG for the HTML outputs")
+    parser.add_argument("--workers", type=int, default=0,
+                        help="Processes optimizing images (0 uses all cores, default: 0)")
+    parser.add_argument("--verbose", action="store_true", help="Print the saving for each file")
+    add_report_arguments(parser)
+    args = parser.parse_args()
+
+    with RunReport.from_args("image_optimizer", args):
+        paths = []
+        for path in args.paths:
+            paths += find_pngs(path) if os.path.isdir(path) else [path]
+        with stage("optimize_images"):
+            results = optimize_images(paths, quantize=not args.lossless, webp=args.webp,
+                                      workers=args.workers or None)
+        if args.verbose:
+            for path, before, after, webp_bytes in results:
+                webp_note = f", WebP {webp_bytes / 1024:.0f} KB" if webp_bytes else ""
+                print(f"  {path}: {before / 1024:.0f} KB -> {after / 1024:.0f} KB{webp_note}")
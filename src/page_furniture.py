@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Page Furniture
+--------------
+Shared page furniture and table styles for the report PDFs. Headers,
+footers and rules that are the same on every page are drawn once per
+document into a form XObject, and each page only places the form, so a
+page's content stream carries one "Do" instead of the drawing operations
+(the form is defined when the document is saved, like the page count).
+Table styles are built once per process and shared by every table that
+uses them.
+"""
+
+from functools import lru_cache
+
+from reportlab.lib import colors
+from reportlab.platypus import TableStyle
+
+from page_numbers import PageCountCanvas
+
+FURNITURE_FORM = "PageFurniture"
+
+
+class FurnitureCanvas(PageCountCanvas):
+    """Canvas that places static page furniture from a form.
+
+    Subclasses draw the furniture in draw_furniture(), which runs once when
+    the document is saved, and call place_furniture() from
+    draw_page_decorations() on each page that shows it. Anything that
+    changes from page to page, such as the page number, is still drawn in
+    draw_page_decorations().
+    """
+
+    _furniture_placed = False
+
+    def draw_furniture(self):
+        """Draw the furniture shared by every page that shows it."""
+
+    def place_furniture(self):
+        self.doForm(FURNITURE_FORM)
+        self._furniture_placed = True
+
+    def save(self):
+        if len(self._code):
+            self.showPage()
+        if self._furniture_placed:
+            self.beginForm(FURNITURE_FORM)
+            self.draw_furniture()
+            self.endForm()
+        PageCountCanvas.save(self)
+
+
+@lru_cache(maxsize=None)
+def grid_table_style(header_background, body_background, grid_color, header_font_size=12, body_font_size=10,
+                     header_text_color=colors.white, body_text_color=colors.black, align='CENTER',
+                     centred_columns=()):
+    """A table style with a coloured header row, a shaded body and a full grid.
+
+    Styles are cached by their arguments, so each combination is built once
+    per process. centred_columns are centred whatever the overall align.
+    """
+    commands = [
+        ('BACKGROUND', (0, 0), (-1, 0), header_background),
+        ('TEXTCOLOR', (0, 0), (-1, 0), header_text_color),
+        ('ALIGN', (0, 0), (-1, -1), align),
+    ]
+    commands += [('ALIGN', (column, 0), (column, -1), 'CENTER') for column in centred_columns]
+    commands += [
+        ('FONTSIZE', (0, 0), (-1, 0), header_font_size),
+        ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+        ('BACKGROUND', (0, 1), (-1, -1), body_background),
+        ('TEXTCOLOR', (0, 1), (-1, -1), body_text_color),
+        ('FONTSIZE', (0, 1), (-1, -1), body_font_size),
+        ('GRID', (0, 0), (-1, -1), 1, grid_color)
+    ]
+    return TableStyle(commands)
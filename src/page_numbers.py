@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+Page Numbers
+------------
+"Page X of Y" numbering in a single build pass. The total isn't known
+until the last page, so each page draws "Page X of " followed by a form
+XObject that is only defined when the document is saved. Nothing is kept
+per page, so memory doesn't grow with the page count.
+"""
+
+from reportlab.pdfgen import canvas
+from reportlab.pdfbase.pdfmetrics import stringWidth
+
+PAGE_COUNT_FORM = "PageCount"
+
+
+class PageCountCanvas(canvas.Canvas):
+    """Canvas that can number pages "Page X of Y" without a second pass.
+
+    Subclasses draw their page furniture in draw_page_decorations(), which
+    runs as each page is finished, and call draw_page_number() there. The
+    total is left-aligned in space reserved for reserved_digits digits and
+    squeezed horizontally if it turns out to be wider.
+    """
+
+    font_name = "Helvetica"
+    font_size = 9
+    reserved_digits = 3
+
+    @property
+    def _reserved_width(self):
+        return stringWidth("0" * self.reserved_digits, self.font_name, self.font_size)
+
+    def draw_page_decorations(self):
+        """Draw headers, footers and page numbers on the current page."""
+
+    def draw_page_number(self, x_right, y):
+        """Draw "Page X of Y" ending at x_right."""
+        total_x = x_right - self._reserved_width
+        self.setFont(self.font_name, self.font_size)
+        self.drawRightString(total_x, y, f"Page {self._pageNumber} of ")
+        self.saveState()
+        self.translate(total_x, y)
+        self.doForm(PAGE_COUNT_FORM)
+        self.restoreState()
+
+    def showPage(self):
+        self.draw_page_decorations()
+        canvas.Canvas.showPage(self)
+
+    def save(self):
+        """Define the page count form now that the total is known, then save."""
+        # Finish a page left open, as Canvas.save() would, before counting
+        if len(self._code):
+            self.showPage()
+        total = str(self._pageNumber - 1)
+        width = stringWidth(total, self.font_name, self.font_size)
+        self.beginForm(PAGE_COUNT_FORM, lowerx=0, lowery=-self.font_size,
+                       upperx=max(width, self._reserved_width), uppery=self.font_size * 2)
+        text = self.beginText(0, 0)
+        text.setFont(self.font_name, self.font_size)
+        if width > self._reserved_width:
+            text.setHorizScale(100.0 * self._reserved_width / width)
+        text.textOut(total)
+        self.drawText(text)
+        self.endForm()
+        canvas.Canvas.save(self)
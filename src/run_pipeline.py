@@ -0,0 +1,447 @@
+#!/usr/bin/env python3
+"""
+GTC Pipeline Runner
+-------------------
+Run the GTC scripts as one pipeline. Each stage declares the artifacts it
+reads and writes; stages whose inputs are ready run concurrently, and a
+stage is skipped when the content hashes of its inputs, its code and its
+outputs all match the last successful run. In watch mode the source files
+are polled and each change rebuilds only the stages downstream of it.
+"""
+
+import os
+import ast
+import sys
+import json
+import time
+import hashlib
+import argparse
+import subprocess
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+SRC_DIR = os.path.dirname(os.path.abspath(__file__))
+STATE_FILE = "outputs/pipeline_state.json"
+LOG_DIR = "outputs/pipeline_logs"
+REPORT_DIR = "outputs/run_reports/pipeline"
+
+ANALYSIS_DIR = "outputs/analysis_output"
+MARKETING_DIR = "outputs/marketing_package"
+
+# Charts the marketing package ships and the narrative's word clouds
+KEY_VISUALS = [
+    f"{ANALYSIS_DIR}/category_distribution.png",
+    f"{ANALYSIS_DIR}/wordcloud_ai_machine_learning.png",
+    f"{ANALYSIS_DIR}/wordcloud_digital_twins_simulation.png",
+    f"{ANALYSIS_DIR}/wordcloud_industry_applications.png",
+    f"{ANALYSIS_DIR}/keywords_ai_machine_learning.png",
+]
+# The optimizer's WebP copies of them, which the narrative's HTML uses
+KEY_VISUALS_WEBP = [os.path.splitext(path)[0] + ".webp" for path in KEY_VISUALS]
+
+
+class Stage:
+    """A pipeline step: a script plus the artifacts it reads and writes."""
+
+    def __init__(self, name, script, inputs=(), outputs=(), args=(), default=True):
+        self.name = name
+        self.script = script
+        self.inputs = list(inputs)
+        self.outputs = list(outputs)
+        self.args = list(args)
+        # Non-default stages only run when named as a target
+        self.default = default
+
+    @property
+    def command(self):
+        # Stages of the same script run side by side, so each gets its own run report
+        report_file = os.path.join(REPORT_DIR, f"{self.name}.json")
+        return [sys.executable, os.path.join(SRC_DIR, self.script)] + self.args + ["--report", report_file]
+
+
+STAGES = [
+    Stage(
+        "extract", "extract_sessions.py",
+        inputs=["Attendee Portal - Session Catalog.html"],
+        outputs=["gtc_sessions_extracted.jsonl", "data/gtc_sessions_extracted.csv", "data/gtc_sessions_table.md"],
+        args=["--output", "data/gtc_sessions_extracted.csv", "--md-output", "data/gtc_sessions_table.md"],
+        default=False
+    ),
+    Stage(
+        "analysis", "enhanced_analysis.py",
+        inputs=["data/gtc_sessions_titles.txt", "data/gtc_sessions_extracted.csv"],
+        args=["--webp"],
+        outputs=[
+            f"{ANALYSIS_DIR}/gtc_insights.json",
+            f"{ANALYSIS_DIR}/gtc_sessions_categorized.json",
+            f"{ANALYSIS_DIR}/gtc_sessions_categorized_enhanced.md",
+            f"{ANALYSIS_DIR}/category_trends.json",
+            f"{ANALYSIS_DIR}/gtc_narrative_summary.md",
+        ] + KEY_VISUALS + KEY_VISUALS_WEBP
+    ),
+    # Its bar charts are drawn from the JSON, so only the word clouds are images
+    Stage(
+        "enhanced_narrative", "create_enhanced_narrative.py",
+        inputs=[f"{ANALYSIS_DIR}/gtc_insights.json", f"{ANALYSIS_DIR}/category_trends.json"]
+        + [path for path in KEY_VISUALS if "/wordcloud_" in path] + KEY_VISUALS_WEBP,
+        outputs=["outputs/GTC_2025_Enhanced_Narrative.pdf", "outputs/narrative_summary.html",
+                 "outputs/narrative_summary.md"]
+    ),
+    # The marketing documents only read the analysis JSON, so each is its own stage
+    # and a keyword change that leaves gtc_insights.json alone doesn't rebuild them
+    Stage(
+        "marketing_one_pager", "create_marketing_package.py", args=["--parts", "one_pager"],
+        inputs=[f"{ANALYSIS_DIR}/gtc_insights.json"],
+        outputs=[f"{MARKETING_DIR}/GTC_2025_Executive_Insights.pdf"]
+    ),
+    Stage(
+        "marketing_social_media", "create_marketing_package.py", args=["--parts", "social_media"],
+        inputs=[f"{ANALYSIS_DIR}/gtc_insights.json", f"{ANALYSIS_DIR}/gtc_sessions_categorized.json"],
+        outputs=[f"{MARKETING_DIR}/Social_Media_Content_Guide.pdf"]
+    ),
+    Stage(
+        "marketing_presentation", "create_marketing_package.py", args=["--parts", "presentation"],
+        inputs=[f"{ANALYSIS_DIR}/gtc_insights.json"],
+        outputs=[f"{MARKETING_DIR}/GTC_2025_Presentation_Template.pdf"]
+    ),
+    Stage(
+        "marketing_visuals", "create_marketing_package.py", args=["--parts", "visualizations,readme"],
+        inputs=KEY_VISUALS,
+        outputs=[f"{MARKETING_DIR}/visualizations/{os.path.basename(path)}" for path in KEY_VISUALS]
+        + [f"{MARKETING_DIR}/README.md"]
+    ),
+    Stage(
+        "session_catalog", "create_session_catalog.py",
+        inputs=["data/gtc_sessions_extracted.csv", f"{ANALYSIS_DIR}/gtc_sessions_categorized.json"],
+        outputs=["outputs/GTC_2025_Session_Catalog.pdf"]
+    ),
+    # Updates only the pages and search shards of sessions that changed
+    Stage(
+        "session_site", "create_session_site.py",
+        inputs=["data/gtc_sessions_extracted.csv", f"{ANALYSIS_DIR}/gtc_sessions_categorized.json"],
+        outputs=["outputs/sessions/index.html", "outputs/sessions/search.js"]
+    ),
+    Stage("gtc_narrative", "create_gtc_narrative.py", inputs=[f"{ANALYSIS_DIR}/gtc_sessions_categorized.json"],
+          outputs=["GTC_2025_Narrative.pdf"]),
+    Stage("gtc_documentation", "create_gtc_documentation.py",
+          inputs=[f"{ANALYSIS_DIR}/gtc_sessions_categorized.json"], outputs=["GTC_2025_Documentation.pdf"]),
+]
+
+
+def file_hash(path):
+    """Return the sha256 of a file's contents, or None if it doesn't exist."""
+    if not os.path.exists(path):
+        return None
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def local_sources(script, errors=None):
+    """Return the script and every src/ module it imports, directly or not.
+
+    A module that can't be read or parsed is still listed (so it is hashed
+    and watched) but its imports aren't followed; a one-line description of
+    the problem is appended to errors, if given.
+    """
+    sources = []
+    pending = [os.path.splitext(script)[0]]
+    while pending:
+        module = pending.pop()
+        path = os.path.join(SRC_DIR, f"{module}.py")
+        if path in sources or not os.path.exists(path):
+            continue
+        sources.append(path)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                tree = ast.parse(f.read(), path)
+        except SyntaxError as exc:
+            if errors is not None:
+                errors.append(f"{os.path.relpath(path)}:{exc.lineno}: {exc.msg}")
+            continue
+        except (OSError, ValueError) as exc:
+            if errors is not None:
+                errors.append(f"can't read {os.path.relpath(path)}: {exc}")
+            continue
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Import):
+                pending.extend(alias.name.split('.')[0] for alias in node.names)
+            elif isinstance(node, ast.ImportFrom) and node.module and not node.level:
+                pending.append(node.module.split('.')[0])
+    return sorted(sources)
+
+
+class Pipeline:
+    """Schedules stages by their artifacts and tracks what is up to date."""
+
+    def __init__(self, stages, state_file=STATE_FILE, log_dir=LOG_DIR):
+        self.stages = {stage.name: stage for stage in stages}
+        self.state_file = state_file
+        self.log_dir = log_dir
+        self.producers = {}
+        for stage in stages:
+            for output in stage.outputs:
+                self.producers[output] = stage.name
+        self.state = {}
+        if os.path.exists(state_file):
+            with open(state_file, 'r') as f:
+                self.state = json.load(f)
+
+    def dependencies(self, name):
+        """Names of the stages that produce this stage's inputs."""
+        return {self.producers[path] for path in self.stages[name].inputs if path in self.producers}
+
+    def select(self, targets):
+        """Return the targets plus every stage they depend on, in declaration order.
+
+        Stages run only on request (such as extract) are included only when
+        targeted; otherwise their outputs are used as they are on disk.
+        """
+        selected = set()
+        pending = list(targets)
+        while pending:
+            name = pending.pop()
+            if name not in selected:
+                selected.add(name)
+                pending.extend(dep for dep in self.dependencies(name)
+                               if self.stages[dep].default or dep in targets)
+        return [name for name in self.stages if name in selected]
+
+    def downstream(self, names):
+        """Return the given stages plus every stage that depends on them."""
+        affected = set(names)
+        changed = True
+        while changed:
+            changed = False
+            for name in self.stages:
+                if name not in affected and self.dependencies(name) & affected:
+                    affected.add(name)
+                    changed = True
+        return affected
+
+    def watched_files(self, names):
+        """Map each source file and external input of the stages to the stages that read it."""
+        readers = {}
+        for name in names:
+            stage = self.stages[name]
+            external = [path for path in stage.inputs if self.producers.get(path) not in names]
+            for path in [os.path.relpath(source) for source in local_sources(stage.script)] + external:
+                readers.setdefault(path, set()).add(name)
+        return readers
+
+    def fingerprint(self, name):
+        """Hash the stage's command, code and input contents."""
+        stage = self.stages[name]
+        digest = hashlib.sha256(json.dumps(stage.args).encode('utf-8'))
+        for path in local_sources(stage.script) + stage.inputs:
+            digest.update(f"{os.path.relpath(path)}:{file_hash(path)}\n".encode('utf-8'))
+        return digest.hexdigest()
+
+    def is_up_to_date(self, name):
+        previous = self.state.get(name)
+        if not previous or previous.get("fingerprint") != self.fingerprint(name):
+            return False
+        # Outputs that were deleted or edited since the last run are rebuilt
+        return all(file_hash(path) == previous["outputs"].get(path)
+                   for path in self.stages[name].outputs)
+
+    def _record(self, name):
+        stage = self.stages[name]
+        self.state[name] = {
+            "fingerprint": self.fingerprint(name),
+            "outputs": {path: file_hash(path) for path in stage.outputs},
+            "completed_at": time.strftime("%Y-%m-%dT%H:%M:%S")
+        }
+        state_dir = os.path.dirname(self.state_file)
+        if state_dir:
+            os.makedirs(state_dir, exist_ok=True)
+        with open(self.state_file, 'w') as f:
+            json.dump(self.state, f, indent=2)
+
+    def _execute(self, name):
+        """Run one stage's script, logging its output, and return (returncode, seconds)."""
+        stage = self.stages[name]
+        os.makedirs(self.log_dir, exist_ok=True)
+        log_file = os.path.join(self.log_dir, f"{name}.log")
+        start = time.perf_counter()
+        with open(log_file, 'w') as log:
+            returncode = subprocess.call(stage.command, stdout=log, stderr=subprocess.STDOUT)
+        return returncode, time.perf_counter() - start
+
+    def _missing_inputs(self, name):
+        return [path for path in self.stages[name].inputs if not os.path.exists(path)]
+
+    def run(self, targets, jobs=None, force=False, dry_run=False):
+        """Run the selected stages, concurrently where possible; return the failed ones."""
+        order = self.select(targets)
+        remaining = set(order)
+        finished, failed, ran = set(), set(), set()
+        running = {}
+
+        with ThreadPoolExecutor(max_workers=jobs or os.cpu_count()) as executor:
+            while remaining or running:
+                waiting = len(remaining)
+                for name in order:
+                    if name not in remaining:
+                        continue
+                    deps = self.dependencies(name) & set(order)
+                    if deps & failed:
+                        print(f"[{name}] skipped: upstream stage failed")
+                        remaining.discard(name)
+                        failed.add(name)
+                        continue
+                    if not deps <= finished:
+                        continue
+                    remaining.discard(name)
+
+                    # In a dry run an upstream rebuild invalidates everything downstream
+                    stale = force or (dry_run and deps & ran) or not self.is_up_to_date(name)
+                    if not stale:
+                        print(f"[{name}] up to date")
+                        finished.add(name)
+                        continue
+                    if dry_run:
+                        print(f"[{name}] would run {self.stages[name].script}")
+                        ran.add(name)
+                        finished.add(name)
+                        continue
+                    errors = []
+                    local_sources(self.stages[name].script, errors)
+                    if errors:
+                        print(f"[{name}] failed: {errors[0]}")
+                        failed.add(name)
+                        continue
+                    missing = self._missing_inputs(name)
+                    if missing:
+                        print(f"[{name}] failed: missing input {', '.join(missing)}")
+                        failed.add(name)
+                        continue
+                    print(f"[{name}] running {self.stages[name].script}...")
+                    running[executor.submit(self._execute, name)] = name
+
+                if not running:
+                    if len(remaining) == waiting:
+                        raise RuntimeError(f"Stages depend on each other: {', '.join(sorted(remaining))}")
+                    continue
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    name = running.pop(future)
+                    returncode, seconds = future.result()
+                    if returncode == 0:
+                        self._record(name)
+                        ran.add(name)
+                        finished.add(name)
+                        print(f"[{name}] done in {seconds:.1f}s")
+                    else:
+                        failed.add(name)
+                        print(f"[{name}] failed with exit code {returncode} after {seconds:.1f}s; "
+                              f"see {os.path.join(self.log_dir, name + '.log')}")
+        return failed
+
+
+def _snapshot(paths):
+    snapshot = {}
+    for path in paths:
+        try:
+            info = os.stat(path)
+            snapshot[path] = (info.st_mtime_ns, info.st_size)
+        except OSError:
+            snapshot[path] = None
+    return snapshot
+
+
+def _run_and_report(pipeline, names, jobs=None):
+    """Run the stages, printing an unexpected error instead of raising it."""
+    try:
+        pipeline.run(names, jobs=jobs)
+    except Exception as exc:
+        print(f"Build stopped: {type(exc).__name__}: {exc}")
+
+
+def watch(pipeline, targets, jobs=None, interval=1.0):
+    """Build, then rebuild whatever depends on each file that changes.
+
+    A failed or crashed rebuild is reported and watching continues, so
+    saving a half-edited file doesn't end the session.
+    """
+    order = pipeline.select(targets)
+    _run_and_report(pipeline, order, jobs=jobs)
+    readers = pipeline.watched_files(order)
+    snapshot = _snapshot(readers)
+    print(f"\nWatching {len(readers)} files for changes (Ctrl+C to stop)...")
+
+    try:
+        while True:
+            time.sleep(interval)
+            current = _snapshot(readers)
+            changed = [path for path in readers if current[path] != snapshot[path]]
+            if not changed:
+                continue
+
+            # Let editors finish writing before rebuilding
+            time.sleep(interval)
+            current = _snapshot(readers)
+            changed = [path for path in readers if current[path] != snapshot[path]]
+
+            stages = pipeline.downstream(set().union(*(readers[path] for path in changed))) & set(order)
+            print(f"\nChanged: {', '.join(changed)}")
+            print(f"Checking: {', '.join(name for name in order if name in stages)}")
+            start = time.perf_counter()
+            _run_and_report(pipeline, [name for name in order if name in stages], jobs=jobs)
+            print(f"Rebuild finished in {time.perf_counter() - start:.1f}s")
+
+            # A stage may have started importing another module
+            readers = pipeline.watched_files(order)
+            snapshot = _snapshot(readers)
+    except KeyboardInterrupt:
+        print("\nStopped watching.")
+
+
+def main():
+    pipeline_stages = ", ".join(stage.name for stage in STAGES)
+    parser = argparse.ArgumentParser(description="Run the GTC pipeline, rebuilding only what changed.")
+    parser.add_argument("targets", nargs="*",
+                        help=f"Stages to build, with everything they depend on ({pipeline_stages}); "
+                             "default: every stage except extract")
+    parser.add_argument("--jobs", type=int, default=0,
+                        help="Stages to run at the same time (0 uses all cores, default: 0)")
+    parser.add_argument("--force", action="store_true", help="Rerun stages even if they are up to date")
+    parser.add_argument("--dry-run", action="store_true", help="Show which stages would run")
+    parser.add_argument("--list", action="store_true", help="List the stages and their artifacts")
+    parser.add_argument("--watch", action="store_true",
+                        help="Keep running and rebuild the stages affected by each changed file")
+    parser.add_argument("--interval", type=float, default=1.0,
+                        help="Seconds between checks for changes in watch mode (default: 1.0)")
+    args = parser.parse_args()
+
+    if args.list:
+        for stage in STAGES:
+            print(f"{stage.name} ({stage.script}){'' if stage.default else ' [on request]'}")
+            for path in stage.inputs:
+                print(f"  < {path}")
+            for path in stage.outputs:
+                print(f"  > {path}")
+        return
+
+    for target in args.targets:
+        if target not in {stage.name for stage in STAGES}:
+            parser.error(f"unknown stage {target!r} (choose from {pipeline_stages})")
+    targets = args.targets or [stage.name for stage in STAGES if stage.default]
+
+    pipeline = Pipeline(STAGES)
+    if args.watch:
+        watch(pipeline, targets, jobs=args.jobs or None, interval=args.interval)
+        return
+
+    start = time.perf_counter()
+    failed = pipeline.run(targets, jobs=args.jobs or None, force=args.force, dry_run=args.dry_run)
+    if not args.dry_run:
+        print(f"\nPipeline finished in {time.perf_counter() - start:.1f}s")
+    if failed:
+        print(f"Failed stages: {', '.join(sorted(failed))}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,303 @@
+#!/usr/bin/env python3
+"""
+Run Reports
+-----------
+Lightweight per-stage instrumentation shared by all entry points. Code marks
+its stages with `with stage("name"):`, which records wall time, CPU time and
+peak memory while a RunReport is active and does nothing otherwise. Each run
+writes a JSON report that can be compared against a previous one to flag
+regressions, and selected stages (or the whole run) can be profiled.
+"""
+
+import os
+import sys
+import json
+import time
+import platform
+import tracemalloc
+from contextlib import contextmanager, nullcontext
+from datetime import datetime
+
+from stage_profiler import StageProfiler
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+DEFAULT_REPORT_DIR = "outputs/run_reports"
+
+# Profile name used when the whole run is profiled
+WHOLE_RUN = "all"
+
+# Relative growth that counts as a regression, and the absolute floors below
+# which differences are treated as noise
+DEFAULT_THRESHOLD = 0.2
+MIN_SECONDS_DELTA = 0.05
+MIN_MB_DELTA = 5.0
+
+
+def peak_rss_mb():
+    """Return the peak resident set size of this process so far, in MB."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and kilobytes on Linux
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+
+class RunReport:
+    """Collects stage measurements for one run of an entry point."""
+
+    # The report stages are recorded into, if any
+    current = None
+
+    def __init__(self, entry_point, report_file=None, compare_file=None,
+                 trace_memory=False, threshold=DEFAULT_THRESHOLD, profile=None):
+        self.entry_point = entry_point
+        self.report_file = report_file or os.path.join(DEFAULT_REPORT_DIR, f"{entry_point}.json")
+        self.compare_file = compare_file
+        self.trace_memory = trace_memory
+        self.threshold = threshold
+        self.stages = []
+        self._records = {}
+        self.regressions = []
+        self._stack = []
+        self._baseline = None
+
+        # Stages to profile: a stage matches by full name (parent/child) or
+        # by its own name, so "doc.build" covers every document build
+        self.profile_stages = {name.strip() for name in profile.split(",")} if profile else set()
+        self.profile_dir = os.path.join(os.path.dirname(self.report_file), "profiles", entry_point)
+        self._profilers = {}
+        self._active_profiler = None
+
+    @classmethod
+    def from_args(cls, entry_point, args):
+        """Create a report from the options added by add_report_arguments()."""
+        return cls(
+            entry_point,
+            report_file=args.report,
+            compare_file=args.compare,
+            trace_memory=args.trace_memory,
+            threshold=args.regression_threshold,
+            profile=args.profile
+        )
+
+    def __enter__(self):
+        # Read the baseline now, since the report may overwrite the same file
+        compare_file = self.report_file if self.compare_file == 'previous' else self.compare_file
+        if compare_file:
+            if os.path.exists(compare_file):
+                with open(compare_file, 'r') as f:
+                    self._baseline = json.load(f)
+            else:
+                print(f"Warning: no previous report at {compare_file}; skipping comparison")
+
+        if self.trace_memory:
+            tracemalloc.start()
+        self.started_at = datetime.now().isoformat(timespec='seconds')
+        self._wall_start = time.perf_counter()
+        self._cpu_start = time.process_time()
+        RunReport.current = self
+        if WHOLE_RUN in self.profile_stages:
+            self._start_profiler(WHOLE_RUN)
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        RunReport.current = None
+        if self._active_profiler is not None:
+            self._stop_profiler()
+        self.wall_seconds = time.perf_counter() - self._wall_start
+        self.cpu_seconds = time.process_time() - self._cpu_start
+        if self.trace_memory:
+            tracemalloc.stop()
+
+        if self._baseline is not None:
+            self.regressions = self.compare(self._baseline)
+        self.save(failed=exc_type is not None)
+        self.print_summary()
+        self.save_profiles()
+
+    @contextmanager
+    def stage(self, name):
+        """Measure a stage; nested stages are recorded as parent/child."""
+        full_name = "/".join([entry["name"] for entry in self._stack] + [name])
+        entry = {"name": name, "traced_peak": 0}
+        self._stack.append(entry)
+
+        # Records are listed in the order stages first start, so parents precede
+        # children; a stage entered repeatedly (e.g. in a loop) is accumulated
+        record = self._records.get(full_name)
+        if record is None:
+            record = {"stage": full_name, "calls": 0, "wall_seconds": 0.0, "cpu_seconds": 0.0}
+            self._records[full_name] = record
+            self.stages.append(record)
+
+        if self.trace_memory:
+            # Carry the parent's peak so far before resetting it for this stage
+            if len(self._stack) > 1:
+                parent = self._stack[-2]
+                parent["traced_peak"] = max(parent["traced_peak"], tracemalloc.get_traced_memory()[1])
+            tracemalloc.reset_peak()
+
+        # Profiles don't nest: a stage inside a profiled stage is already covered
+        profiled = self._active_profiler is None and (
+            full_name in self.profile_stages or name in self.profile_stages
+        )
+        if profiled:
+            self._start_profiler(full_name)
+
+        wall_start = time.perf_counter()
+        cpu_start = time.process_time()
+        rss_start = peak_rss_mb()
+        try:
+            yield
+        finally:
+            if profiled:
+                self._stop_profiler()
+            record["calls"] += 1
+            record["wall_seconds"] = round(record["wall_seconds"] + time.perf_counter() - wall_start, 4)
+            record["cpu_seconds"] = round(record["cpu_seconds"] + time.process_time() - cpu_start, 4)
+            # ru_maxrss is the process's high-water mark, so the peak recorded for
+            # a stage includes everything before it; the growth of that mark while
+            # the stage ran is what the stage itself added
+            rss_end = peak_rss_mb()
+            record["process_peak_rss_mb"] = _round(rss_end)
+            if rss_end is not None:
+                record["rss_growth_mb"] = _round(record.get("rss_growth_mb", 0) + rss_end - rss_start)
+            if self.trace_memory:
+                traced_peak = max(entry["traced_peak"], tracemalloc.get_traced_memory()[1])
+                record["peak_traced_mb"] = max(record.get("peak_traced_mb", 0),
+                                               round(traced_peak / (1024 * 1024), 2))
+                if len(self._stack) > 1:
+                    parent = self._stack[-2]
+                    parent["traced_peak"] = max(parent["traced_peak"], traced_peak)
+            self._stack.pop()
+
+    def _start_profiler(self, name):
+        profiler = self._profilers.get(name)
+        if profiler is None:
+            profiler = self._profilers[name] = StageProfiler(name)
+        profiler.start()
+        self._active_profiler = profiler
+
+    def _stop_profiler(self):
+        self._active_profiler.stop()
+        self._active_profiler = None
+
+    def save_profiles(self):
+        """Write the .pstats and collapsed-stack files of every profiled stage."""
+        if not self.profile_stages:
+            return
+        if not self._profilers:
+            print(f"Warning: no stage matched --profile {','.join(sorted(self.profile_stages))}")
+            return
+        for name, profiler in self._profilers.items():
+            pstats_file, collapsed_file = profiler.save(self.profile_dir)
+            print(f"\nProfile of {name}: {pstats_file}, {collapsed_file}")
+            for label, seconds in profiler.top_functions():
+                print(f"  {seconds:8.2f}s  {label}")
+
+    def to_dict(self):
+        return {
+            "entry_point": self.entry_point,
+            "started_at": self.started_at,
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "wall_seconds": round(self.wall_seconds, 4),
+            "cpu_seconds": round(self.cpu_seconds, 4),
+            "peak_rss_mb": _round(peak_rss_mb()),
+            "stages": self.stages,
+            "regressions": self.regressions
+        }
+
+    def save(self, failed=False):
+        report_dir = os.path.dirname(self.report_file)
+        if report_dir:
+            os.makedirs(report_dir, exist_ok=True)
+        data = self.to_dict()
+        data["failed"] = failed
+        with open(self.report_file, 'w') as f:
+            json.dump(data, f, indent=2)
+
+    def compare(self, baseline):
+        """Return the stages that got slower or used more memory than the baseline.
+
+        The run's peak RSS is compared as the stage "(run)".
+        """
+        previous = {stage["stage"]: stage for stage in baseline.get("stages", [])}
+        previous["(run)"] = {"peak_rss_mb": baseline.get("peak_rss_mb")}
+        current = self.stages + [{"stage": "(run)", "peak_rss_mb": _round(peak_rss_mb())}]
+        regressions = []
+        for stage in current:
+            old = previous.get(stage["stage"])
+            if not old:
+                continue
+            for metric, floor in (("wall_seconds", MIN_SECONDS_DELTA),
+                                  ("cpu_seconds", MIN_SECONDS_DELTA),
+                                  ("peak_traced_mb", MIN_MB_DELTA),
+                                  ("rss_growth_mb", MIN_MB_DELTA),
+                                  ("peak_rss_mb", MIN_MB_DELTA)):
+                old_value, new_value = old.get(metric), stage.get(metric)
+                if old_value is None or new_value is None:
+                    continue
+                if new_value - old_value > max(floor, old_value * self.threshold):
+                    regressions.append({
+                        "stage": stage["stage"],
+                        "metric": metric,
+                        "previous": old_value,
+                        "current": new_value,
+                        "change": round(new_value / old_value - 1, 3) if old_value else None
+                    })
+        return regressions
+
+    def print_summary(self):
+        print(f"\nRun report ({self.entry_point}): {self.wall_seconds:.2f}s wall, "
+              f"{self.cpu_seconds:.2f}s CPU")
+        for record in self.stages:
+            depth = record["stage"].count("/")
+            line = (f"  {'  ' * depth}{record['stage'].rsplit('/', 1)[-1]:<{32 - 2 * depth}} "
+                    f"{record['wall_seconds']:8.2f}s wall {record['cpu_seconds']:8.2f}s CPU")
+            if record.get("rss_growth_mb"):
+                line += f" {record['rss_growth_mb']:+8.1f} MB RSS"
+            if "peak_traced_mb" in record:
+                line += f" {record['peak_traced_mb']:9.1f} MB traced"
+            if record["calls"] > 1:
+                line += f"  ({record['calls']} calls)"
+            print(line)
+        for regression in self.regressions:
+            change = f" (+{regression['change']:.0%})" if regression["change"] is not None else ""
+            print(f"  REGRESSION {regression['stage']} {regression['metric']}: "
+                  f"{regression['previous']} -> {regression['current']}{change}")
+        print(f"Run report saved to {self.report_file}")
+
+
+def _round(value, digits=1):
+    return round(value, digits) if value is not None else None
+
+
+def stage(name):
+    """Measure a stage of the active run report, or do nothing without one."""
+    if RunReport.current is None:
+        return nullcontext()
+    return RunReport.current.stage(name)
+
+
+def add_report_arguments(parser):
+    """Add the run-report options shared by every entry point."""
+    group = parser.add_argument_group("run report")
+    group.add_argument("--report", metavar="PATH",
+                       help=f"Where to write the JSON run report (default: {DEFAULT_REPORT_DIR}/<script>.json)")
+    group.add_argument("--compare", metavar="PATH", nargs="?", const="previous",
+                       help="Flag regressions against a previous report; without PATH, "
+                            "compare against the report this run replaces")
+    group.add_argument("--trace-memory", action="store_true",
+                       help="Record per-stage peak Python memory with tracemalloc (slower)")
+    group.add_argument("--profile", metavar="STAGES", nargs="?", const=WHOLE_RUN,
+                       help="Profile the given comma-separated stages (e.g. generate_word_clouds "
+                            "or doc.build) with cProfile and stack sampling; without STAGES, "
+                            "profile the whole run")
+    group.add_argument("--regression-threshold", type=float, default=DEFAULT_THRESHOLD,
+                       help=f"Relative increase flagged as a regression (default: {DEFAULT_THRESHOLD})")
+    return parser
@@ -0,0 +1,286 @@
+#!/usr/bin/env python3
+"""
+GTC Session Extraction Engine
+-----------------------------
+Field extraction for session containers in the GTC catalog page. All of the
+selectors are compiled once with soupsieve and then evaluated against each
+session container, instead of walking the subtree with Python lambdas.
+"""
+
+import os
+import time
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+
+import soupsieve as sv
+from bs4 import BeautifulSoup
+
+# Selectors for the session containers themselves
+CONTAINER_SELECTOR = sv.compile('div.catalog-result-title.session-title')
+CONTAINER_FALLBACK_SELECTOR = sv.compile('div[class*="session-title"]')
+
+# Keywords that identify a link as a replay of the session
+REPLAY_INDICATORS = ['replay', 'watch', 'video', 'stream', 'recording']
+
+# Session codes with these prefixes use the session URL as the replay URL
+REPLAY_SESSION_PREFIXES = ['D', 'P', 'S']
+
+
+class ProgressReporter:
+    """Prints progress at most once per interval instead of once per item."""
+
+    def __init__(self, total, label="Processing sessions", interval=2.0):
+        self.total = total
+        self.label = label
+        self.interval = interval
+        self.done = 0
+        self.start = time.perf_counter()
+        self.last_report = self.start
+
+    def update(self, count=1):
+        """Record completed items and print if the interval has elapsed."""
+        self.done += count
+        now = time.perf_counter()
+        finished = self.total is not None and self.done >= self.total
+        if finished or now - self.last_report >= self.interval:
+            self.last_report = now
+            rate = self.done / max(now - self.start, 1e-9)
+            # The total is unknown (None) when streaming
+            total = f"/{self.total}" if self.total is not None else ""
+            print(f"{self.label}: {self.done}{total} ({rate:.0f}/s)")
+
+
+class FieldTimer:
+    """Accumulates the time spent extracting each field across all sessions."""
+
+    def __init__(self):
+        self.totals = defaultdict(float)
+        self.counts = defaultdict(int)
+
+    def measure(self, field, func, *args):
+        """Call func(*args) and add its wall time to the given field."""
+        start = time.perf_counter()
+        result = func(*args)
+        self.totals[field] += time.perf_counter() - start
+        self.counts[field] += 1
+        return result
+
+    def merge(self, totals, counts):
+        """Add per-field totals and counts recorded elsewhere (e.g. in a worker)."""
+        for field, total in totals.items():
+            self.totals[field] += total
+            self.counts[field] += counts[field]
+
+    def report(self):
+        """Print a per-field timing breakdown, slowest field first."""
+        grand_total = sum(self.totals.values())
+        if not grand_total:
+            return
+        print("Per-field extraction timing:")
+        for field, total in sorted(self.totals.items(), key=lambda x: x[1], reverse=True):
+            count = self.counts[field]
+            print(f"  {field:<12} {total * 1000:9.1f} ms total  "
+                  f"{total / count * 1e6:8.1f} us/session  {total / grand_total:6.1%}")
+
+
+class SessionExtractor:
+    """Extracts session records from catalog containers with precompiled selectors."""
+
+    def __init__(self, timer=None):
+        self.timer = timer or FieldTimer()
+
+        # Compile every selector once; they are reused for every container
+        self.title_link = sv.compile('a')
+        # Any div with "[" in its text; _extract_code then checks .string as
+        # find('div', text=...) did, which also covers a code in a lone nested span
+        self.code_candidates = sv.compile('div:-soup-contains("[")')
+        self.description = sv.compile('div.description')
+        self.description_fallback = sv.compile('div[class*="description"]')
+        self.speaker_details = sv.compile('div[class*="speaker-details"]')
+        self.speaker_buttons = sv.compile('button[class*="speaker"]')
+        self.date_time = sv.compile(
+            ':-soup-contains-own("AM", "PM"):not(:-soup-contains-own("LAM"))'
+        )
+        self.location = sv.compile(
+            ':-soup-contains-own("📍", "Room"):not(:-soup-contains-own("LAM"))'
+        )
+        self.file_links = sv.compile('div[class*="session-files"] a[href]')
+        self.links = sv.compile('a[href]')
+
+    def find_containers(self, soup):
+        """Return all session-title containers in the parsed catalog."""
+        containers = CONTAINER_SELECTOR.select(soup)
+        if not containers:
+            print("Warning: No sessions found using first selector. Trying alternative...")
+            containers = CONTAINER_FALLBACK_SELECTOR.select(soup)
+        return containers
+
+    def extract(self, container):
+        """Extract a single session record from a session-title container."""
+        parent = container.find_parent()
+        measure = self.timer.measure
+
+        session_title, session_url = measure('title', self._extract_title, container)
+        session_code = measure('code', self._extract_code, parent)
+        abstract = measure('abstract', self._extract_abstract, parent)
+        speakers_list = measure('speakers', self._extract_speakers, parent)
+        date_time = measure('date_time', self._extract_date_time, parent)
+        location = measure('location', self._extract_location, parent)
+        files = measure('files', self._extract_files, parent)
+        replay_url = measure('replay', self._extract_replay, parent, session_url, session_code)
+
+        return {
+            "session_code": session_code,
+            "title": session_title,
+            "url": session_url,
+            "abstract": abstract,
+            "speakers": speakers_list,
+            "date_time": date_time,
+            "location": location,
+            "files": files,
+            "replay_url": replay_url
+        }
+
+    def extract_fragment(self, fragment, index=0):
+        """Parse a serialized session fragment and extract its index-th session."""
+        soup = BeautifulSoup(fragment, 'html.parser')
+        containers = CONTAINER_SELECTOR.select(soup) or CONTAINER_FALLBACK_SELECTOR.select(soup)
+        return self.extract(containers[index])
+
+    def _extract_title(self, container):
+        title_element = self.title_link.select_one(container)
+        if not title_element:
+            return None, None
+        return title_element.text.strip(), title_element.get('href')
+
+    def _extract_code(self, parent):
+        for element in self.code_candidates.select(parent):
+            text = element.string
+            if text and text.strip().startswith('[') and ']' in text:
+                return element.text.strip()
+        return None
+
+    def _extract_abstract(self, parent):
+        abstract_div = (self.description.select_one(parent)
+                        or self.description_fallback.select_one(parent))
+        return abstract_div.text.strip() if abstract_div else None
+
+    def _extract_speakers(self, parent):
+        speakers_list = []
+        speakers_area = self.speaker_details.select_one(parent)
+        if not speakers_area:
+            return speakers_list
+
+        speaker_elements = self.speaker_buttons.select(speakers_area)
+        if speaker_elements:
+            for speaker_elem in speaker_elements:
+                # The title/organization follows the speaker button
+                next_elem = speaker_elem.find_next('span')
+                speakers_list.append({
+                    "name": speaker_elem.text.strip(),
+                    "title_organization": next_elem.text.strip() if next_elem else None
+                })
+        else:
+            # Fall back to one speaker per line of text
+            for text in speakers_area.get_text().strip().split('\n'):
+                if text.strip():
+                    speakers_list.append({
+                        "name": text.strip(),
+                        "title_organization": None
+                    })
+        return speakers_list
+
+    def _extract_date_time(self, parent):
+        date_time_div = self.date_time.select_one(parent)
+        return date_time_div.text.strip() if date_time_div else None
+
+    def _extract_location(self, parent):
+        location_div = self.location.select_one(parent)
+        if not location_div:
+            return None
+        return location_div.text.replace('📍', '').strip()
+
+    def _extract_files(self, parent):
+        return [
+            {"file_name": link.text.strip(), "file_url": link['href']}
+            for link in self.file_links.select(parent)
+        ]
+
+    def _extract_replay(self, parent, session_url, session_code):
+        # Check all links for replay indicators in the link text or URL
+        for link in self.links.select(parent):
+            link_text = link.text.lower()
+            link_href = link['href'].lower()
+            if any(indicator in link_text or indicator in link_href for indicator in REPLAY_INDICATORS):
+                return link['href']
+
+        # Fallback: for sessions with certain codes, the session URL is likely the replay URL
+        if session_url and session_code and any(code in session_code for code in REPLAY_SESSION_PREFIXES):
+            return session_url
+        return None
+
+
+def split_into_fragments(containers):
+    """Serialize each container's parent into an independent HTML fragment.
+
+    Returns (fragment, index) pairs in catalog order, where index is the
+    position of the container among the containers inside that fragment.
+    """
+    fragments = []
+    serialized = {}
+    seen = defaultdict(int)
+    for container in containers:
+        parent = container.find_parent()
+        key = id(parent)
+        if key not in serialized:
+            serialized[key] = str(parent)
+        fragments.append((serialized[key], seen[key]))
+        seen[key] += 1
+    return fragments
+
+
+def _extract_fragment_chunk(chunk):
+    """Worker: parse each fragment and extract its session record."""
+    extractor = SessionExtractor()
+    records = [extractor.extract_fragment(fragment, index) for fragment, index in chunk]
+    return records, dict(extractor.timer.totals), dict(extractor.timer.counts)
+
+
+def extract_parallel(containers, workers=None, chunk_size=50, timer=None):
+    """Extract sessions from containers across a process pool.
+
+    The catalog is split into per-session fragments, extracted in chunks by
+    worker processes and reassembled in catalog order.
+    """
+    return extract_fragments_parallel(split_into_fragments(containers),
+                                      workers=workers, chunk_size=chunk_size, timer=timer)
+
+
+def iter_fragments_parallel(fragments, workers=None, chunk_size=50, timer=None):
+    """Yield records for (fragment, index) pairs extracted across a process pool.
+
+    Records are yielded in the order of the input fragments as soon as each
+    chunk completes, so callers can stream them out without waiting for the
+    whole catalog.
+    """
+    timer = timer if timer is not None else FieldTimer()
+    chunks = [fragments[i:i + chunk_size] for i in range(0, len(fragments), chunk_size)]
+    workers = workers or os.cpu_count() or 1
+    print(f"Extracting {len(fragments)} sessions in {len(chunks)} chunks with {workers} workers...")
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        # map() yields results in submission order, so catalog order is kept
+        for records, totals, counts in executor.map(_extract_fragment_chunk, chunks):
+            timer.merge(totals, counts)
+            yield from records
+
+
+def extract_fragments_parallel(fragments, workers=None, chunk_size=50, timer=None):
+    """Extract (fragment, index) pairs across a process pool, keeping their order."""
+    timer = timer if timer is not None else FieldTimer()
+    sessions = []
+    progress = ProgressReporter(len(fragments), "Extracted sessions")
+    for record in iter_fragments_parallel(fragments, workers, chunk_size, timer):
+        sessions.append(record)
+        progress.update()
+    return sessions, timer
@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+"""
+Session Markdown Export
+-----------------------
+Write extracted sessions as Markdown tables. Rows are written straight to
+the file handle as they are formatted, and the table can optionally be
+sharded by session-code prefix or by category into several smaller files
+with an index page.
+"""
+
+import os
+import re
+import json
+
+TABLE_HEADER = (
+    "| Session Code | Title | Speakers | Date/Time | Location | Files | Replay | Abstract |\n"
+    "|-------------|-------|----------|-----------|----------|-------|--------|----------|\n"
+)
+
+DEFAULT_CATEGORIES_FILE = "outputs/analysis_output/gtc_sessions_categorized.json"
+
+# A session code such as [S72484] or [DLIT71470], alone or at the end of a title
+SESSION_CODE_PATTERN = re.compile(r'\[([A-Za-z]+)(\d+)\]\s*$')
+
+
+def clean_text_for_markdown(text):
+    """Make text safe to place inside a Markdown table cell."""
+    if text is None:
+        return ""
+    # Replace newlines, pipe characters, and excessive spaces
+    cleaned = str(text).replace('\n', ' ').replace('|', '\\|').replace('\r', ' ')
+    # Remove any non-breaking spaces or other problematic characters
+    return ' '.join(cleaned.split())
+
+
+def is_valid_time(text):
+    """Check for a time string (AM or PM, but not as part of a word like LAM)."""
+    if not text:
+        return False
+    return bool((" AM" in text or " PM" in text) and not ("LAM" in text))
+
+
+def session_code_of(session):
+    """Return the bare session code (e.g. S72484) from the code or the title."""
+    for text in (session.get('session_code'), session.get('title')):
+        match = SESSION_CODE_PATTERN.search(text or '')
+        if match:
+            return match.group(1) + match.group(2)
+    return None
+
+
+def session_code_prefix(session):
+    """Return the letter prefix of the session code (e.g. S, P, DLIT)."""
+    code = session_code_of(session)
+    return re.match(r'[A-Za-z]+', code).group(0).upper() if code else "Other"
+
+
+def load_category_lookup(categories_file=DEFAULT_CATEGORIES_FILE):
+    """Map session codes to categories from the categorized analysis output."""
+    if not os.path.exists(categories_file):
+        print(f"Warning: {categories_file} not found; all sessions will be uncategorized")
+        return {}
+    with open(categories_file, 'r') as f:
+        categorized = json.load(f)
+    return {
+        entry["code"]: category
+        for category, entries in categorized.items()
+        for entry in entries
+    }
+
+
+def consolidate_sessions(sessions):
+    """Merge duplicate rows of a session, keeping each speaker once.
+
+    Sessions are keyed by code and title; a set of speaker names per session
+    makes each duplicate check O(1).
+    """
+    consolidated = {}
+    seen_speakers = {}
+    for session in sessions:
+        session_id = f"{session.get('session_code', '')}_{session.get('title', '')}"
+
+        if session_id not in consolidated:
+            consolidated[session_id] = dict(session, speakers=[])
+            seen_speakers[session_id] = set()
+
+        names = seen_speakers[session_id]
+        for speaker in session.get('speakers') or []:
+            speaker_name = speaker.get('name', '')
+            if speaker_name and speaker_name not in names:
+                names.add(speaker_name)
+                consolidated[session_id]['speakers'].append(speaker)
+    return consolidated.values()
+
+
+def format_markdown_row(session):
+    """Format one session as a Markdown table row."""
+    session_code = clean_text_for_markdown(session.get('session_code', ''))
+    title = clean_text_for_markdown(session.get('title', ''))
+
+    # Format speakers as a list with line breaks
+    speakers_list = []
+    for speaker in session.get('speakers', []):
+        if isinstance(speaker, dict) and 'name' in speaker:
+            name = speaker['name']
+            if speaker.get('title_organization'):
+                name += f" ({speaker['title_organization']})"
+            speakers_list.append(name)
+        elif isinstance(speaker, str):
+            speakers_list.append(speaker)
+    speakers = "<br>".join(clean_text_for_markdown(s) for s in speakers_list if s)
+
+    # Ensure date/time and location contain valid data
+    date_time = clean_text_for_markdown(session.get('date_time', ''))
+    if not is_valid_time(date_time):
+        date_time = ""
+    location = clean_text_for_markdown(session.get('location', ''))
+
+    # Format files as links with line breaks
+    files_md = []
+    for file in session.get('files') or []:
+        file_name = clean_text_for_markdown(file.get('file_name', ''))
+        file_url = file.get('file_url', '')
+        if file_name and file_url:
+            files_md.append(f"[{file_name}]({file_url})")
+    files = "<br>".join(files_md)
+
+    replay_url = session.get('replay_url', '')
+    replay = f"[Replay]({replay_url})" if replay_url else ""
+
+    # Truncate abstract to a reasonable length to avoid huge cells
+    abstract = clean_text_for_markdown(session.get('abstract', ''))
+    if len(abstract) > 100:
+        abstract = abstract[:100] + "..."
+
+    return f"| {session_code} | {title} | {speakers} | {date_time} | {location} | {files} | {replay} | {abstract} |\n"
+
+
+def _shard_slug(name):
+    return re.sub(r'[^a-z0-9]+', '_', name.lower()).strip('_') or "other"
+
+
+def export_to_markdown(sessions, output_file="gtc_sessions_table.md", shard_by=None,
+                       categories_file=DEFAULT_CATEGORIES_FILE):
+    """Write the session table, optionally sharded by 'prefix' or 'category'.
+
+    Without sharding a single table is written to output_file. With
+    sharding, one table per prefix or category is written next to an index
+    page at output_file that links to each shard.
+    """
+    print("Generating Markdown table...")
+    sessions_list = consolidate_sessions(sessions)
+    print(f"Preparing Markdown for {len(sessions_list)} unique sessions...")
+
+    if not shard_by:
+        with open(output_file, 'w', encoding='utf-8') as f:
+            f.write("# NVIDIA GTC 2025 Sessions\n\n")
+            f.write(TABLE_HEADER)
+            for session in sessions_list:
+                f.write(format_markdown_row(session))
+        print(f"Markdown table generated and saved to {output_file}")
+        return output_file
+
+    if shard_by == 'category':
+        lookup = load_category_lookup(categories_file)
+        shard_key = lambda session: lookup.get(session_code_of(session), "Uncategorized")
+    elif shard_by == 'prefix':
+        shard_key = session_code_prefix
+    else:
+        raise ValueError(f"Unknown shard key: {shard_by!r} (expected 'prefix' or 'category')")
+
+    # Shards are written next to the index page, in a directory named after it
+    shard_dir = os.path.splitext(output_file)[0]
+    os.makedirs(shard_dir, exist_ok=True)
+
+    # Drop shards from a previous run so groups that disappeared don't linger
+    for name in os.listdir(shard_dir):
+        if name.endswith('.md'):
+            os.remove(os.path.join(shard_dir, name))
+
+    handles = {}
+    counts = {}
+    # Names such as "A & B" and "A B" share a slug; number the later ones
+    # so one shard doesn't overwrite another
+    filenames = {}
+    try:
+        for session in sessions_list:
+            name = shard_key(session)
+            if name not in handles:
+                base = _shard_slug(name)
+                slug, number = base, 2
+                while f"{slug}.md" in filenames.values():
+                    slug, number = f"{base}_{number}", number + 1
+                filenames[name] = f"{slug}.md"
+                path = os.path.join(shard_dir, filenames[name])
+                handles[name] = open(path, 'w', encoding='utf-8')
+                handles[name].write(f"# NVIDIA GTC 2025 Sessions: {name}\n\n")
+                handles[name].write(TABLE_HEADER)
+                counts[name] = 0
+            handles[name].write(format_markdown_row(session))
+            counts[name] += 1
+    finally:
+        for handle in handles.values():
+            handle.close()
+
+    # Index page linking to every shard, largest first
+    shard_link_dir = os.path.basename(shard_dir)
+    with open(output_file, 'w', encoding='utf-8') as f:
+        f.write("# NVIDIA GTC 2025 Sessions\n\n")
+        f.write(f"{len(sessions_list)} sessions in {len(counts)} tables, "
+                f"grouped by {'category' if shard_by == 'category' else 'session code prefix'}.\n\n")
+        f.write("| Group | Sessions |\n|-------|----------|\n")
+        for name, count in sorted(counts.items(), key=lambda x: (-x[1], x[0])):
+            f.write(f"| [{clean_text_for_markdown(name)}]({shard_link_dir}/{filenames[name]}) | {count} |\n")
+
+    print(f"Markdown tables for {len(counts)} groups saved to {shard_dir}/ with index {output_file}")
+    return output_file
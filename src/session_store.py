@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Session JSONL Store
+-------------------
+Checkpointed JSON Lines storage for extracted sessions. Every session is
+written as one line as soon as it is extracted, with nested speakers and
+files preserved, so a crashed run can resume after the last completed
+session. Files ending in .gz are gzip-compressed and files ending in .zst
+are zstd-compressed (requires the optional zstandard package).
+"""
+
+import io
+import os
+import gzip
+import json
+import zlib
+
+# Errors raised when reading the truncated tail of a compressed file
+_TRUNCATION_ERRORS = (EOFError, OSError, ValueError, zlib.error, UnicodeDecodeError)
+
+
+def _zstandard():
+    try:
+        import zstandard
+    except ImportError:
+        raise ImportError("Reading or writing .zst files requires the 'zstandard' package "
+                          "(pip install zstandard)")
+    return zstandard
+
+
+def open_jsonl(path, mode='rt'):
+    """Open a JSONL file in text mode, compressed according to its extension."""
+    if path.endswith('.gz'):
+        return gzip.open(path, mode, encoding='utf-8')
+    if path.endswith('.zst'):
+        zstandard = _zstandard()
+        binary_mode = mode.replace('t', '') + 'b'
+        if 'r' in mode:
+            # Appended runs are stored as separate frames
+            reader = zstandard.ZstdDecompressor().stream_reader(
+                open(path, 'rb'), read_across_frames=True, closefd=True
+            )
+            return io.TextIOWrapper(io.BufferedReader(reader), encoding='utf-8')
+        writer = zstandard.ZstdCompressor(level=10).stream_writer(
+            open(path, binary_mode), closefd=True
+        )
+        return io.TextIOWrapper(writer, encoding='utf-8', write_through=True)
+    return open(path, mode, encoding='utf-8')
+
+
+def iter_jsonl_sessions(path):
+    """Yield session records from a JSONL file one at a time.
+
+    Reading stops quietly at a truncated final line, which is what an
+    interrupted run leaves behind.
+    """
+    with open_jsonl(path, 'rt') as f:
+        try:
+            for line in f:
+                if not line.endswith('\n'):
+                    break
+                yield json.loads(line)
+        except _TRUNCATION_ERRORS:
+            return
+
+
+def _recover_plain(path):
+    """Truncate a partial last line and return the number of complete records."""
+    completed = 0
+    good_offset = 0
+    with open(path, 'rb') as f:
+        for line in f:
+            if not line.endswith(b'\n'):
+                break
+            try:
+                json.loads(line)
+            except ValueError:
+                break
+            completed += 1
+            good_offset += len(line)
+    with open(path, 'r+b') as f:
+        f.truncate(good_offset)
+    return completed
+
+
+def _recover_compressed(path):
+    """Rewrite the readable records of a compressed file and return their count."""
+    partial_path = path + '.partial' + os.path.splitext(path)[1]
+    completed = 0
+    with open_jsonl(partial_path, 'wt') as out:
+        for session in iter_jsonl_sessions(path):
+            out.write(json.dumps(session, ensure_ascii=False) + '\n')
+            completed += 1
+    os.replace(partial_path, path)
+    return completed
+
+
+class JsonlSessionWriter:
+    """Streams session records to a JSONL file with periodic checkpoints.
+
+    With resume=True an existing file is kept: any partially written record
+    at the end is dropped and `completed` holds the number of sessions that
+    were already written, so the caller can skip them.
+    """
+
+    def __init__(self, path, resume=False, checkpoint_interval=50):
+        self.path = path
+        self.checkpoint_interval = checkpoint_interval
+        self.completed = 0
+        self._since_checkpoint = 0
+
+        if resume and os.path.exists(path):
+            compressed = path.endswith(('.gz', '.zst'))
+            self.completed = _recover_compressed(path) if compressed else _recover_plain(path)
+            self.handle = open_jsonl(path, 'at')
+        else:
+            self.handle = open_jsonl(path, 'wt')
+
+    def write(self, session):
+        """Append one session record."""
+        self.handle.write(json.dumps(session, ensure_ascii=False) + '\n')
+        self.completed += 1
+        self._since_checkpoint += 1
+        if self._since_checkpoint >= self.checkpoint_interval:
+            self.checkpoint()
+
+    def checkpoint(self):
+        """Flush written records so they survive a crash."""
+        self.handle.flush()
+        self._since_checkpoint = 0
+
+    def close(self):
+        self.handle.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+"""
+Split Rendering
+---------------
+Lay out a long PDF as independent sections in a process pool, then merge
+them. Section workers render pages without any page furniture and report
+where their headings and index terms landed. The main process then builds
+a skeleton document with the same page template: front matter, one empty
+placeholder page per section page and back matter. Its canvas draws the
+global headers, footers and page numbers, and the placeholders re-create
+each section page's bookmarks, outline entries and index entries. Finally
+every section page is laid under its placeholder. As the table of contents
+and index link to the skeleton's own pages, their links survive the merge.
+
+Merging requires the optional pypdf package (5 or later, for incremental
+writing), as does concatenate_pages(), which assembles a document from
+pages rendered separately.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from reportlab.lib.utils import asNative, commasplit
+from reportlab.platypus import Flowable
+from reportlab.platypus.tableofcontents import SimpleIndex, decode_label
+
+
+def _pypdf():
+    try:
+        import pypdf
+    except ImportError:
+        raise ImportError("Merging split-rendered PDFs requires the 'pypdf' package "
+                          "(pip install 'pypdf>=5')")
+    return pypdf
+
+
+def _add_indirect(writer, obj):
+    """Add a new object to writer and return its indirect reference.
+
+    Streams (form XObjects, content streams) must be indirect objects, and
+    pypdf has no public call that adds one: this is the only use of its
+    private PdfWriter._add_object(), checked against pypdf 6.20.1.
+    """
+    return writer._add_object(obj)
+
+
+class RecordingIndex(SimpleIndex):
+    """Index for section workers: records where each term is marked instead of bookmarking it.
+
+    Each mark is (label, terms, page, x, y), with x and y in page coordinates.
+    """
+
+    def __init__(self, **kwargs):
+        SimpleIndex.__init__(self, **kwargs)
+        self.marks = []
+
+    def __call__(self, canv, kind, label):
+        label = asNative(label, 'latin1')
+        # Decoded as in SimpleIndex.__call__; page numbers are always plain numbers here
+        try:
+            terms = decode_label(label)[0]
+        except Exception:
+            terms = label
+        info = canv._curr_tx_info
+        x, y = canv.absolutePosition(info['cur_x'], info['cur_y'] + info['leading'])
+        self.marks.append((label, commasplit(terms), canv.getPageNumber(), x, y))
+
+
+class PlaceholderPage(Flowable):
+    """Fills a skeleton page that one section page will be laid under.
+
+    When drawn it records its page in placements, hands the section page's
+    headings to the document's add_heading() and adds its index marks to
+    index, bookmarked where the terms appear on the section page.
+    """
+
+    def __init__(self, section_file, section_page, placements, headings=(), index_marks=(), index=None):
+        Flowable.__init__(self)
+        self.section_file = section_file
+        self.section_page = section_page
+        self.placements = placements
+        self.headings = headings
+        self.index_marks = index_marks
+        self.index = index
+
+    def wrap(self, availWidth, availHeight):
+        return availWidth, availHeight
+
+    def draw(self):
+        canv = self.canv
+        page = canv.getPageNumber()
+        self.placements[page - 1] = (self.section_file, self.section_page - 1)
+        for text, key in self.headings:
+            canv._doctemplate.add_heading(text, key)
+        for label, terms, x, y in self.index_marks:
+            # The key SimpleIndex itself would give this term on this page
+            key = f"ix_{self.index.name}_{label}_p_{page}"
+            canv.bookmarkPage(key, fit="XYZ", left=x, top=y)
+            self.index.addEntry(terms, (page, str(page)), key)
+
+
+def iter_placeholder_pages(section, placements, index=None):
+    """Yield one PlaceholderPage per page of a rendered section.
+
+    section is a section worker's result: a dict with the section's file,
+    its page count, its headings as (text, key, page) and its index marks
+    as recorded by RecordingIndex.
+    """
+    for page in range(1, section['pages'] + 1):
+        yield PlaceholderPage(
+            section['file'], page, placements,
+            headings=[(text, key) for text, key, on_page in section['headings'] if on_page == page],
+            index_marks=[(label, terms, x, y) for label, terms, on_page, x, y in section['index_marks']
+                         if on_page == page],
+            index=index
+        )
+
+
+def render_sections(render, jobs, workers=None):
+    """Run render(job) for every job across a process pool and return the results in job order."""
+    workers = workers or os.cpu_count() or 1
+    print(f"Rendering {len(jobs)} sections with {workers} workers...")
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(render, jobs))
+
+
+def _page_as_form(writer, page):
+    """Copy a page's content stream into writer as a form XObject with the page's own resources."""
+    from pypdf.generic import ArrayObject, NameObject, StreamObject
+
+    contents = page['/Contents']
+    if isinstance(contents, ArrayObject):
+        form = StreamObject()
+        form.set_data(b"\n".join(stream.get_object().get_data() for stream in contents))
+        form = _add_indirect(writer, form.flate_encode()).get_object()
+    else:
+        # A single stream is reused as is, still compressed
+        form = contents.clone(writer)
+    form[NameObject('/Type')] = NameObject('/XObject')
+    form[NameObject('/Subtype')] = NameObject('/Form')
+    form[NameObject('/BBox')] = page.mediabox.clone(writer)
+    form[NameObject('/Resources')] = page['/Resources'].clone(writer)
+    return form.indirect_reference
+
+
+def _draw_under(writer, page, form, name):
+    """Draw a form XObject under everything else on page."""
+    from pypdf.generic import ArrayObject, DictionaryObject, NameObject, StreamObject
+
+    # Copy the resource dictionaries rather than add to ones the skeleton may share between pages
+    resources = DictionaryObject(page['/Resources'])
+    xobjects = DictionaryObject(resources.get('/XObject', {}))
+    xobjects[NameObject(name)] = form
+    resources[NameObject('/XObject')] = xobjects
+    page[NameObject('/Resources')] = resources
+
+    prefix = StreamObject()
+    prefix.set_data(f"q {name} Do Q\n".encode('ascii'))
+    contents = page.raw_get('/Contents')
+    existing = list(contents.get_object()) if isinstance(contents.get_object(), ArrayObject) else [contents]
+    page[NameObject('/Contents')] = ArrayObject([_add_indirect(writer, prefix)] + existing)
+
+
+def merge_sections(skeleton_file, placements, output_file):
+    """Lay section pages under their placeholders in skeleton_file and write output_file.
+
+    placements maps a skeleton page index to (section_file, section_page_index).
+    Each section page becomes a form XObject drawn beneath its placeholder's
+    furniture, so no content stream is parsed or rewritten. Annotations on
+    section pages are not carried over; the skeleton holds the links.
+    """
+    pypdf = _pypdf()
+    writer = pypdf.PdfWriter(skeleton_file, incremental=True)
+    readers = {}
+    for page_index, (section_file, section_page) in sorted(placements.items()):
+        if section_file not in readers:
+            readers[section_file] = pypdf.PdfReader(section_file)
+        form = _page_as_form(writer, readers[section_file].pages[section_page])
+        _draw_under(writer, writer.pages[page_index], form, "/SectionPage")
+    with open(output_file, 'wb') as f:
+        writer.write(f)
+
+
+def concatenate_pages(parts, output_file):
+    """Write output_file from pages of other PDFs.
+
+    parts is a list of (pdf_file, page_indices), with page_indices None for
+    every page. Pages are copied as they are, and resources such as fonts
+    that several pages of one file share are copied once.
+    """
+    pypdf = _pypdf()
+    writer = pypdf.PdfWriter()
+    readers = {}
+    for pdf_file, page_indices in parts:
+        if pdf_file not in readers:
+            readers[pdf_file] = pypdf.PdfReader(pdf_file)
+        pages = readers[pdf_file].pages
+        for page_index in range(len(pages)) if page_indices is None else page_indices:
+            writer.add_page(pages[page_index])
+    with open(output_file, 'wb') as f:
+        writer.write(f)
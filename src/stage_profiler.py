@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Stage Profiler
+--------------
+Profile individual pipeline stages. Each profiled stage is run under
+cProfile, written as a .pstats file, while a background thread samples the
+stage's call stack and writes it as collapsed stacks ("a;b;c 42" per line)
+that flamegraph.pl, speedscope or inferno can render directly.
+"""
+
+import os
+import re
+import sys
+import pstats
+import cProfile
+import threading
+from collections import Counter
+
+DEFAULT_SAMPLE_INTERVAL = 0.005
+
+
+def _frame_label(frame):
+    code = frame.f_code
+    return f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+
+
+class StackSampler:
+    """Samples one thread's call stack at a fixed interval from a helper thread."""
+
+    def __init__(self, thread_id=None, interval=DEFAULT_SAMPLE_INTERVAL):
+        self.thread_id = thread_id or threading.get_ident()
+        self.interval = interval
+        self.stacks = Counter()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def _sample(self):
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            stack = []
+            while frame is not None:
+                stack.append(_frame_label(frame))
+                frame = frame.f_back
+            if stack:
+                self.stacks[";".join(reversed(stack))] += 1
+
+    def start(self):
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._sample, daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join()
+
+    def write_collapsed(self, path):
+        with open(path, 'w', encoding='utf-8') as f:
+            for stack, count in sorted(self.stacks.items()):
+                f.write(f"{stack} {count}\n")
+
+
+class StageProfiler:
+    """cProfile plus stack sampling for one stage, accumulated across calls."""
+
+    def __init__(self, name, interval=DEFAULT_SAMPLE_INTERVAL):
+        self.name = name
+        self.profile = cProfile.Profile()
+        self.sampler = StackSampler(interval=interval)
+
+    def start(self):
+        self.sampler.thread_id = threading.get_ident()
+        self.sampler.start()
+        self.profile.enable()
+
+    def stop(self):
+        self.profile.disable()
+        self.sampler.stop()
+
+    def save(self, output_dir):
+        """Write <stage>.pstats and <stage>.collapsed and return their paths."""
+        os.makedirs(output_dir, exist_ok=True)
+        slug = re.sub(r'[^A-Za-z0-9_.-]+', '__', self.name)
+        pstats_file = os.path.join(output_dir, f"{slug}.pstats")
+        collapsed_file = os.path.join(output_dir, f"{slug}.collapsed")
+        self.profile.dump_stats(pstats_file)
+        self.sampler.write_collapsed(collapsed_file)
+        return pstats_file, collapsed_file
+
+    def top_functions(self, limit=5):
+        """Return (label, cumulative seconds) for the costliest functions."""
+        stats = pstats.Stats(self.profile)
+        rows = []
+        for (filename, line, function), (_, _, _, cumulative, _) in stats.stats.items():
+            # Skip the profiler's own bookkeeping and the stage wrapper itself
+            if function.startswith("<method 'disable'") or filename.endswith("contextlib.py"):
+                continue
+            rows.append((f"{function} ({os.path.basename(filename)}:{line})", cumulative))
+        rows.sort(key=lambda row: -row[1])
+        return rows[:limit]
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Vector Charts
+-------------
+Native reportlab versions of the analysis bar charts, built straight from
+the analysis JSON so PDFs can draw them as vector graphics instead of
+embedding the matplotlib PNGs.
+"""
+
+from reportlab.lib import colors
+from reportlab.graphics.shapes import Drawing, String
+from reportlab.graphics.charts.barcharts import HorizontalBarChart
+
+# Viridis, as used by the matplotlib charts, sampled at ten points
+VIRIDIS = [colors.HexColor(value) for value in (
+    '#440154', '#482878', '#3E4A89', '#31688E', '#26828E',
+    '#1F9E89', '#35B779', '#6DCD59', '#B4DE2C', '#FDE725'
+)]
+
+LABEL_WIDTH = 150
+FONT_NAME = 'Helvetica'
+TEXT_COLOR = colors.HexColor('#333333')
+GRID_COLOR = colors.HexColor('#DDDDDD')
+
+
+def _palette(count):
+    """Spread `count` colours evenly across the viridis range."""
+    if count <= 1:
+        return VIRIDIS[:1]
+    return [VIRIDIS[round(i * (len(VIRIDIS) - 1) / (count - 1))] for i in range(count)]
+
+
+def horizontal_bar_chart(labels, values, width, height, title=None, value_label=None):
+    """Return a Drawing with one labelled horizontal bar per value.
+
+    The first label is drawn at the bottom, as matplotlib's barh does.
+    """
+    drawing = Drawing(width, height)
+    top_margin = 22 if title else 6
+    bottom_margin = 34 if value_label else 20
+
+    chart = HorizontalBarChart()
+    chart.x = LABEL_WIDTH
+    chart.y = bottom_margin
+    chart.width = width - LABEL_WIDTH - 30
+    chart.height = height - top_margin - bottom_margin
+    chart.data = [list(values)]
+    chart.strokeColor = None
+    chart.barSpacing = 0
+    chart.groupSpacing = 4
+
+    chart.categoryAxis.categoryNames = list(labels)
+    chart.categoryAxis.labels.fontName = FONT_NAME
+    chart.categoryAxis.labels.fontSize = 8
+    chart.categoryAxis.labels.fillColor = TEXT_COLOR
+    chart.categoryAxis.labels.boxAnchor = 'e'
+    chart.categoryAxis.labels.dx = -4
+    chart.categoryAxis.strokeColor = GRID_COLOR
+
+    chart.valueAxis.valueMin = 0
+    chart.valueAxis.valueMax = max(values) * 1.08 if values else 1
+    chart.valueAxis.labels.fontName = FONT_NAME
+    chart.valueAxis.labels.fontSize = 7
+    chart.valueAxis.labels.fillColor = TEXT_COLOR
+    chart.valueAxis.strokeColor = GRID_COLOR
+    chart.valueAxis.visibleGrid = True
+    chart.valueAxis.gridStrokeColor = GRID_COLOR
+    chart.valueAxis.gridStrokeWidth = 0.5
+
+    # Value labels at the end of each bar
+    chart.barLabelFormat = '%d'
+    chart.barLabels.fontName = 'Helvetica-Bold'
+    chart.barLabels.fontSize = 7
+    chart.barLabels.fillColor = TEXT_COLOR
+    chart.barLabels.boxAnchor = 'w'
+    chart.barLabels.dx = 3
+
+    for index, color in enumerate(_palette(len(values))):
+        chart.bars[(0, index)].fillColor = color
+        chart.bars[(0, index)].strokeColor = None
+    drawing.add(chart)
+
+    if title:
+        drawing.add(String(chart.x + chart.width / 2, height - 14, title, fontName='Helvetica-Bold',
+                           fontSize=10, fillColor=TEXT_COLOR, textAnchor='middle'))
+    if value_label:
+        drawing.add(String(chart.x + chart.width / 2, 4, value_label, fontName=FONT_NAME,
+                           fontSize=8, fillColor=TEXT_COLOR, textAnchor='middle'))
+    return drawing
+
+
+CATEGORY_DISTRIBUTION_TITLE = 'GTC 2025 Sessions by Category'
+
+
+def category_distribution_data(trends, insights):
+    """(category, sessions) pairs, largest first.
+
+    Uses every category in category_trends.json, falling back to the top
+    categories in gtc_insights.json when there are no trends.
+    """
+    if trends:
+        counts = [(category, data['session_count']) for category, data in trends.items()]
+    else:
+        counts = [tuple(entry) for entry in insights.get('top_categories', [])]
+    counts.sort(key=lambda entry: entry[1], reverse=True)
+    return counts
+
+
+def keyword_data(trends, category):
+    """(keyword, count) pairs of one category, most frequent first; None if it has no trends."""
+    if category not in trends:
+        return None
+    return [tuple(entry) for entry in trends[category]['top_keywords']]
+
+
+def category_distribution_chart(trends, insights, width, height):
+    """Sessions per category, largest first."""
+    counts = category_distribution_data(trends, insights)
+    return horizontal_bar_chart(
+        [category for category, _ in counts], [count for _, count in counts], width, height,
+        title=CATEGORY_DISTRIBUTION_TITLE, value_label='Number of Sessions'
+    )
+
+
+def keyword_chart(trends, category, width, height):
+    """Top keywords of one category, most frequent first; None if it has no trends."""
+    keywords = keyword_data(trends, category)
+    if keywords is None:
+        return None
+    return horizontal_bar_chart(
+        [keyword for keyword, _ in keywords], [count for _, count in keywords], width, height,
+        title=f'Top 10 Keywords in {category}', value_label='Frequency'
+    )